@@ -697,6 +697,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         """Update the used token."""
         self.access_tokens.append(hex(_RND.getrandbits(256))[2:])
         self.__dict__.pop("entity_picture", None)
+        self._async_invalidate_static_attributes()
 
     async def async_internal_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -5,3 +5,6 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Number of states sent in each message of a streamed history_during_period
+STREAM_CHUNK_SIZE = 2048
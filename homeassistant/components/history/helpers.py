@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime as dt
+import math
+from typing import Any
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant
 
 
@@ -31,3 +34,55 @@ def has_recorder_run_after(hass: HomeAssistant, run_time: dt) -> bool:
     return run_time >= process_timestamp(
         get_instance(hass).recorder_runs_manager.first.start
     )
+
+
+def _numeric_value(state: dict[str, Any]) -> float | None:
+    """Return the value of a compressed state or None if it is not numeric."""
+    try:
+        value = float(state[COMPRESSED_STATE_STATE])
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def downsample_states(
+    states: list[dict[str, Any]], max_points: int
+) -> list[dict[str, Any]]:
+    """Reduce compressed states to about max_points states.
+
+    The time range is split in max_points // 2 buckets and only the
+    states with the minimum and the maximum value of each bucket are
+    kept, so the peaks of the graph are preserved. The first and the last
+    state and the states which are not numeric, such as unavailable,
+    are always kept.
+    """
+    if len(states) <= max_points or (buckets := max_points // 2) < 1:
+        return states
+    first_ts: float = states[0][COMPRESSED_STATE_LAST_UPDATED]
+    duration = states[-1][COMPRESSED_STATE_LAST_UPDATED] - first_ts
+    if duration <= 0:
+        return states
+    keep = {0, len(states) - 1}
+    # Index of the minimum and maximum state of each bucket
+    extremes: dict[int, tuple[int, float, int, float]] = {}
+    for idx, state in enumerate(states):
+        if (value := _numeric_value(state)) is None:
+            keep.add(idx)
+            continue
+        bucket = min(
+            int((state[COMPRESSED_STATE_LAST_UPDATED] - first_ts) / duration * buckets),
+            buckets - 1,
+        )
+        if (extreme := extremes.get(bucket)) is None:
+            extremes[bucket] = (idx, value, idx, value)
+            continue
+        min_idx, min_value, max_idx, max_value = extreme
+        if value < min_value:
+            min_idx, min_value = idx, value
+        elif value > max_value:
+            max_idx, max_value = idx, value
+        extremes[bucket] = (min_idx, min_value, max_idx, max_value)
+    for min_idx, _, max_idx, _ in extremes.values():
+        keep.add(min_idx)
+        keep.add(max_idx)
+    return [states[idx] for idx in sorted(keep)]
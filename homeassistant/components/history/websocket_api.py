@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import cursor_to_token, token_to_cursor
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
@@ -38,8 +39,12 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
-from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
+from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES, STREAM_CHUNK_SIZE
+from .helpers import (
+    downsample_states,
+    entities_may_have_state_changes_after,
+    has_recorder_run_after,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -72,27 +77,174 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None = None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
+    states = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+    if not max_points:
+        return json_bytes(messages.result_message(msg_id, states))
     return json_bytes(
         messages.result_message(
             msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
+            {
+                entity_id: downsample_states(
+                    cast(list[dict[str, Any]], entity_states), max_points
+                )
+                for entity_id, entity_states in states.items()
+            },
+        )
+    )
+
+
+def _ws_get_significant_states_page(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    limit: int,
+    cursor: tuple[int, float, int] | None,
+) -> bytes:
+    """Fetch a page of history significant_states and convert it to json."""
+    states, next_cursor = history.get_significant_states_page(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        limit,
+        cursor,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+    return json_bytes(
+        messages.result_message(
+            msg_id,
+            {
+                "states": states,
+                "cursor": cursor_to_token(list(next_cursor)) if next_cursor else None,
+            },
         )
     )
 
 
+def _history_cursor_from_token(token: str) -> tuple[int, float, int] | None:
+    """Return the (metadata_id, last_updated_ts, state_id) cursor of a token."""
+    if not (cursor := token_to_cursor(token)) or len(cursor) != 3:
+        return None
+    metadata_id, last_updated_ts, state_id = cursor
+    if (
+        not isinstance(metadata_id, int)
+        or not isinstance(last_updated_ts, (int, float))
+        or not isinstance(state_id, int)
+    ):
+        return None
+    return metadata_id, float(last_updated_ts), state_id
+
+
+def _ws_stream_significant_states(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> bool:
+    """Fetch history significant_states and send them in chunks from the executor.
+
+    Each chunk is converted to json and the next chunk is only fetched
+    once it was written to the client, so a single chunk of states is held
+    in memory and waiting in the connection queue at a time. Return False
+    if the stream was closed before all the chunks were sent.
+    """
+    for entity_id, states in history.stream_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+        STREAM_CHUNK_SIZE,
+    ):
+        message = json_bytes(
+            messages.event_message(msg_id, {"states": {entity_id: states}})
+        )
+        if not asyncio.run_coroutine_threadsafe(
+            _async_send_history_stream_chunk(connection, msg_id, message), hass.loop
+        ).result():
+            return False
+    return True
+
+
+async def _async_send_history_stream_chunk(
+    connection: ActiveConnection, msg_id: int, message: bytes
+) -> bool:
+    """Send a chunk of a history stream and wait until it is written.
+
+    Return False if the stream was closed by the client or the
+    connection was closed.
+    """
+    if msg_id not in connection.subscriptions:
+        return False
+    connection.send_message(message)
+    await connection.async_wait_drained()
+    return msg_id in connection.subscriptions
+
+
+@callback
+def _async_send_history_stream_end(
+    connection: ActiveConnection, msg_id: int, error: dict[str, str] | None = None
+) -> None:
+    """Send the message marking the end of a history chunks stream.
+
+    The result was already sent when the stream started, so a failed
+    stream is ended with the error in the last event message.
+    """
+    event: dict[str, Any] = {"states": {}, "complete": True}
+    if error:
+        event["error"] = error
+    connection.send_message(json_bytes(messages.event_message(msg_id, event)))
+
+
+@callback
+def _async_send_empty_history(
+    connection: ActiveConnection, msg_id: int, stream: bool, limit: int | None
+) -> None:
+    """Send the response when no states were recorded in the period."""
+    if limit:
+        connection.send_result(msg_id, {"states": {}, "cursor": None})
+        return
+    if not stream:
+        connection.send_result(msg_id, {})
+        return
+    connection.send_result(msg_id)
+    _async_send_history_stream_end(connection, msg_id)
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,13 +255,28 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("stream", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=2)),
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
+        vol.Optional("cursor"): str,
     }
 )
 @websocket_api.async_response
 async def ws_get_history_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle history during period websocket command."""
+    """Handle history during period websocket command.
+
+    When stream is set the result is sent first, the states then follow
+    in event messages of one chunk of states of an entity each, the last
+    event message is marked as complete.
+
+    When max_points is set the states of each entity are downsampled to
+    about max_points states.
+
+    When limit is set at most limit states are returned with the cursor
+    of the next page, which is passed back as cursor to get that page.
+    """
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
 
@@ -128,8 +295,35 @@ async def ws_get_history_during_period(
     else:
         end_time = None
 
+    stream = msg["stream"]
+    max_points: int | None = msg.get("max_points")
+    if stream and max_points:
+        connection.send_error(
+            msg["id"], "invalid_format", "max_points can not be used with stream"
+        )
+        return
+
+    limit: int | None = msg.get("limit")
+    if limit and (stream or max_points):
+        connection.send_error(
+            msg["id"],
+            "invalid_format",
+            "limit can not be used with stream or max_points",
+        )
+        return
+    cursor: tuple[int, float, int] | None = None
+    if cursor_token := msg.get("cursor"):
+        if not limit:
+            connection.send_error(
+                msg["id"], "invalid_format", "cursor can only be used with limit"
+            )
+            return
+        if not (cursor := _history_cursor_from_token(cursor_token)):
+            connection.send_error(msg["id"], "invalid_cursor", "Invalid cursor")
+            return
+
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg["id"], stream, limit)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -149,14 +343,67 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg["id"], stream, limit)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if stream:
+        msg_id = msg["id"]
+        # The stream stops when the client unsubscribes or the
+        # connection is closed
+        connection.subscriptions[msg_id] = callback(lambda: None)
+        connection.send_result(msg_id)
+        error: dict[str, str] | None = None
+        try:
+            completed = await get_instance(hass).async_add_read_only_executor_job(
+                _ws_stream_significant_states,
+                hass,
+                connection,
+                msg_id,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            )
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Error streaming the history of %s", entity_ids)
+            completed = True
+            error = {
+                "code": websocket_api.ERR_UNKNOWN_ERROR,
+                "message": "Unknown error",
+            }
+        finally:
+            subscribed = connection.subscriptions.pop(msg_id, None) is not None
+        if subscribed and completed:
+            _async_send_history_stream_end(connection, msg_id, error)
+        return
+
+    if limit:
+        connection.send_message(
+            await get_instance(hass).async_add_read_only_executor_job(
+                _ws_get_significant_states_page,
+                hass,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                limit,
+                cursor,
+            )
+        )
+        return
+
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_only_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -167,6 +414,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            max_points,
         )
     )
 
@@ -279,7 +527,11 @@ async def _async_send_historical_states(
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    (
+        last_time_ts,
+        last_time_dt,
+        payload,
+    ) = await instance.async_add_read_only_executor_job(
         _generate_historical_response,
         hass,
         msg_id,
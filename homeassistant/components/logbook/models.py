@@ -16,6 +16,7 @@ from homeassistant.components.recorder.models import (
     ulid_to_bytes_or_none,
     uuid_hex_to_bytes_or_none,
 )
+from homeassistant.components.recorder.util import cursor_to_token, token_to_cursor
 from homeassistant.const import ATTR_ICON, EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, State, callback
 from homeassistant.util.event_type import EventType
@@ -35,6 +36,34 @@ class LogbookConfig:
     entity_filter: Callable[[str], bool] | None = None
 
 
+@dataclass(slots=True, frozen=True)
+class LogbookCursor:
+    """The position after a page of logbook events.
+
+    The rows are ordered by time_fired_ts, the event rows before the
+    state rows, and row_id, the cursor is the last row of the page.
+    """
+
+    time_fired_ts: float
+    is_state: bool
+    row_id: int
+
+    def as_token(self) -> str:
+        """Return the cursor as an opaque token."""
+        return cursor_to_token([self.time_fired_ts, self.is_state, self.row_id])
+
+    @classmethod
+    def from_token(cls, token: str) -> LogbookCursor | None:
+        """Return the cursor of a token, or None if the token is not valid."""
+        if (cursor := token_to_cursor(token)) is None:
+            return None
+        try:
+            time_fired_ts, is_state, row_id = cursor
+            return cls(float(time_fired_ts), bool(is_state), int(row_id))
+        except (TypeError, ValueError):
+            return None
+
+
 class LazyEventPartialState:
     """A lazy version of core Event with limited State joined in."""
 
@@ -7,10 +7,12 @@ from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
 import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -36,6 +38,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util.collection import chunked_or_all
 import homeassistant.util.dt as dt_util
 from homeassistant.util.event_type import EventType
 
@@ -77,9 +80,10 @@ from .models import (
     EventAsRow,
     LazyEventPartialState,
     LogbookConfig,
+    LogbookCursor,
     async_event_to_row,
 )
-from .queries import statement_for_request
+from .queries import context_rows_statement, page_statement, statement_for_request
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
@@ -157,32 +161,120 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
+            return self.humanify(self._get_rows(session, start_day, end_day))
+
+    def get_events_page(
+        self,
+        start_day: dt,
+        end_day: dt,
+        limit: int,
+        cursor: LogbookCursor | None = None,
+    ) -> tuple[list[dict[str, Any]], LogbookCursor | None]:
+        """Get at most limit events for a period of time, after the cursor.
+
+        The cursor of the next page is returned with the events, or None
+        if there are no more events in the period. The rows are limited
+        in the database, rows which are not logbook events are counted
+        in the limit so a page may have less than limit events.
+        """
+        page_cursor: tuple[float, bool, int] | None = None
+        if cursor is not None:
+            page_cursor = (cursor.time_fired_ts, cursor.is_state, cursor.row_id)
+        with session_scope(hass=self.hass, read_only=True) as session:
+            stmt = self._get_stmt(session, start_day, end_day)
+            rows = cast(
+                Sequence[Row],
+                execute_stmt_lambda_element(
+                    session,
+                    page_statement(
+                        stmt,
+                        # One more row is fetched to know if there is a next page
+                        limit + 1,
+                        page_cursor,
+                    ),
+                    orm_rows=False,
+                ),
+            )
+            next_cursor: LogbookCursor | None = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                last_row = rows[-1]
+                next_cursor = LogbookCursor(
+                    last_row[TIME_FIRED_TS_POS],
+                    last_row[EVENT_TYPE_POS] is PSEUDO_EVENT_STATE_CHANGED,
+                    last_row[ROW_ID_POS],
                 )
+            if rows:
+                self._add_context_rows(session, stmt, rows)
+            return self.humanify(rows), next_cursor
+
+    def _add_context_rows(
+        self, session: Session, stmt: StatementLambdaElement, rows: Sequence[Row]
+    ) -> None:
+        """Add the first rows of the contexts of the page rows to the lookup.
+
+        The first row of a context can be in an earlier page or be a row
+        only linking contexts, which are not selected with the page rows.
+        """
+        context_lookup = self.logbook_run.context_lookup
+        context_ids_bin = {
+            context_id_bin
+            for row in rows
+            for context_id_bin in (
+                row[CONTEXT_ID_BIN_POS],
+                row[CONTEXT_PARENT_ID_BIN_POS],
             )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
+            if context_id_bin not in context_lookup
+        }
+        end_time_fired_ts: float = rows[-1][TIME_FIRED_TS_POS]
+        for context_ids_bin_chunk in chunked_or_all(
+            context_ids_bin, get_instance(self.hass).max_bind_vars
+        ):
+            for row in execute_stmt_lambda_element(
+                session,
+                context_rows_statement(
+                    stmt, list(context_ids_bin_chunk), end_time_fired_ts
+                ),
+                orm_rows=False,
+            ):
+                if (context_id_bin := row[CONTEXT_ID_BIN_POS]) not in context_lookup:
+                    context_lookup[context_id_bin] = row
+
+    def _get_stmt(
+        self, session: Session, start_day: dt, end_day: dt
+    ) -> StatementLambdaElement:
+        """Generate the logbook statement for a period of time."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
             )
+        )
+        return statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+            (index_start_ts := instance.logbook_index_start_ts) is not None
+            and start_day.timestamp() >= index_start_ts,
+        )
+
+    def _get_rows(
+        self, session: Session, start_day: dt, end_day: dt
+    ) -> Sequence[Row] | Result:
+        """Execute the logbook query for a period of time."""
+        return execute_stmt_lambda_element(
+            session, self._get_stmt(session, start_day, end_day), orm_rows=False
+        )
 
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
@@ -12,9 +12,13 @@ from homeassistant.components.recorder.models import ulid_to_bytes_or_none
 from homeassistant.helpers.json import json_dumps
 
 from .all import all_stmt
-from .devices import devices_stmt
-from .entities import entities_stmt
-from .entities_and_devices import entities_devices_stmt
+from .common import select_context_rows, select_page_rows, select_page_rows_after
+from .devices import devices_logbook_index_stmt, devices_stmt
+from .entities import entities_logbook_index_stmt, entities_stmt
+from .entities_and_devices import (
+    entities_devices_logbook_index_stmt,
+    entities_devices_stmt,
+)
 
 
 def statement_for_request(
@@ -26,8 +30,14 @@ def statement_for_request(
     device_ids: list[str] | None = None,
     filters: Filters | None = None,
     context_id: str | None = None,
+    logbook_index: bool = False,
 ) -> StatementLambdaElement:
-    """Generate the logbook statement for a logbook request."""
+    """Generate the logbook statement for a logbook request.
+
+    When logbook_index is set the recorder logbook index has all the
+    events of the period, and the events of the entities and devices
+    are found in it instead of in the event data.
+    """
     start_day = start_day_dt.timestamp()
     end_day = end_day_dt.timestamp()
     # No entities: logbook sends everything for the timeframe
@@ -42,6 +52,17 @@ def statement_for_request(
             context_id_bin,
         )
 
+    # entities or devices: the events are found in the logbook index
+    if logbook_index:
+        return _logbook_index_statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            entity_ids,
+            states_metadata_ids,
+            device_ids,
+        )
+
     # sqlalchemy caches object quoting, the
     # json quotable ones must be a different
     # object from the non-json ones to prevent
@@ -76,3 +97,72 @@ def statement_for_request(
         event_type_ids,
         [json_dumps(device_id) for device_id in device_ids],
     )
+
+
+def page_statement(
+    stmt: StatementLambdaElement,
+    limit: int,
+    cursor: tuple[float, bool, int] | None = None,
+) -> StatementLambdaElement:
+    """Limit a logbook statement to limit rows after the cursor.
+
+    The cursor is the (time_fired_ts, is_state, row_id) of the last row
+    of the previous page. The rows only linking contexts are left out,
+    the rows of the contexts of a page are selected with
+    context_rows_statement.
+    """
+    if cursor is None:
+        stmt += lambda s: select_page_rows(s.order_by(None).subquery()).limit(limit)
+        return stmt
+    time_fired_ts, is_state, row_id = cursor
+    kind = int(is_state)
+    stmt += lambda s: select_page_rows_after(
+        s.order_by(None).subquery(), time_fired_ts, kind, row_id
+    ).limit(limit)
+    return stmt
+
+
+def context_rows_statement(
+    stmt: StatementLambdaElement,
+    context_ids_bin: list[bytes],
+    end_time_fired_ts: float,
+) -> StatementLambdaElement:
+    """Select the rows of a logbook statement of the contexts.
+
+    Only the rows fired until end_time_fired_ts are selected, the rows
+    only linking contexts are included.
+    """
+    stmt += lambda s: select_context_rows(
+        s.order_by(None).subquery(), context_ids_bin, end_time_fired_ts
+    )
+    return stmt
+
+
+def _logbook_index_statement_for_request(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    entity_ids: list[str] | None,
+    states_metadata_ids: Collection[int] | None,
+    device_ids: list[str] | None,
+) -> StatementLambdaElement:
+    """Generate the logbook statement for entities or devices using the logbook index."""
+    if entity_ids and device_ids:
+        return entities_devices_logbook_index_stmt(
+            start_day,
+            end_day,
+            event_type_ids,
+            states_metadata_ids or [],
+            entity_ids,
+            device_ids,
+        )
+    if entity_ids:
+        return entities_logbook_index_stmt(
+            start_day,
+            end_day,
+            event_type_ids,
+            states_metadata_ids or [],
+            entity_ids,
+        )
+    assert device_ids is not None
+    return devices_logbook_index_stmt(start_day, end_day, event_type_ids, device_ids)
@@ -8,7 +8,7 @@ import sqlalchemy
 from sqlalchemy import select
 from sqlalchemy.sql.elements import BooleanClauseList, ColumnElement
 from sqlalchemy.sql.expression import literal
-from sqlalchemy.sql.selectable import Select
+from sqlalchemy.sql.selectable import Select, Subquery
 
 from homeassistant.components.recorder.db_schema import (
     EVENTS_CONTEXT_ID_BIN_INDEX,
@@ -20,6 +20,7 @@ from homeassistant.components.recorder.db_schema import (
     EventData,
     Events,
     EventTypes,
+    LogbookIndex,
     StateAttributes,
     States,
     StatesMeta,
@@ -122,6 +123,24 @@ def select_events_context_id_subquery(
     )
 
 
+def select_logbook_index_context_id_subquery(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+) -> Select:
+    """Generate the select for a context_id subquery using the logbook index."""
+    return (
+        select(Events.context_id_bin)
+        .select_from(LogbookIndex)
+        .join(Events, (LogbookIndex.event_id == Events.event_id))
+        .where(
+            (LogbookIndex.time_fired_ts > start_day)
+            & (LogbookIndex.time_fired_ts < end_day)
+        )
+        .where(Events.event_type_id.in_(event_type_ids))
+    )
+
+
 def select_events_context_only() -> Select:
     """Generate an events query that mark them as for context_only.
 
@@ -155,6 +174,29 @@ def select_events_without_states(
     )
 
 
+def select_events_from_logbook_index(
+    start_day: float, end_day: float, event_type_ids: tuple[int, ...]
+) -> Select:
+    """Generate an events select that finds the events in the logbook index.
+
+    The events matching the entities or devices are found with a range
+    scan of the logbook index instead of matching the event data of
+    every event in the time range.
+    """
+    return (
+        select(*EVENT_ROWS_NO_STATES, NOT_CONTEXT_ONLY)
+        .select_from(LogbookIndex)
+        .join(Events, (LogbookIndex.event_id == Events.event_id))
+        .where(
+            (LogbookIndex.time_fired_ts > start_day)
+            & (LogbookIndex.time_fired_ts < end_day)
+        )
+        .where(Events.event_type_id.in_(event_type_ids))
+        .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+        .outerjoin(EventData, (Events.data_id == EventData.data_id))
+    )
+
+
 def select_states() -> Select:
     """Generate a states select that formats the states table as event rows."""
     return select(
@@ -252,6 +294,54 @@ def _not_uom_attributes_matcher() -> BooleanClauseList:
     ) | ~States.attributes.like(UNIT_OF_MEASUREMENT_JSON_LIKE)
 
 
+def _page_row_kind(rows: Subquery) -> ColumnElement[int]:
+    """Return 0 for the event rows and 1 for the rows made from states."""
+    return sqlalchemy.case(
+        (rows.c.event_type.is_(PSEUDO_EVENT_STATE_CHANGED), 1), else_=0
+    )
+
+
+def _select_in_page_order(rows: Subquery) -> Select:
+    """Select the rows of a logbook query in page order.
+
+    The rows are ordered by time_fired_ts, the event rows before the
+    state rows, and row_id, so every row has its own place in the order
+    and the rows fired at the same time can be split between pages.
+    """
+    return select(rows).order_by(
+        rows.c.time_fired_ts, _page_row_kind(rows), rows.c.row_id
+    )
+
+
+def select_page_rows(rows: Subquery) -> Select:
+    """Select the rows of a page, without the rows only linking contexts."""
+    return _select_in_page_order(rows).where(rows.c.context_only.is_(None))
+
+
+def select_page_rows_after(
+    rows: Subquery, time_fired_ts: float, kind: int, row_id: int
+) -> Select:
+    """Select the rows of a page after the (time_fired_ts, kind, row_id) cursor."""
+    row_kind = _page_row_kind(rows)
+    return select_page_rows(rows).where(
+        (rows.c.time_fired_ts > time_fired_ts)
+        | (
+            (rows.c.time_fired_ts == time_fired_ts)
+            & ((row_kind > kind) | ((row_kind == kind) & (rows.c.row_id > row_id)))
+        )
+    )
+
+
+def select_context_rows(
+    rows: Subquery, context_ids_bin: list[bytes], end_time_fired_ts: float
+) -> Select:
+    """Select the rows of the contexts fired until end_time_fired_ts."""
+    return _select_in_page_order(rows).where(
+        rows.c.context_id_bin.in_(context_ids_bin)
+        & (rows.c.time_fired_ts <= end_time_fired_ts)
+    )
+
+
 def apply_states_context_hints(sel: Select) -> Select:
     """Force mysql to use the right index on large context_id selects."""
     return sel.with_hint(
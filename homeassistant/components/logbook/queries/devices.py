@@ -15,6 +15,7 @@ from homeassistant.components.recorder.db_schema import (
     EventData,
     Events,
     EventTypes,
+    LogbookIndex,
     States,
     StatesMeta,
 )
@@ -24,39 +25,25 @@ from .common import (
     apply_states_context_hints,
     select_events_context_id_subquery,
     select_events_context_only,
+    select_events_from_logbook_index,
     select_events_without_states,
+    select_logbook_index_context_id_subquery,
     select_states_context_only,
 )
 
 
-def _select_device_id_context_ids_sub_query(
-    start_day: float,
-    end_day: float,
-    event_type_ids: tuple[int, ...],
-    json_quotable_device_ids: list[str],
-) -> Select:
+def _select_device_id_context_ids_sub_query(events_context_ids: Select) -> Select:
     """Generate a subquery to find context ids for multiple devices."""
-    inner = (
-        select_events_context_id_subquery(start_day, end_day, event_type_ids)
-        .where(apply_event_device_id_matchers(json_quotable_device_ids))
-        .subquery()
-    )
+    inner = events_context_ids.subquery()
     return select(inner.c.context_id_bin).group_by(inner.c.context_id_bin)
 
 
 def _apply_devices_context_union(
-    sel: Select,
-    start_day: float,
-    end_day: float,
-    event_type_ids: tuple[int, ...],
-    json_quotable_device_ids: list[str],
+    sel: Select, events_context_ids: Select
 ) -> CompoundSelect:
     """Generate a CTE to find the device context ids and a query to find linked row."""
     devices_cte: CTE = _select_device_id_context_ids_sub_query(
-        start_day,
-        end_day,
-        event_type_ids,
-        json_quotable_device_ids,
+        events_context_ids
     ).cte()
     return sel.union_all(
         apply_events_context_hints(
@@ -87,10 +74,28 @@ def devices_stmt(
             select_events_without_states(start_day, end_day, event_type_ids).where(
                 apply_event_device_id_matchers(json_quotable_device_ids)
             ),
-            start_day,
-            end_day,
-            event_type_ids,
-            json_quotable_device_ids,
+            select_events_context_id_subquery(start_day, end_day, event_type_ids).where(
+                apply_event_device_id_matchers(json_quotable_device_ids)
+            ),
+        ).order_by(Events.time_fired_ts)
+    )
+
+
+def devices_logbook_index_stmt(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    device_ids: list[str],
+) -> StatementLambdaElement:
+    """Generate a logbook query for multiple devices using the logbook index."""
+    return lambda_stmt(
+        lambda: _apply_devices_context_union(
+            select_events_from_logbook_index(start_day, end_day, event_type_ids).where(
+                LogbookIndex.device_id.in_(device_ids)
+            ),
+            select_logbook_index_context_id_subquery(
+                start_day, end_day, event_type_ids
+            ).where(LogbookIndex.device_id.in_(device_ids)),
         ).order_by(Events.time_fired_ts)
     )
 
@@ -17,6 +17,7 @@ from homeassistant.components.recorder.db_schema import (
     EventData,
     Events,
     EventTypes,
+    LogbookIndex,
     States,
     StatesMeta,
 )
@@ -27,7 +28,9 @@ from .common import (
     apply_states_filters,
     select_events_context_id_subquery,
     select_events_context_only,
+    select_events_from_logbook_index,
     select_events_without_states,
+    select_logbook_index_context_id_subquery,
     select_states,
     select_states_context_only,
 )
@@ -36,15 +39,12 @@ from .common import (
 def _select_entities_context_ids_sub_query(
     start_day: float,
     end_day: float,
-    event_type_ids: tuple[int, ...],
+    events_context_ids: Select,
     states_metadata_ids: Collection[int],
-    json_quoted_entity_ids: list[str],
 ) -> Select:
     """Generate a subquery to find context ids for multiple entities."""
     union = union_all(
-        select_events_context_id_subquery(start_day, end_day, event_type_ids).where(
-            apply_event_entity_id_matchers(json_quoted_entity_ids)
-        ),
+        events_context_ids,
         apply_entities_hints(select(States.context_id_bin))
         .filter(
             (States.last_updated_ts > start_day) & (States.last_updated_ts < end_day)
@@ -56,19 +56,17 @@ def _select_entities_context_ids_sub_query(
 
 def _apply_entities_context_union(
     sel: Select,
+    events_context_ids: Select,
     start_day: float,
     end_day: float,
-    event_type_ids: tuple[int, ...],
     states_metadata_ids: Collection[int],
-    json_quoted_entity_ids: list[str],
 ) -> CompoundSelect:
     """Generate a CTE to find the entity and device context ids and a query to find linked row."""
     entities_cte: CTE = _select_entities_context_ids_sub_query(
         start_day,
         end_day,
-        event_type_ids,
+        events_context_ids,
         states_metadata_ids,
-        json_quoted_entity_ids,
     ).cte()
     # We used to optimize this to exclude rows we already in the union with
     # a StatesMeta.metadata_ids.not_in(states_metadata_ids) but that made the
@@ -106,11 +104,35 @@ def entities_stmt(
             select_events_without_states(start_day, end_day, event_type_ids).where(
                 apply_event_entity_id_matchers(json_quoted_entity_ids)
             ),
+            select_events_context_id_subquery(start_day, end_day, event_type_ids).where(
+                apply_event_entity_id_matchers(json_quoted_entity_ids)
+            ),
+            start_day,
+            end_day,
+            states_metadata_ids,
+        ).order_by(Events.time_fired_ts)
+    )
+
+
+def entities_logbook_index_stmt(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    states_metadata_ids: Collection[int],
+    entity_ids: list[str],
+) -> StatementLambdaElement:
+    """Generate a logbook query for multiple entities using the logbook index."""
+    return lambda_stmt(
+        lambda: _apply_entities_context_union(
+            select_events_from_logbook_index(start_day, end_day, event_type_ids).where(
+                apply_logbook_index_entity_id_matchers(entity_ids)
+            ),
+            select_logbook_index_context_id_subquery(
+                start_day, end_day, event_type_ids
+            ).where(apply_logbook_index_entity_id_matchers(entity_ids)),
             start_day,
             end_day,
-            event_type_ids,
             states_metadata_ids,
-            json_quoted_entity_ids,
         ).order_by(Events.time_fired_ts)
     )
 
@@ -140,6 +162,15 @@ def apply_event_entity_id_matchers(
     )
 
 
+def apply_logbook_index_entity_id_matchers(
+    entity_ids: Iterable[str],
+) -> ColumnElement[bool]:
+    """Create matchers for the entity_id in the logbook index."""
+    return LogbookIndex.entity_id.in_(entity_ids) | LogbookIndex.old_entity_id.in_(
+        entity_ids
+    )
+
+
 def apply_entities_hints(sel: Select) -> Select:
     """Force mysql to use the right index on large selects."""
     return sel.with_hint(
@@ -13,6 +13,7 @@ from homeassistant.components.recorder.db_schema import (
     EventData,
     Events,
     EventTypes,
+    LogbookIndex,
     States,
     StatesMeta,
 )
@@ -22,13 +23,16 @@ from .common import (
     apply_states_context_hints,
     select_events_context_id_subquery,
     select_events_context_only,
+    select_events_from_logbook_index,
     select_events_without_states,
+    select_logbook_index_context_id_subquery,
     select_states_context_only,
 )
 from .devices import apply_event_device_id_matchers
 from .entities import (
     apply_entities_hints,
     apply_event_entity_id_matchers,
+    apply_logbook_index_entity_id_matchers,
     states_select_for_entity_ids,
 )
 
@@ -36,18 +40,12 @@ from .entities import (
 def _select_entities_device_id_context_ids_sub_query(
     start_day: float,
     end_day: float,
-    event_type_ids: tuple[int, ...],
+    events_context_ids: Select,
     states_metadata_ids: Collection[int],
-    json_quoted_entity_ids: list[str],
-    json_quoted_device_ids: list[str],
 ) -> Select:
     """Generate a subquery to find context ids for multiple entities and multiple devices."""
     union = union_all(
-        select_events_context_id_subquery(start_day, end_day, event_type_ids).where(
-            _apply_event_entity_id_device_id_matchers(
-                json_quoted_entity_ids, json_quoted_device_ids
-            )
-        ),
+        events_context_ids,
         apply_entities_hints(select(States.context_id_bin))
         .filter(
             (States.last_updated_ts > start_day) & (States.last_updated_ts < end_day)
@@ -59,20 +57,16 @@ def _select_entities_device_id_context_ids_sub_query(
 
 def _apply_entities_devices_context_union(
     sel: Select,
+    events_context_ids: Select,
     start_day: float,
     end_day: float,
-    event_type_ids: tuple[int, ...],
     states_metadata_ids: Collection[int],
-    json_quoted_entity_ids: list[str],
-    json_quoted_device_ids: list[str],
 ) -> CompoundSelect:
     devices_entities_cte: CTE = _select_entities_device_id_context_ids_sub_query(
         start_day,
         end_day,
-        event_type_ids,
+        events_context_ids,
         states_metadata_ids,
-        json_quoted_entity_ids,
-        json_quoted_device_ids,
     ).cte()
     # We used to optimize this to exclude rows we already in the union with
     # a States.metadata_id.not_in(states_metadata_ids) but that made the
@@ -117,12 +111,44 @@ def entities_devices_stmt(
                     json_quoted_entity_ids, json_quoted_device_ids
                 )
             ),
+            select_events_context_id_subquery(start_day, end_day, event_type_ids).where(
+                _apply_event_entity_id_device_id_matchers(
+                    json_quoted_entity_ids, json_quoted_device_ids
+                )
+            ),
+            start_day,
+            end_day,
+            states_metadata_ids,
+        ).order_by(Events.time_fired_ts)
+    )
+
+
+def entities_devices_logbook_index_stmt(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    states_metadata_ids: Collection[int],
+    entity_ids: list[str],
+    device_ids: list[str],
+) -> StatementLambdaElement:
+    """Generate a logbook query for multiple entities and devices using the logbook index."""
+    return lambda_stmt(
+        lambda: _apply_entities_devices_context_union(
+            select_events_from_logbook_index(start_day, end_day, event_type_ids).where(
+                _apply_logbook_index_entity_id_device_id_matchers(
+                    entity_ids, device_ids
+                )
+            ),
+            select_logbook_index_context_id_subquery(
+                start_day, end_day, event_type_ids
+            ).where(
+                _apply_logbook_index_entity_id_device_id_matchers(
+                    entity_ids, device_ids
+                )
+            ),
             start_day,
             end_day,
-            event_type_ids,
             states_metadata_ids,
-            json_quoted_entity_ids,
-            json_quoted_device_ids,
         ).order_by(Events.time_fired_ts)
     )
 
@@ -134,3 +160,12 @@ def _apply_event_entity_id_device_id_matchers(
     return apply_event_entity_id_matchers(
         json_quoted_entity_ids
     ) | apply_event_device_id_matchers(json_quoted_device_ids)
+
+
+def _apply_logbook_index_entity_id_device_id_matchers(
+    entity_ids: Iterable[str], device_ids: Iterable[str]
+) -> ColumnElement[bool]:
+    """Create matchers for the device_id and entity_id in the logbook index."""
+    return apply_logbook_index_entity_id_matchers(
+        entity_ids
+    ) | LogbookIndex.device_id.in_(device_ids)
@@ -111,4 +111,4 @@ class LogbookView(HomeAssistantView):
             """Fetch events and generate JSON."""
             return self.json(event_processor.get_events(start_day, end_day))
 
-        return await get_instance(hass).async_add_executor_job(json_events)
+        return await get_instance(hass).async_add_read_only_executor_job(json_events)
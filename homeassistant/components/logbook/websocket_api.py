@@ -26,7 +26,7 @@ from .helpers import (
     async_filter_entities,
     async_subscribe_events,
 )
-from .models import LogbookConfig, async_event_to_row
+from .models import LogbookConfig, LogbookCursor, async_event_to_row
 from .processor import EventProcessor
 
 MAX_PENDING_LOGBOOK_EVENTS = 2048
@@ -74,6 +74,17 @@ def _async_send_empty_response(
     connection.send_message(json_bytes(empty_response))
 
 
+@callback
+def _async_send_empty_events(
+    connection: ActiveConnection, msg_id: int, limit: int | None
+) -> None:
+    """Send the get events response when there are no events."""
+    if not limit:
+        connection.send_result(msg_id, [])
+        return
+    connection.send_result(msg_id, {"events": [], "cursor": None})
+
+
 async def _async_send_historical_events(
     hass: HomeAssistant,
     connection: ActiveConnection,
@@ -83,6 +94,7 @@ async def _async_send_historical_events(
     event_processor: EventProcessor,
     partial: bool,
     force_send: bool = False,
+    limit: int | None = None,
 ) -> dt | None:
     """Select historical data from the database and deliver it to the websocket.
 
@@ -92,9 +104,25 @@ async def _async_send_historical_events(
     they are not stuck at a loading screen and can start looking at
     the data right away.
 
+    When a limit is given the events are instead delivered in pages of
+    at most limit events, oldest first.
+
     This function returns the time of the most recent event we sent to the
     websocket.
     """
+    if limit:
+        return await _async_send_historical_pages(
+            hass,
+            connection,
+            msg_id,
+            start_time,
+            end_time,
+            event_processor,
+            partial,
+            force_send,
+            limit,
+        )
+
     is_big_query = (
         not event_processor.entity_ids
         and not event_processor.device_ids
@@ -154,6 +182,48 @@ async def _async_send_historical_events(
     return recent_query_last_event_time or older_query_last_event_time
 
 
+async def _async_send_historical_pages(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    event_processor: EventProcessor,
+    partial: bool,
+    force_send: bool,
+    limit: int,
+) -> dt | None:
+    """Deliver the historical data to the websocket in pages of limit events.
+
+    Every page but the last is marked as partial. This function returns
+    the time of the most recent event we sent to the websocket.
+    """
+    instance = get_instance(hass)
+    cursor: LogbookCursor | None = None
+    last_event_time: dt | None = None
+    while True:
+        message, page_last_event_time, cursor = (
+            await instance.async_add_read_only_executor_job(
+                _ws_stream_get_events_page,
+                msg_id,
+                start_time,
+                end_time,
+                event_processor,
+                partial,
+                limit,
+                cursor,
+            )
+        )
+        last_event_time = page_last_event_time or last_event_time
+        if cursor is None:
+            # Same as _async_send_historical_events, the last page is
+            # sent even if it is empty unless more data follows
+            if page_last_event_time or not partial or force_send:
+                connection.send_message(message)
+            return last_event_time
+        connection.send_message(message)
+
+
 async def _async_get_ws_stream_events(
     hass: HomeAssistant,
     msg_id: int,
@@ -163,7 +233,7 @@ async def _async_get_ws_stream_events(
     partial: bool,
 ) -> tuple[bytes, dt | None]:
     """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
+    return await get_instance(hass).async_add_read_only_executor_job(
         _ws_stream_get_events,
         msg_id,
         start_time,
@@ -206,6 +276,28 @@ def _ws_stream_get_events(
     return json_bytes(messages.event_message(msg_id, message)), last_time
 
 
+def _ws_stream_get_events_page(
+    msg_id: int,
+    start_day: dt,
+    end_day: dt,
+    event_processor: EventProcessor,
+    partial: bool,
+    limit: int,
+    cursor: LogbookCursor | None,
+) -> tuple[bytes, dt | None, LogbookCursor | None]:
+    """Fetch a page of events and convert them to json in the executor."""
+    events, next_cursor = event_processor.get_events_page(
+        start_day, end_day, limit, cursor
+    )
+    last_time = None
+    if events:
+        last_time = dt_util.utc_from_timestamp(events[-1]["when"])
+    message = _generate_stream_message(events, start_day, end_day)
+    if partial or next_cursor:
+        message["partial"] = True
+    return json_bytes(messages.event_message(msg_id, message)), last_time, next_cursor
+
+
 async def _async_events_consumer(
     subscriptions_setup_complete_time: dt,
     connection: ActiveConnection,
@@ -251,15 +343,21 @@ async def _async_events_consumer(
         vol.Optional("end_time"): str,
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
 async def ws_event_stream(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle logbook stream events websocket command."""
+    """Handle logbook stream events websocket command.
+
+    When limit is set the historical events are sent in messages of at
+    most limit events.
+    """
     start_time_str = msg["start_time"]
     msg_id: int = msg["id"]
+    limit: int | None = msg.get("limit")
     utc_now = dt_util.utcnow()
 
     if start_time := dt_util.parse_datetime(start_time_str):
@@ -312,6 +410,7 @@ async def ws_event_stream(
             end_time,
             event_processor,
             partial=False,
+            limit=limit,
         )
         return
 
@@ -383,6 +482,7 @@ async def ws_event_stream(
         # we want to make sure the client is not still spinning
         # because it is waiting for the first message
         force_send=True,
+        limit=limit,
     )
 
     if msg_id not in connection.subscriptions:
@@ -423,6 +523,7 @@ async def ws_event_stream(
         subscriptions_setup_complete_time,
         event_processor,
         partial=False,
+        limit=limit,
     )
     event_processor.switch_to_live()
 
@@ -441,6 +542,29 @@ def _ws_formatted_get_events(
     )
 
 
+def _ws_formatted_get_events_page(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    event_processor: EventProcessor,
+    limit: int,
+    cursor: LogbookCursor | None,
+) -> bytes:
+    """Fetch a page of events and convert them to json in the executor."""
+    events, next_cursor = event_processor.get_events_page(
+        start_time, end_time, limit, cursor
+    )
+    return json_bytes(
+        messages.result_message(
+            msg_id,
+            {
+                "events": events,
+                "cursor": next_cursor.as_token() if next_cursor else None,
+            },
+        )
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "logbook/get_events",
@@ -449,16 +573,33 @@ def _ws_formatted_get_events(
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
         vol.Optional("context_id"): str,
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
+        vol.Optional("cursor"): str,
     }
 )
 @websocket_api.async_response
 async def ws_get_events(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle logbook get events websocket command."""
+    """Handle logbook get events websocket command.
+
+    When limit is set the result is a page of at most limit events and
+    the cursor to pass to get the next page, or None after the last page.
+    """
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
     utc_now = dt_util.utcnow()
+    limit: int | None = msg.get("limit")
+    cursor: LogbookCursor | None = None
+    if cursor_token := msg.get("cursor"):
+        if not limit:
+            connection.send_error(
+                msg["id"], "invalid_format", "cursor can only be used with limit"
+            )
+            return
+        if not (cursor := LogbookCursor.from_token(cursor_token)):
+            connection.send_error(msg["id"], "invalid_cursor", "Invalid cursor")
+            return
 
     if start_time := dt_util.parse_datetime(start_time_str):
         start_time = dt_util.as_utc(start_time)
@@ -475,7 +616,7 @@ async def ws_get_events(
         return
 
     if start_time > utc_now:
-        connection.send_result(msg["id"], [])
+        _async_send_empty_events(connection, msg["id"], limit)
         return
 
     device_ids = msg.get("device_ids")
@@ -485,7 +626,7 @@ async def ws_get_events(
         entity_ids = async_filter_entities(hass, entity_ids)
         if not entity_ids and not device_ids:
             # Everything has been filtered away
-            connection.send_result(msg["id"], [])
+            _async_send_empty_events(connection, msg["id"], limit)
             return
 
     event_types = async_determine_event_types(hass, entity_ids, device_ids)
@@ -500,8 +641,22 @@ async def ws_get_events(
         include_entity_name=False,
     )
 
+    if limit:
+        connection.send_message(
+            await get_instance(hass).async_add_read_only_executor_job(
+                _ws_formatted_get_events_page,
+                msg["id"],
+                start_time,
+                end_time,
+                event_processor,
+                limit,
+                cursor,
+            )
+        )
+        return
+
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_only_executor_job(
             _ws_formatted_get_events,
             msg["id"],
             start_time,
@@ -19,13 +19,14 @@ import voluptuous as vol
 
 from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE, Platform
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
 
+from . import websocket_api
 from .const import DOMAIN
 
 SERVICE_START = "start"
@@ -40,6 +41,8 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_START_JOB_TIMING = "start_job_timing"
+SERVICE_STOP_JOB_TIMING = "stop_job_timing"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,6 +66,8 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_START_JOB_TIMING,
+    SERVICE_STOP_JOB_TIMING,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -75,6 +80,8 @@ CONF_MAX_OBJECTS = "max_objects"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
+PLATFORMS = [Platform.SENSOR]
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -85,6 +92,8 @@ async def async_setup_entry(  # noqa: C901
     """Set up Profiler from a config entry."""
     lock = asyncio.Lock()
     domain_data = hass.data[DOMAIN] = {}
+    hass.async_start_loop_monitor()
+    websocket_api.async_setup(hass)
 
     async def _async_run_profile(call: ServiceCall) -> None:
         async with lock:
@@ -273,6 +282,21 @@ async def async_setup_entry(  # noqa: C901
             base_logger.setLevel(logging.INFO)
         hass.loop.set_debug(enabled)
 
+    @callback
+    def _async_start_job_timing(call: ServiceCall) -> None:
+        """Start timing the jobs of each integration."""
+        if hass.loop_monitor is not None and hass.loop_monitor.timing_jobs:
+            raise HomeAssistantError("Job timing already started")
+        _LOGGER.warning("Job timing started, this slows down the event loop")
+        hass.async_start_job_timing()
+
+    @callback
+    def _async_stop_job_timing(call: ServiceCall) -> None:
+        """Stop timing the jobs of each integration."""
+        if hass.loop_monitor is None or not hass.loop_monitor.timing_jobs:
+            raise HomeAssistantError("Job timing not running")
+        hass.async_stop_job_timing()
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -382,11 +406,29 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_JOB_TIMING,
+        _async_start_job_timing,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_JOB_TIMING,
+        _async_stop_job_timing,
+    )
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
+    hass.async_stop_loop_monitor()
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
@@ -0,0 +1,84 @@
+"""Sensors for the profiler integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util.loop_monitor import LoopMonitor
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ProfilerSensorEntityDescription(SensorEntityDescription):
+    """Describes a profiler sensor entity."""
+
+    value_fn: Callable[[LoopMonitor], float | int]
+
+
+SENSORS: tuple[ProfilerSensorEntityDescription, ...] = (
+    ProfilerSensorEntityDescription(
+        key="event_loop_lag",
+        translation_key="event_loop_lag",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda loop_monitor: loop_monitor.recent_lag * 1000,
+    ),
+    ProfilerSensorEntityDescription(
+        key="slow_callbacks",
+        translation_key="slow_callbacks",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda loop_monitor: loop_monitor.slow_callbacks,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the profiler sensors."""
+    loop_monitor = hass.async_start_loop_monitor()
+    async_add_entities(
+        (ProfilerSensor(entry, loop_monitor, description) for description in SENSORS),
+        True,
+    )
+
+
+class ProfilerSensor(SensorEntity):
+    """Sensor reporting data collected by the event loop monitor."""
+
+    _attr_has_entity_name = True
+    entity_description: ProfilerSensorEntityDescription
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        loop_monitor: LoopMonitor,
+        description: ProfilerSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._loop_monitor = loop_monitor
+
+    async def async_update(self) -> None:
+        """Update the sensor from the event loop monitor."""
+        self._attr_native_value = self.entity_description.value_fn(self._loop_monitor)
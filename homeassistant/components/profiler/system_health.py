@@ -0,0 +1,34 @@
+"""Provide info to system health."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+
+TOP_INTEGRATIONS = 5
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info)
+
+
+async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get info for the info page."""
+    if (loop_monitor := hass.loop_monitor) is None:
+        return {}
+    return {
+        "event_loop_lag": f"{loop_monitor.recent_lag * 1000:.1f} ms",
+        "slow_callbacks": loop_monitor.slow_callbacks,
+        "top_integrations": ", ".join(
+            f"{domain} ({loop_time:.1f} s)"
+            for domain, loop_time in loop_monitor.async_top_integrations(
+                TOP_INTEGRATIONS
+            )
+        ),
+    }
@@ -0,0 +1,35 @@
+"""The profiler websocket API."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Set up the profiler websocket API."""
+    websocket_api.async_register_command(hass, ws_loop_stats)
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "profiler/loop_stats",
+    }
+)
+@callback
+def ws_loop_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the event loop lag and callback execution times."""
+    if (loop_monitor := hass.loop_monitor) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Event loop monitor is not running"
+        )
+        return
+    connection.send_result(msg["id"], loop_monitor.as_dict())
@@ -37,6 +37,17 @@ def ws_info(
         # for the thread state lock which will block the event loop.
         is_running = instance.is_running
         max_backlog = instance.max_backlog
+        commit_info = instance.commit_scheduler.as_dict()
+        purge_progress = (
+            progress.as_dict()
+            if (progress := instance.purge_progress) is not None
+            else None
+        )
+        migration_progress = (
+            progress.as_dict()
+            if (progress := instance.migration_progress) is not None
+            else None
+        )
     else:
         backlog = None
         migration_in_progress = False
@@ -44,13 +55,19 @@ def ws_info(
         recording = False
         is_running = False
         max_backlog = None
+        commit_info = {}
+        purge_progress = None
+        migration_progress = None
 
     recorder_info = {
         "backlog": backlog,
         "max_backlog": max_backlog,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
+        "migration_progress": migration_progress,
+        "purge_progress": purge_progress,
         "recording": recording,
         "thread_running": is_running,
+        **commit_info,
     }
     connection.send_result(msg["id"], recorder_info)
@@ -0,0 +1,193 @@
+"""Insert the recorded events and states in bulk."""
+
+from __future__ import annotations
+
+from typing import Any, Final
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
+from .db_schema import Base, Events, LogbookIndex, States
+
+
+def _insert_column_keys(table: type[Base]) -> tuple[str, ...]:
+    """Return the keys of the columns written when inserting a row."""
+    return tuple(
+        column.key for column in table.__table__.columns if not column.primary_key
+    )
+
+
+EVENTS_COLUMN_KEYS: Final = _insert_column_keys(Events)
+STATES_COLUMN_KEYS: Final = _insert_column_keys(States)
+
+
+def _event_params(dbevent: Events) -> dict[str, Any]:
+    """Return the insert parameters of an event."""
+    values = dbevent.__dict__
+    params = {key: values.get(key) for key in EVENTS_COLUMN_KEYS}
+    if (event_type := values.get("event_type_rel")) is not None:
+        params["event_type_id"] = event_type.event_type_id
+    if (event_data := values.get("event_data_rel")) is not None:
+        params["data_id"] = event_data.data_id
+    return params
+
+
+def _state_params(dbstate: States) -> dict[str, Any]:
+    """Return the insert parameters of a state."""
+    values = dbstate.__dict__
+    params = {key: values.get(key) for key in STATES_COLUMN_KEYS}
+    if (states_meta := values.get("states_meta_rel")) is not None:
+        params["metadata_id"] = states_meta.metadata_id
+    if (state_attributes := values.get("state_attributes")) is not None:
+        params["attributes_id"] = state_attributes.attributes_id
+    if (old_state := values.get("old_state")) is not None:
+        params["old_state_id"] = old_state.state_id
+    return params
+
+
+class BulkInsertBuffer:
+    """Buffer the Events and States rows between commits.
+
+    Adding the rows to the session makes the unit of work insert them
+    one by one since the old_state relationship of the States rows is
+    self referential. Instead the rows are buffered and written with
+    executemany when the session is committed.
+    """
+
+    __slots__ = ("_events", "_logbook_index", "_states")
+
+    def __init__(self) -> None:
+        """Initialize the buffer."""
+        self._events: list[Events] = []
+        self._states: list[States] = []
+        self._logbook_index: list[
+            tuple[Events, str | None, str | None, str | None]
+        ] = []
+
+    def __len__(self) -> int:
+        """Return the number of buffered rows."""
+        return len(self._events) + len(self._states)
+
+    def add_event(self, dbevent: Events) -> None:
+        """Buffer an event row."""
+        self._events.append(dbevent)
+
+    def add_state(self, dbstate: States) -> None:
+        """Buffer a state row."""
+        self._states.append(dbstate)
+
+    def add_logbook_index(
+        self,
+        dbevent: Events,
+        entity_id: str | None,
+        old_entity_id: str | None,
+        device_id: str | None,
+    ) -> None:
+        """Buffer a logbook index row of a buffered event."""
+        self._logbook_index.append((dbevent, entity_id, old_entity_id, device_id))
+
+    def clear(self) -> None:
+        """Drop the buffered rows."""
+        self._events.clear()
+        self._states.clear()
+        self._logbook_index.clear()
+
+    def reset_ids(self) -> None:
+        """Reset the ids set when the buffered rows were written.
+
+        The transaction is rolled back when the commit fails, the rows
+        are written again when the commit is retried.
+        """
+        for dbevent in self._events:
+            dbevent.event_id = None  # type: ignore[assignment]
+        for dbstate in self._states:
+            dbstate.state_id = None  # type: ignore[assignment]
+
+    def write(self, session: Session) -> None:
+        """Write the buffered rows in the session.
+
+        The rows the buffered rows refer to are flushed first so their
+        ids are known. The state_id of the States rows is set, as it is
+        used to link the next state of the entity. The rows stay buffered
+        until they are cleared after the commit.
+        """
+        session.flush()
+        dialect = session.get_bind().dialect
+        returning = dialect.insert_executemany_returning_sort_by_parameter_order
+        if self._logbook_index:
+            # The logbook index rows refer to the events by event_id
+            if returning:
+                self._write_events(session)
+            else:
+                session.add_all(self._events)
+                session.flush()
+            session.execute(
+                insert(LogbookIndex),
+                [
+                    {
+                        "event_id": dbevent.event_id,
+                        "time_fired_ts": dbevent.time_fired_ts,
+                        "entity_id": entity_id,
+                        "old_entity_id": old_entity_id,
+                        "device_id": device_id,
+                    }
+                    for (
+                        dbevent,
+                        entity_id,
+                        old_entity_id,
+                        device_id,
+                    ) in self._logbook_index
+                ],
+            )
+        elif self._events:
+            session.execute(
+                insert(Events), [_event_params(dbevent) for dbevent in self._events]
+            )
+        if self._states:
+            if returning:
+                self._write_states(session)
+            else:
+                # Without RETURNING support for executemany the state_ids
+                # can only be fetched by inserting the rows one by one
+                session.add_all(self._states)
+                session.flush()
+
+    def _write_events(self, session: Session) -> None:
+        """Write the buffered Events rows and fetch their event_ids."""
+        statement = insert(Events).returning(
+            Events.event_id, sort_by_parameter_order=True
+        )
+        event_ids = session.scalars(
+            statement, [_event_params(dbevent) for dbevent in self._events]
+        ).all()
+        for dbevent, event_id in zip(self._events, event_ids, strict=True):
+            dbevent.event_id = event_id
+
+    def _write_states(self, session: Session) -> None:
+        """Write the buffered States rows and fetch their state_ids.
+
+        A state can only be written after the previous state of the entity,
+        so the rows are written in as many batches as the maximum number of
+        buffered states of an entity. A previous state which is not buffered
+        and has no state_id was never written, the state is written without
+        its old_state_id so each batch makes progress.
+        """
+        statement = insert(States).returning(
+            States.state_id, sort_by_parameter_order=True
+        )
+        pending = self._states
+        while pending:
+            pending_states = set(pending)
+            batch: list[States] = []
+            deferred: list[States] = []
+            for dbstate in pending:
+                if dbstate.__dict__.get("old_state") in pending_states:
+                    deferred.append(dbstate)
+                else:
+                    batch.append(dbstate)
+            state_ids = session.scalars(
+                statement, [_state_params(dbstate) for dbstate in batch]
+            ).all()
+            for dbstate, state_id in zip(batch, state_ids, strict=True):
+                dbstate.state_id = state_id
+            pending = deferred
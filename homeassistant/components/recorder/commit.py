@@ -0,0 +1,77 @@
+"""Schedule the commits of the recorder."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .const import COMMIT_BACKLOG_HIGH, COMMIT_BACKLOG_LOW, MIN_COMMIT_INTERVAL
+
+
+class CommitScheduler:
+    """Adapt the commit interval to the recorder backlog.
+
+    While events queue up the interval is halved after every commit, down
+    to MIN_COMMIT_INTERVAL, so the pending rows are committed in smaller
+    batches and show up sooner in the history and the logbook. While the
+    backlog stays low the interval is doubled after every commit, up to the
+    max commit interval, to reduce the number of disk syncs. The max commit
+    interval defaults to the configured commit interval, so the write
+    latency is only stretched when it is configured.
+    """
+
+    __slots__ = (
+        "commit_interval",
+        "commits",
+        "interval",
+        "max_interval",
+        "max_latency",
+        "min_interval",
+        "rows",
+        "total_latency",
+    )
+
+    def __init__(
+        self, commit_interval: float, max_commit_interval: float | None = None
+    ) -> None:
+        """Initialize the scheduler."""
+        self.commit_interval = commit_interval
+        self.min_interval = min(commit_interval, MIN_COMMIT_INTERVAL)
+        self.max_interval = max(commit_interval, max_commit_interval or 0)
+        self.interval = commit_interval
+        self.commits = 0
+        self.rows = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def next_interval(self, backlog: int) -> float:
+        """Return the time to wait for the next commit."""
+        if backlog >= COMMIT_BACKLOG_HIGH:
+            self.interval = max(
+                min(self.interval, self.commit_interval) / 2, self.min_interval
+            )
+        elif backlog < COMMIT_BACKLOG_LOW:
+            self.interval = min(self.interval * 2, self.max_interval)
+        else:
+            self.interval = self.commit_interval
+        return self.interval
+
+    def record_commit(self, rows: int, latency: float) -> None:
+        """Record the number of rows and the duration of a commit.
+
+        This method is called from the recorder thread.
+        """
+        self.commits += 1
+        self.rows += rows
+        self.total_latency += latency
+        self.max_latency = max(latency, self.max_latency)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the diagnostics of the commits."""
+        commits = self.commits or 1
+        return {
+            "commit_interval": self.interval,
+            "commit_latency": self.total_latency / commits,
+            "commit_latency_max": self.max_latency,
+            "commits": self.commits,
+            "rows_per_commit": self.rows / commits,
+        }
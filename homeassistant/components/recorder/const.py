@@ -29,6 +29,24 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
+# Once the backlog is too large to keep in memory, the events are spilled
+# to disk until this many are waiting and recording stops. The spilled
+# events are dropped on shutdown like the events queued in memory
+MAX_SPILLED_BACKLOG = 1_000_000
+SPILL_DIRECTORY = ".recorder_spill"
+
+# While the backlog is at least COMMIT_BACKLOG_HIGH the commit interval
+# is halved after every commit, down to MIN_COMMIT_INTERVAL seconds, so
+# the rows are committed in smaller batches. While it is below
+# COMMIT_BACKLOG_LOW the interval is doubled, up to the max_commit_interval
+# option. Without the option the interval is never longer than the
+# configured commit interval.
+COMMIT_BACKLOG_LOW = 100
+COMMIT_BACKLOG_HIGH = 1000
+MIN_COMMIT_INTERVAL = 1
+# The pending rows are committed as soon as there are this many,
+# regardless of the commit interval
+MAX_ROWS_PER_COMMIT = 2000
 
 # The maximum number of rows (events) we purge in one delete statement
 
@@ -45,6 +63,7 @@ SQLITE_MODERN_MAX_BIND_VARS = 4000
 DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
+DB_READ_ONLY_WORKER_PREFIX = "DbReadOnlyWorker"
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
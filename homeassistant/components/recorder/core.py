@@ -25,20 +25,24 @@ from sqlalchemy.orm.session import Session
 
 from homeassistant.components import persistent_notification
 from homeassistant.const import (
+    ATTR_DEVICE_ID,
     ATTR_ENTITY_ID,
     EVENT_HOMEASSISTANT_CLOSE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_STATE_CHANGED,
     MATCH_ALL,
+    MAX_LENGTH_STATE_ENTITY_ID,
 )
 from homeassistant.core import (
     CALLBACK_TYPE,
     Event,
     EventStateChangedData,
+    HassJob,
     HomeAssistant,
     callback,
 )
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
@@ -50,7 +54,10 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .bulk_insert import BulkInsertBuffer
+from .commit import CommitScheduler
 from .const import (
+    DB_READ_ONLY_WORKER_PREFIX,
     DB_WORKER_PREFIX,
     DOMAIN,
     KEEPALIVE_TIME,
@@ -58,19 +65,24 @@ from .const import (
     MARIADB_PYMYSQL_URL_PREFIX,
     MARIADB_URL_PREFIX,
     MAX_QUEUE_BACKLOG_MIN_VALUE,
+    MAX_ROWS_PER_COMMIT,
+    MAX_SPILLED_BACKLOG,
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    SPILL_DIRECTORY,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
 from .db_schema import (
+    LOGBOOK_INDEX_DEVICE_ID_MAX_LENGTH,
     SCHEMA_VERSION,
     Base,
     EventData,
     Events,
     EventTypes,
+    LogbookIndex,
     StateAttributes,
     States,
     StatesMeta,
@@ -83,11 +95,22 @@ from .migration import (
     EventIDPostMigration,
     EventsContextIDMigration,
     EventTypeIDMigration,
+    MigrationProgress,
     StatesContextIDMigration,
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
-from .queries import get_migration_changes
+from .purge import PurgeProgress
+from .queries import (
+    delete_all_logbook_index_rows,
+    delete_states_checkpoints_rows_after,
+    find_latest_states_checkpoint_start,
+    find_logbook_index_start,
+    get_migration_changes,
+)
+from .spill_queue import SpillQueue, SpillSegment
+from .states_buffer import StatesBuffer
+from .statistics_cache import StatisticsResultCache
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -108,6 +131,7 @@ from .tasks import (
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    ReplaySpilledTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -125,6 +149,7 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    setup_read_only_connection_for_dialect,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
@@ -168,9 +193,12 @@ class Recorder(threading.Thread):
         auto_repack: bool,
         keep_days: int,
         commit_interval: int,
+        max_commit_interval: int | None,
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
+        db_read_only_workers: int,
+        logbook_index: bool,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
     ) -> None:
@@ -180,16 +208,27 @@ class Recorder(threading.Thread):
         self.hass = hass
         self.thread_id: int | None = None
         self.recorder_and_worker_thread_ids: set[int] = set()
+        self.read_only_thread_ids: set[int] = set()
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
+        self.commit_scheduler = CommitScheduler(commit_interval, max_commit_interval)
+        self.purge_progress: PurgeProgress | None = None
+        self.migration_progress: MigrationProgress | None = None
+        self.statistics_cache = StatisticsResultCache()
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
+        self._spill_queue = SpillQueue(hass.config.path(SPILL_DIRECTORY))
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.db_read_only_workers = db_read_only_workers
+        self.logbook_index = logbook_index
+        # The time the logbook index was started, the logbook can only
+        # use the index for periods starting after it
+        self.logbook_index_start_ts: float | None = None
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -200,6 +239,7 @@ class Recorder(threading.Thread):
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
+        self.read_only_engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
@@ -212,6 +252,11 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        self._bulk_insert_buffer = BulkInsertBuffer()
+        self.states_buffer = StatesBuffer()
+        # The start of the newest states checkpoint, a state recorded with
+        # an older last_updated invalidates the checkpoints after it
+        self.states_checkpoint_ts: float | None = None
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -223,17 +268,20 @@ class Recorder(threading.Thread):
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_only_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._db_read_only_executor: DBInterruptibleThreadPoolExecutor | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
         self._keep_alive_listener: CALLBACK_TYPE | None = None
         self._commit_listener: CALLBACK_TYPE | None = None
+        self._commit_job = HassJob(self._async_commit_timer, "Recorder commit")
         self._periodic_listener: CALLBACK_TYPE | None = None
         self._nightly_listener: CALLBACK_TYPE | None = None
         self._dialect_name: SupportedDialect | None = None
@@ -249,7 +297,7 @@ class Recorder(threading.Thread):
     @property
     def backlog(self) -> int:
         """Return the number of items in the recorder backlog."""
-        return self._queue.qsize()
+        return self._queue.qsize() + self._spill_queue.size
 
     @cached_property
     def dialect_name(self) -> SupportedDialect | None:
@@ -274,9 +322,23 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_only_session(self) -> Session:
+        """Get a new sqlalchemy session for reading from the database.
+
+        The threads of the read only executor get a session of the read only
+        engine, when there is one, other threads get a session of the recorder.
+        """
+        if (
+            self._get_read_only_session is not None
+            and threading.get_ident() in self.read_only_thread_ids
+        ):
+            return self._get_read_only_session()
+        return self.get_session()
+
     def queue_task(self, task: RecorderTask | Event) -> None:
         """Add a task to the recorder queue."""
-        self._queue.put(task)
+        if not self._spill_queue.active or not self._spill_queue.put(task):
+            self._queue.put(task)
 
     def set_enable(self, enable: bool) -> None:
         """Enable or disable recording events and states."""
@@ -291,18 +353,46 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        self._db_read_only_executor = DBInterruptibleThreadPoolExecutor(
+            self.read_only_thread_ids,
+            thread_name_prefix=DB_READ_ONLY_WORKER_PREFIX,
+            max_workers=self.db_read_only_workers,
+            shutdown_hook=self._shutdown_read_only_pool,
+        )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
         if self.engine and hasattr(self.engine.pool, "shutdown"):
             self.engine.pool.shutdown()
 
+    def _shutdown_read_only_pool(self) -> None:
+        """Close the read only dbpool connections in the current thread."""
+        if self.read_only_engine and hasattr(self.read_only_engine.pool, "shutdown"):
+            self.read_only_engine.pool.shutdown()
+
     @callback
     def async_initialize(self) -> None:
         """Initialize the recorder."""
+        # All the state changes are seen from now on, the recorder thread
+        # is not started yet
+        self.states_buffer.start(time.time(), self.hass.states.async_all())
+        self._event_listener = self._async_listen_events(
+            self._async_spill_event
+            if self._spill_queue.active
+            else self._queue.put_nowait
+        )
+        self._queue_watcher = async_track_time_interval(
+            self.hass,
+            self._async_check_queue,
+            QUEUE_CHECK_INTERVAL,
+            name="Recorder queue watcher",
+        )
+
+    @callback
+    def _async_listen_events(self, queue_put: Callable[[Event], None]) -> CALLBACK_TYPE:
+        """Listen for the recorded events and pass them to queue_put."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -331,16 +421,7 @@ class Recorder(threading.Thread):
             # Unknown what it is.
             queue_put(event)
 
-        self._event_listener = self.hass.bus.async_listen(
-            MATCH_ALL,
-            _event_listener,
-        )
-        self._queue_watcher = async_track_time_interval(
-            self.hass,
-            self._async_check_queue,
-            QUEUE_CHECK_INTERVAL,
-            name="Recorder queue watcher",
-        )
+        return self.hass.bus.async_listen(MATCH_ALL, _event_listener)
 
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
@@ -355,9 +436,27 @@ class Recorder(threading.Thread):
             self._event_listener
             and not self._database_lock_task
             and self._event_session_has_pending_writes
+            # While the backlog is large the recorder commits
+            # every MAX_ROWS_PER_COMMIT rows by itself
+            and self.backlog < MAX_ROWS_PER_COMMIT
         ):
             self.queue_task(COMMIT_TASK)
 
+    @callback
+    def _async_schedule_commit(self) -> None:
+        """Schedule the next commit, adapting the interval to the backlog."""
+        self._commit_listener = async_call_later(
+            self.hass,
+            self.commit_scheduler.next_interval(self.backlog),
+            self._commit_job,
+        )
+
+    @callback
+    def _async_commit_timer(self, now: datetime) -> None:
+        """Queue a commit and schedule the next one."""
+        self._async_commit(now)
+        self._async_schedule_commit()
+
     @callback
     def async_add_executor_job[_T](
         self, target: Callable[..., _T], *args: Any
@@ -365,6 +464,19 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    @callback
+    def async_add_read_only_executor_job[_T](
+        self, target: Callable[..., _T], *args: Any
+    ) -> asyncio.Future[_T]:
+        """Add a job which only reads from the database from within the event loop.
+
+        The jobs run in parallel with the recorder and the other executor jobs
+        and must only use read only sessions.
+        """
+        return self.hass.loop.run_in_executor(
+            self._db_read_only_executor, target, *args
+        )
+
     @callback
     def _async_check_queue(self, *_: Any) -> None:
         """Periodic check of the queue size to ensure we do not exhaust memory.
@@ -372,7 +484,23 @@ class Recorder(threading.Thread):
         The queue grows during migration or if something really goes wrong.
         """
         _LOGGER.debug("Recorder queue size is: %s", self.backlog)
-        if not self._reached_max_backlog():
+        spill_queue = self._spill_queue
+        if spill_queue.active:
+            if spill_queue.size < MAX_SPILLED_BACKLOG:
+                return
+        elif not self._reached_max_backlog():
+            return
+        elif MAX_SPILLED_BACKLOG:
+            _LOGGER.warning(
+                (
+                    "The recorder backlog queue reached the maximum size of %s "
+                    "events; usually, the system is CPU bound, I/O bound, or the "
+                    "database is corrupt due to a disk problem; The recorder will "
+                    "spill the events to disk until the database catches up"
+                ),
+                self.backlog,
+            )
+            self._async_start_spilling()
             return
         _LOGGER.error(
             (
@@ -385,6 +513,38 @@ class Recorder(threading.Thread):
         )
         self._async_stop_queue_watcher_and_event_listener()
 
+    @callback
+    def _async_start_spilling(self) -> None:
+        """Spill the queued events to disk instead of keeping them in memory."""
+        self._spill_queue.start(ReplaySpilledTask(), self._queue.put)
+        if self._event_listener:
+            self._event_listener()
+            self._event_listener = self._async_listen_events(self._async_spill_event)
+
+    @callback
+    def _async_spill_event(self, event: Event) -> None:
+        """Spill an event, or queue it if spilling stopped."""
+        if not self._spill_queue.put(event):
+            self._queue.put_nowait(event)
+
+    @callback
+    def _async_stop_spilling(self) -> None:
+        """Queue the events in memory again once the spilled events are replayed."""
+        if self._event_listener and not self._spill_queue.active:
+            self._event_listener()
+            self._event_listener = self._async_listen_events(self._queue.put_nowait)
+
+    def _replay_spilled_queue(self) -> None:
+        """Process the spilled events and tasks in order until caught up."""
+        spill_queue = self._spill_queue
+        while not self.stop_requested and (item := spill_queue.pop()) is not None:
+            if type(item) is SpillSegment:
+                for event in spill_queue.load(item):
+                    self._guarded_process_one_task_or_event_or_recover(event)
+            else:
+                self._guarded_process_one_task_or_event_or_recover(item)
+        self.hass.add_job(self._async_stop_spilling)
+
     def _available_memory(self) -> int:
         """Return the available memory in bytes."""
         if not self._psutil:
@@ -393,8 +553,9 @@ class Recorder(threading.Thread):
 
     def _reached_max_backlog(self) -> bool:
         """Check if the system has reached the max queue backlog and return True if it has."""
-        # First check the minimum value since its cheap
-        if self.backlog < MAX_QUEUE_BACKLOG_MIN_VALUE:
+        # First check the minimum value since its cheap, the spilled
+        # events are not kept in memory
+        if self._queue.qsize() < MAX_QUEUE_BACKLOG_MIN_VALUE:
             return False
         # If they have more RAM available, keep filling the backlog
         # since we do not want to stop recording events or give the
@@ -443,6 +604,7 @@ class Recorder(threading.Thread):
                 self._queue.get_nowait()
             except queue.Empty:
                 break
+        await self.hass.async_add_executor_job(self._spill_queue.clear)
         self.queue_task(StopTask())
         await self.hass.async_add_executor_job(self.join)
 
@@ -645,12 +807,7 @@ class Recorder(threading.Thread):
 
         # If the commit interval is not 0, we need to commit periodically
         if self.commit_interval:
-            self._commit_listener = async_track_time_interval(
-                self.hass,
-                self._async_commit,
-                timedelta(seconds=self.commit_interval),
-                name="Recorder commit",
-            )
+            self._async_schedule_commit()
 
         # Run nightly tasks at 4:12am
         self._nightly_listener = async_track_time_change(
@@ -699,6 +856,14 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_to_bulk_insert_buffer(self, obj: Events | States) -> None:
+        """Buffer an Events or States row to be inserted on commit."""
+        self._event_session_has_pending_writes = True
+        if isinstance(obj, States):
+            self._bulk_insert_buffer.add_state(obj)
+        else:
+            self._bulk_insert_buffer.add_event(obj)
+
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
         persistent_notification.create(
@@ -800,6 +965,10 @@ class Recorder(threading.Thread):
             # herd of queries to find the statistics meta data if
             # there are a lot of statistics graphs on the frontend.
             self.statistics_meta_manager.load(session)
+            self._setup_logbook_index(session)
+            self.states_checkpoint_ts = session.execute(
+                find_latest_states_checkpoint_start()
+            ).scalar()
 
             migration_changes: dict[str, int] = {
                 row[0]: row[1]
@@ -823,6 +992,18 @@ class Recorder(threading.Thread):
         # and not the old ones as soon as the API is available.
         self.hass.add_job(self.async_set_db_ready)
 
+    def _setup_logbook_index(self, session: Session) -> None:
+        """Start the logbook index, or clear it if it is disabled."""
+        if not self.logbook_index:
+            # The events recorded while the index is disabled are missing
+            # from it, so it is started over when it is enabled again
+            session.execute(delete_all_logbook_index_rows())
+            return
+        if (start_ts := session.execute(find_logbook_index_start()).scalar()) is None:
+            start_ts = time.time()
+            session.add(LogbookIndex(time_fired_ts=start_ts))
+        self.logbook_index_start_ts = start_ts
+
     def _run_event_loop(self) -> None:
         """Run the event loop for the recorder."""
         # Use a session for the event read loop
@@ -1024,13 +1205,20 @@ class Recorder(threading.Thread):
 
     def _process_one_event(self, event: Event[Any]) -> None:
         if not self.enabled:
+            # The states are not recorded, the statistics must be
+            # compiled from the database until recording is enabled
+            self.states_buffer.clear()
             return
         if event.event_type == EVENT_STATE_CHANGED:
+            self.states_buffer.add(event)
             self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
-        # Commit if the commit interval is zero
-        if not self.commit_interval:
+        # Commit if the commit interval is zero or if enough rows are pending
+        if (
+            not self.commit_interval
+            or len(self._bulk_insert_buffer) >= MAX_ROWS_PER_COMMIT
+        ):
             self._commit_event_session_or_retry()
 
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
@@ -1052,7 +1240,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_to_bulk_insert_buffer(dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1077,7 +1265,34 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_to_bulk_insert_buffer(dbevent)
+        if self.logbook_index:
+            self._add_to_logbook_index(dbevent, event)
+
+    def _add_to_logbook_index(self, dbevent: Events, event: Event) -> None:
+        """Buffer a logbook index row if the event refers to an entity or device."""
+        data = event.data
+        entity_id = data.get(ATTR_ENTITY_ID)
+        old_entity_id = data.get("old_entity_id")
+        device_id = data.get(ATTR_DEVICE_ID)
+        # The logbook only matches events referring to a single entity
+        # or device, the ids too long for the columns can't refer to one
+        if type(entity_id) is not str or len(entity_id) > MAX_LENGTH_STATE_ENTITY_ID:
+            entity_id = None
+        if (
+            type(old_entity_id) is not str
+            or len(old_entity_id) > MAX_LENGTH_STATE_ENTITY_ID
+        ):
+            old_entity_id = None
+        if (
+            type(device_id) is not str
+            or len(device_id) > LOGBOOK_INDEX_DEVICE_ID_MAX_LENGTH
+        ):
+            device_id = None
+        if entity_id or old_entity_id or device_id:
+            self._bulk_insert_buffer.add_logbook_index(
+                dbevent, entity_id, old_entity_id, device_id
+            )
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1094,6 +1309,12 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
 
+        last_updated_ts = cast(float, dbstate.last_updated_ts)
+        if (
+            checkpoint_ts := self.states_checkpoint_ts
+        ) is not None and last_updated_ts < checkpoint_ts:
+            self._invalidate_states_checkpoints(session, last_updated_ts)
+
         states_manager = self.states_manager
         if pending_state := states_manager.pop_pending(entity_id):
             dbstate.old_state = pending_state
@@ -1160,7 +1381,22 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        self._add_to_bulk_insert_buffer(dbstate)
+
+    def _invalidate_states_checkpoints(
+        self, session: Session, last_updated_ts: float
+    ) -> None:
+        """Delete the states checkpoints which miss a state recorded late.
+
+        This happens when the state is recorded after the checkpoints were
+        written, for example when the events are replayed from the spilled
+        queue. The next hourly compile rebuilds the checkpoint from the
+        newest one left.
+        """
+        _LOGGER.debug("Invalidating the states checkpoints after %s", last_updated_ts)
+        session.execute(delete_states_checkpoints_rows_after(last_updated_ts))
+        self._event_session_has_pending_writes = True
+        self.states_checkpoint_ts = last_updated_ts
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1207,23 +1443,34 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
-
-        if (
-            pending_last_reported
-            := self.states_manager.get_pending_last_reported_timestamp()
-        ) and self.schema_version >= LAST_REPORTED_SCHEMA_VERSION:
-            with session.no_autoflush:
-                session.execute(
-                    update(States),
-                    [
-                        {
-                            "state_id": state_id,
-                            "last_reported_ts": last_reported_timestamp,
-                        }
-                        for state_id, last_reported_timestamp in pending_last_reported.items()
-                    ],
-                )
-        session.commit()
+        start = time.monotonic()
+        rows = len(self._bulk_insert_buffer)
+        try:
+            self._bulk_insert_buffer.write(session)
+
+            if (
+                pending_last_reported
+                := self.states_manager.get_pending_last_reported_timestamp()
+            ) and self.schema_version >= LAST_REPORTED_SCHEMA_VERSION:
+                with session.no_autoflush:
+                    session.execute(
+                        update(States),
+                        [
+                            {
+                                "state_id": state_id,
+                                "last_reported_ts": last_reported_timestamp,
+                            }
+                            for state_id, last_reported_timestamp in pending_last_reported.items()
+                        ],
+                    )
+            session.commit()
+        except Exception:
+            self._bulk_insert_buffer.reset_ids()
+            raise
+        # The buffered rows are only dropped once they are committed so
+        # they are written again when a failed commit is retried
+        self._bulk_insert_buffer.clear()
+        self.commit_scheduler.record_commit(rows, time.monotonic() - start)
 
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1257,6 +1504,7 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._bulk_insert_buffer.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1291,7 +1539,11 @@ class Recorder(threading.Thread):
 
     async def async_block_till_done(self) -> None:
         """Async version of block_till_done."""
-        if self._queue.empty() and not self._event_session_has_pending_writes:
+        if (
+            self._queue.empty()
+            and not self._spill_queue.size
+            and not self._event_session_has_pending_writes
+        ):
             return
         event = asyncio.Event()
         self.queue_task(SynchronizeTask(event))
@@ -1377,6 +1629,15 @@ class Recorder(threading.Thread):
             self.max_bind_vars = database_engine.max_bind_vars
         self._completed_first_database_setup = True
 
+    def _setup_read_only_recorder_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific read only connection settings."""
+        assert self.read_only_engine is not None
+        setup_read_only_connection_for_dialect(
+            self.read_only_engine.dialect.name, dbapi_connection
+        )
+
     def _setup_connection(self) -> None:
         """Ensure database is ready to fly."""
         kwargs: dict[str, Any] = {}
@@ -1426,10 +1687,34 @@ class Recorder(threading.Thread):
         migration.pre_migrate_schema(self.engine)
         Base.metadata.create_all(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
+        if kwargs.get("poolclass") is not MutexPool:
+            # In-memory databases can't be opened by other connections
+            self._setup_read_only_connection(kwargs)
         _LOGGER.debug("Connected to recorder database")
 
+    def _setup_read_only_connection(self, kwargs: dict[str, Any]) -> None:
+        """Create the engine used by the read only executor."""
+        read_only_kwargs = {**kwargs, "pool_size": self.db_read_only_workers}
+        if self._using_file_sqlite:
+            read_only_kwargs["recorder_and_worker_thread_ids"] = (
+                self.read_only_thread_ids
+            )
+        self.read_only_engine = create_engine(
+            self.db_url, **read_only_kwargs, future=True
+        )
+        sqlalchemy_event.listen(
+            self.read_only_engine, "connect", self._setup_read_only_recorder_connection
+        )
+        self._get_read_only_session = scoped_session(
+            sessionmaker(bind=self.read_only_engine, future=True)
+        )
+
     def _close_connection(self) -> None:
         """Close the connection."""
+        if self.read_only_engine:
+            self.read_only_engine.dispose()
+            self.read_only_engine = None
+        self._get_read_only_session = None
         if self.engine:
             self.engine.dispose()
             self.engine = None
@@ -1479,13 +1764,20 @@ class Recorder(threading.Thread):
         try:
             self._end_session()
         finally:
-            if self._db_executor:
+            # The events still spilled when the recorder stops are dropped
+            self._spill_queue.clear()
+            executors = [
+                executor
+                for executor in (self._db_executor, self._db_read_only_executor)
+                if executor
+            ]
+            for executor in executors:
                 # We shutdown the executor without forcefully
                 # joining the threads until after we have tried
                 # to cleanly close the connection.
-                self._db_executor.shutdown(join_threads_or_timeout=False)
+                executor.shutdown(join_threads_or_timeout=False)
             self._close_connection()
-            if self._db_executor:
+            for executor in executors:
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
-                self._db_executor.join_threads_or_timeout()
+                executor.join_threads_or_timeout()
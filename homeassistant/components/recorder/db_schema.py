@@ -77,7 +77,7 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 47
+SCHEMA_VERSION = 49
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -87,6 +87,8 @@ TABLE_EVENT_TYPES = "event_types"
 TABLE_STATES = "states"
 TABLE_STATE_ATTRIBUTES = "state_attributes"
 TABLE_STATES_META = "states_meta"
+TABLE_STATES_CHECKPOINTS = "states_checkpoints"
+TABLE_LOGBOOK_INDEX = "logbook_index"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 TABLE_STATISTICS = "statistics"
@@ -112,6 +114,8 @@ ALL_TABLES = [
     TABLE_SCHEMA_CHANGES,
     TABLE_MIGRATION_CHANGES,
     TABLE_STATES_META,
+    TABLE_STATES_CHECKPOINTS,
+    TABLE_LOGBOOK_INDEX,
     TABLE_STATISTICS,
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
@@ -127,11 +131,24 @@ TABLES_TO_CHECK = [
 
 LAST_UPDATED_INDEX_TS = "ix_states_last_updated_ts"
 METADATA_ID_LAST_UPDATED_INDEX_TS = "ix_states_metadata_id_last_updated_ts"
+STATES_CHECKPOINTS_START_METADATA_ID_INDEX = (
+    "ix_states_checkpoints_start_ts_metadata_id"
+)
+LOGBOOK_INDEX_ENTITY_ID_TIME_FIRED_TS_INDEX = (
+    "ix_logbook_index_entity_id_time_fired_ts"
+)
+LOGBOOK_INDEX_OLD_ENTITY_ID_TIME_FIRED_TS_INDEX = (
+    "ix_logbook_index_old_entity_id_time_fired_ts"
+)
+LOGBOOK_INDEX_DEVICE_ID_TIME_FIRED_TS_INDEX = (
+    "ix_logbook_index_device_id_time_fired_ts"
+)
 EVENTS_CONTEXT_ID_BIN_INDEX = "ix_events_context_id_bin"
 STATES_CONTEXT_ID_BIN_INDEX = "ix_states_context_id_bin"
 LEGACY_STATES_EVENT_ID_INDEX = "ix_states_event_id"
 LEGACY_STATES_ENTITY_ID_LAST_UPDATED_INDEX = "ix_states_entity_id_last_updated_ts"
 CONTEXT_ID_BIN_MAX_LENGTH = 16
+LOGBOOK_INDEX_DEVICE_ID_MAX_LENGTH = 64
 
 MYSQL_COLLATE = "utf8mb4_unicode_ci"
 MYSQL_DEFAULT_CHARSET = "utf8mb4"
@@ -668,6 +685,102 @@ class StatesMeta(Base):
         )
 
 
+class StatesCheckpoints(Base):
+    """The state of each entity at an hour boundary.
+
+    The rows are written when the hourly statistics are compiled, each
+    row points to the latest state of an entity before start_ts so the
+    states at a point in time can be found without scanning all the
+    states since the recorder run started.
+
+    The state_id has no foreign key, rows pointing to purged states
+    are skipped when joined with the states. The checkpoints after the
+    last_updated of a state which is recorded late are deleted by the
+    recorder.
+    """
+
+    __table_args__ = (
+        # Used for fetching the states at a point in time
+        Index(
+            STATES_CHECKPOINTS_START_METADATA_ID_INDEX,
+            "start_ts",
+            "metadata_id",
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATES_CHECKPOINTS
+    id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    start_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    metadata_id: Mapped[int | None] = mapped_column(
+        ID_TYPE, ForeignKey("states_meta.metadata_id")
+    )
+    state_id: Mapped[int | None] = mapped_column(ID_TYPE)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StatesCheckpoints(id={self.id}, start_ts={self.start_ts},"
+            f" metadata_id={self.metadata_id}, state_id={self.state_id})>"
+        )
+
+
+class LogbookIndex(Base):
+    """The events that refer to an entity or a device.
+
+    The rows are written with the events when the logbook_index option is
+    enabled, so the logbook can find the events of an entity or a device
+    with a range scan instead of matching the event data of every event
+    in the period. The old_entity_id is indexed too, as the logbook matches
+    the events of renamed entities by it.
+
+    The row with no event_id marks the time the index was started, the
+    index only has all the events fired after that time.
+    """
+
+    __table_args__ = (
+        # Used for fetching the events of entities
+        Index(
+            LOGBOOK_INDEX_ENTITY_ID_TIME_FIRED_TS_INDEX,
+            "entity_id",
+            "time_fired_ts",
+        ),
+        # Used for fetching the events of renamed entities
+        Index(
+            LOGBOOK_INDEX_OLD_ENTITY_ID_TIME_FIRED_TS_INDEX,
+            "old_entity_id",
+            "time_fired_ts",
+        ),
+        # Used for fetching the events of devices
+        Index(
+            LOGBOOK_INDEX_DEVICE_ID_TIME_FIRED_TS_INDEX,
+            "device_id",
+            "time_fired_ts",
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_LOGBOOK_INDEX
+    id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    event_id: Mapped[int | None] = mapped_column(ID_TYPE)
+    time_fired_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, index=True)
+    entity_id: Mapped[str | None] = mapped_column(
+        String(MAX_LENGTH_STATE_ENTITY_ID)
+    )
+    old_entity_id: Mapped[str | None] = mapped_column(
+        String(MAX_LENGTH_STATE_ENTITY_ID)
+    )
+    device_id: Mapped[str | None] = mapped_column(
+        String(LOGBOOK_INDEX_DEVICE_ID_MAX_LENGTH)
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.LogbookIndex(id={self.id}, event_id={self.event_id},"
+            f" time_fired_ts={self.time_fired_ts}, entity_id='{self.entity_id}',"
+            f" old_entity_id='{self.old_entity_id}', device_id='{self.device_id}')>"
+        )
+
+
 class StatisticsBase:
     """Statistics base class."""
 
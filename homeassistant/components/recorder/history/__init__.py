@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
 from datetime import datetime
 from typing import Any
 
@@ -13,11 +14,14 @@ from homeassistant.helpers.recorder import get_instance
 from ..filters import Filters
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
+    DEFAULT_STREAM_CHUNK_SIZE,
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_page as _modern_get_significant_states_page,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
+    stream_significant_states as _modern_stream_significant_states,
 )
 
 # These are the APIs of this package
@@ -27,8 +31,10 @@ __all__ = [
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_page",
     "get_significant_states_with_session",
     "state_changes_during_period",
+    "stream_significant_states",
 ]
 
 
@@ -115,6 +121,53 @@ def get_significant_states(
     )
 
 
+def get_significant_states_page(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    limit: int,
+    cursor: tuple[int, float, int] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> tuple[dict[str, list[State | dict[str, Any]]], tuple[int, float, int] | None]:
+    """Return a page of significant states and the cursor of the next page."""
+    if not get_instance(hass).states_meta_manager.active:
+        # The legacy schema is only used until the entity ids are
+        # migrated, all the states are returned in a single page
+        return (
+            get_significant_states(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                compressed_state_format,
+            ),
+            None,
+        )
+    return _modern_get_significant_states_page(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        limit,
+        cursor,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+    )
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -181,3 +234,46 @@ def state_changes_during_period(
         limit,
         include_start_time_state,
     )
+
+
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> Generator[tuple[str, list[State | dict[str, Any]]]]:
+    """Yield the significant states of entities in chunks."""
+    if not get_instance(hass).states_meta_manager.active:
+        # The legacy schema is only used until the entity ids are
+        # migrated, it does not stream the states
+        yield from get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        ).items()
+        return
+    yield from _modern_stream_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+        chunk_size,
+    )
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Generator, Iterable, Iterator
 from datetime import datetime
-from itertools import groupby
+from itertools import chain, groupby, islice
 from operator import itemgetter
 from typing import Any, cast
 
@@ -21,6 +21,8 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -28,7 +30,12 @@ from homeassistant.helpers.recorder import get_instance
 import homeassistant.util.dt as dt_util
 
 from ..const import LAST_REPORTED_SCHEMA_VERSION
-from ..db_schema import SHARED_ATTR_OR_LEGACY_ATTRIBUTES, StateAttributes, States
+from ..db_schema import (
+    SHARED_ATTR_OR_LEGACY_ATTRIBUTES,
+    StateAttributes,
+    States,
+    StatesCheckpoints,
+)
 from ..filters import Filters
 from ..models import (
     LazyState,
@@ -37,6 +44,7 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
+from ..queries import find_states_checkpoint_start
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
     LAST_CHANGED_KEY,
@@ -45,6 +53,9 @@ from .const import (
     STATE_KEY,
 )
 
+# Number of states in the chunks yielded by stream_significant_states
+DEFAULT_STREAM_CHUNK_SIZE = 2048
+
 _FIELD_MAP = {
     "metadata_id": 0,
     "state": 1,
@@ -145,10 +156,23 @@ def _significant_states_stmt(
     no_attributes: bool,
     include_start_time_state: bool,
     run_start_ts: float | None,
+    checkpoint_ts: float | None,
+    cursor_metadata_id: int | None = None,
+    cursor_ts: float | None = None,
+    cursor_state_id: int | None = None,
+    limit: int | None = None,
 ) -> Select | CompoundSelect:
-    """Query the database for significant state changes."""
+    """Query the database for significant state changes.
+
+    When a limit is given at most limit states are selected and the
+    state_id is selected too, it orders the states sharing the same
+    last_updated_ts. When a cursor is given only the states after the
+    (metadata_id, last_updated_ts, state_id) of the cursor are selected.
+    """
     include_last_changed = not significant_changes_only
     stmt = _stmt_and_join_attributes(no_attributes, include_last_changed, False)
+    if limit:
+        stmt = stmt.add_columns(States.state_id)
     if significant_changes_only:
         # Since we are filtering on entity_id (metadata_id) we can avoid
         # the join of the states_meta table since we already know which
@@ -174,31 +198,97 @@ def _significant_states_stmt(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
         )
     if not include_start_time_state or not run_start_ts:
-        return stmt.order_by(States.metadata_id, States.last_updated_ts)
-    unioned_subquery = union_all(
-        _select_from_subquery(
-            _get_start_time_state_stmt(
-                run_start_ts,
-                start_time_ts,
-                single_metadata_id,
-                metadata_ids,
-                no_attributes,
-                include_last_changed,
-            ).subquery(),
+        if cursor_metadata_id:
+            stmt = stmt.filter(
+                _after_cursor(
+                    States.metadata_id,
+                    States.last_updated_ts,
+                    States.state_id,
+                    cursor_metadata_id,
+                    cast(float, cursor_ts),
+                    cast(int, cursor_state_id),
+                )
+            )
+        if not limit:
+            return stmt.order_by(States.metadata_id, States.last_updated_ts)
+        return stmt.order_by(
+            States.metadata_id, States.last_updated_ts, States.state_id
+        ).limit(limit)
+    start_time_state_stmt = _select_from_subquery(
+        _get_start_time_state_stmt(
+            run_start_ts,
+            start_time_ts,
+            single_metadata_id,
+            metadata_ids,
             no_attributes,
             include_last_changed,
-            False,
-        ),
-        _select_from_subquery(
-            stmt.subquery(), no_attributes, include_last_changed, False
-        ),
-    ).subquery()
-    return _select_from_subquery(
+            checkpoint_ts,
+        ).subquery(),
+        no_attributes,
+        include_last_changed,
+        False,
+    )
+    states_subquery = stmt.subquery()
+    states_stmt = _select_from_subquery(
+        states_subquery, no_attributes, include_last_changed, False
+    )
+    if limit:
+        # There is at most one start time state per entity, its
+        # last_updated_ts of 0 already sets it apart
+        start_time_state_stmt = start_time_state_stmt.add_columns(
+            literal(value=0).label("state_id")
+        )
+        states_stmt = states_stmt.add_columns(states_subquery.c.state_id)
+    unioned_subquery = union_all(start_time_state_stmt, states_stmt).subquery()
+    unioned_stmt = _select_from_subquery(
         unioned_subquery,
         no_attributes,
         include_last_changed,
         False,
-    ).order_by(unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts)
+    )
+    if not limit:
+        return unioned_stmt.order_by(
+            unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts
+        )
+    unioned_stmt = unioned_stmt.add_columns(unioned_subquery.c.state_id)
+    if cursor_metadata_id:
+        unioned_stmt = unioned_stmt.filter(
+            _after_cursor(
+                unioned_subquery.c.metadata_id,
+                unioned_subquery.c.last_updated_ts,
+                unioned_subquery.c.state_id,
+                cursor_metadata_id,
+                cast(float, cursor_ts),
+                cast(int, cursor_state_id),
+            )
+        )
+    return unioned_stmt.order_by(
+        unioned_subquery.c.metadata_id,
+        unioned_subquery.c.last_updated_ts,
+        unioned_subquery.c.state_id,
+    ).limit(limit)
+
+
+def _after_cursor(
+    metadata_id: ColumnElement[int | None],
+    last_updated_ts: ColumnElement[float | None],
+    state_id: ColumnElement[int],
+    cursor_metadata_id: int,
+    cursor_ts: float,
+    cursor_state_id: int,
+) -> ColumnElement[bool]:
+    """Match the states after a (metadata_id, last_updated_ts, state_id) cursor.
+
+    The state_id orders the states of an entity sharing the same
+    last_updated_ts, none of them is skipped at the end of a page.
+    """
+    return (metadata_id > cursor_metadata_id) | (
+        (metadata_id == cursor_metadata_id)
+        & (
+            (last_updated_ts > cursor_ts)
+            | ((last_updated_ts == cursor_ts) & (state_id > cursor_state_id))
+        )
+    )
 
 
 def get_significant_states_with_session(
@@ -227,6 +317,49 @@ def get_significant_states_with_session(
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, entity_id_to_metadata_id, start_time_ts = query
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts,
+        cast(list[str], entity_ids),
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    cursor: tuple[int, float, int] | None = None,
+    limit: int | None = None,
+) -> tuple[StatementLambdaElement, dict[str, int | None], float | None] | None:
+    """Return the statement to fetch the significant states of entities.
+
+    The entity_id to metadata_id map and the start time timestamp, or None
+    if the start time states are not included, are returned along with the
+    statement. None is returned if none of the entities have been recorded.
+    """
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
     entity_id_to_metadata_id: dict[str, int | None] | None = None
@@ -237,7 +370,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -254,6 +387,14 @@ def get_significant_states_with_session(
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
+    checkpoint_ts: float | None = None
+    if include_start_time_state and not single_metadata_id:
+        # Start from the newest states checkpoint instead of scanning
+        # all the states since the run started
+        checkpoint_ts = session.execute(
+            find_states_checkpoint_start(cast(float, run_start_ts), start_time_ts)
+        ).scalar()
+    cursor_metadata_id, cursor_ts, cursor_state_id = cursor or (None, None, None)
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
             start_time_ts,
@@ -265,6 +406,11 @@ def get_significant_states_with_session(
             no_attributes,
             include_start_time_state,
             run_start_ts,
+            checkpoint_ts,
+            cursor_metadata_id,
+            cursor_ts,
+            cursor_state_id,
+            limit,
         ),
         track_on=[
             bool(single_metadata_id),
@@ -273,16 +419,131 @@ def get_significant_states_with_session(
             significant_changes_only,
             no_attributes,
             include_start_time_state,
+            checkpoint_ts is not None,
+            cursor is not None,
+            bool(limit),
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    return (
+        stmt,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
+    )
+
+
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> Generator[tuple[str, list[State | dict[str, Any]]]]:
+    """Yield the significant states of entities in chunks.
+
+    This is the streaming variant of get_significant_states, the rows are
+    fetched from a server side cursor and converted to (entity_id, states)
+    chunks of at most chunk_size states, so the whole period does not
+    have to be held in memory. The chunks of an entity are yielded in
+    order, entities without states are not yielded.
+
+    The generator holds a database session and must be consumed in
+    the thread it was started in.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            query := _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return
+        stmt, entity_id_to_metadata_id, start_time_ts = query
+        rows = session.connection().execute(
+            stmt, execution_options={"yield_per": chunk_size}
+        )
+        yield from _sorted_states_to_entity_chunks(
+            rows,
+            start_time_ts,
+            cast(list[str], entity_ids),
+            entity_id_to_metadata_id,
+            minimal_response,
+            compressed_state_format,
+            no_attributes,
+            chunk_size,
+        )
+
+
+def get_significant_states_page(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    limit: int,
+    cursor: tuple[int, float, int] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> tuple[dict[str, list[State | dict[str, Any]]], tuple[int, float, int] | None]:
+    """Return a page of at most limit significant states of entities.
+
+    The states are ordered by entity and last_updated like with
+    get_significant_states. The page starts after the (metadata_id,
+    last_updated_ts, state_id) cursor of the previous page, the cursor
+    of the next page is returned with the states, or None after the
+    last page.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            query := _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+                cursor,
+                # One more row is fetched to know if there is a next page
+                limit + 1,
+            )
+        ):
+            return {}, None
+        stmt, entity_id_to_metadata_id, start_time_ts = query
+        rows = execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    next_cursor: tuple[int, float, int] | None = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_row = rows[-1]
+        next_cursor = (
+            last_row[_FIELD_MAP["metadata_id"]],
+            last_row[_FIELD_MAP["last_updated_ts"]],
+            last_row.state_id,
+        )
+    return (
+        _sorted_states_to_dict(
+            rows,
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            compressed_state_format,
+            no_attributes=no_attributes,
+        ),
+        next_cursor,
     )
 
 
@@ -556,30 +817,58 @@ def _get_start_time_state_for_entities_stmt(
     metadata_ids: list[int],
     no_attributes: bool,
     include_last_changed: bool,
+    checkpoint_ts: float | None,
 ) -> Select:
     """Baked query to get states for specific entities."""
     # We got an include-list of entities, accelerate the query by filtering already
     # in the inner and the outer query.
+    if not checkpoint_ts:
+        most_recent_states_for_entities_by_date = (
+            select(
+                States.metadata_id.label("max_metadata_id"),
+                func.max(States.last_updated_ts).label("max_last_updated"),
+            )
+            .filter(
+                (States.last_updated_ts >= run_start_ts)
+                & (States.last_updated_ts < epoch_time)
+                & States.metadata_id.in_(metadata_ids)
+            )
+            .group_by(States.metadata_id)
+            .subquery()
+        )
+    else:
+        # The states at the checkpoint and the states since then are the
+        # only candidates, the outer query drops the states of the
+        # checkpoint which were recorded before the run started.
+        candidate_states = union_all(
+            select(States.metadata_id, States.last_updated_ts).filter(
+                (States.last_updated_ts >= checkpoint_ts)
+                & (States.last_updated_ts < epoch_time)
+                & States.metadata_id.in_(metadata_ids)
+            ),
+            select(States.metadata_id, States.last_updated_ts)
+            .join(StatesCheckpoints, StatesCheckpoints.state_id == States.state_id)
+            .filter(
+                (StatesCheckpoints.start_ts == checkpoint_ts)
+                & StatesCheckpoints.metadata_id.in_(metadata_ids)
+            ),
+        ).subquery()
+        most_recent_states_for_entities_by_date = (
+            select(
+                candidate_states.c.metadata_id.label("max_metadata_id"),
+                func.max(candidate_states.c.last_updated_ts).label(
+                    "max_last_updated"
+                ),
+            )
+            .group_by(candidate_states.c.metadata_id)
+            .subquery()
+        )
     stmt = (
         _stmt_and_join_attributes_for_start_state(
             no_attributes, include_last_changed, False
         )
         .join(
-            (
-                most_recent_states_for_entities_by_date := (
-                    select(
-                        States.metadata_id.label("max_metadata_id"),
-                        func.max(States.last_updated_ts).label("max_last_updated"),
-                    )
-                    .filter(
-                        (States.last_updated_ts >= run_start_ts)
-                        & (States.last_updated_ts < epoch_time)
-                        & States.metadata_id.in_(metadata_ids)
-                    )
-                    .group_by(States.metadata_id)
-                    .subquery()
-                )
-            ),
+            most_recent_states_for_entities_by_date,
             and_(
                 States.metadata_id
                 == most_recent_states_for_entities_by_date.c.max_metadata_id,
@@ -621,6 +910,7 @@ def _get_start_time_state_stmt(
     metadata_ids: list[int],
     no_attributes: bool,
     include_last_changed: bool,
+    checkpoint_ts: float | None,
 ) -> Select:
     """Return the states at a specific point in time."""
     if single_metadata_id:
@@ -641,6 +931,7 @@ def _get_start_time_state_stmt(
         metadata_ids,
         no_attributes,
         include_last_changed,
+        checkpoint_ts,
     )
 
 
@@ -671,26 +962,25 @@ def _get_single_entity_start_time_stmt(
     )
 
 
-def _sorted_states_to_dict(
+def _sorted_states_to_entity_chunks(
     states: Iterable[Row],
     start_time_ts: float | None,
     entity_ids: list[str],
     entity_id_to_metadata_id: dict[str, int | None],
     minimal_response: bool = False,
     compressed_state_format: bool = False,
-    descending: bool = False,
     no_attributes: bool = False,
-) -> dict[str, list[State | dict[str, Any]]]:
-    """Convert SQL results into JSON friendly data structure.
+    chunk_size: int | None = None,
+) -> Generator[tuple[str, list[State | dict[str, Any]]]]:
+    """Convert SQL results into lists of states per entity.
 
-    This takes our state list and turns it into a JSON friendly data
-    structure {'entity_id': [list of states], 'entity_id2': [list of states]}
+    States must be sorted by entity_id and last_updated, the lists
+    are yielded in that order. When a chunk_size is given the states
+    of an entity are yielded in lists of at most chunk_size states.
 
-    States must be sorted by entity_id and last_updated
-
-    We also need to go back and create a synthetic zero data point for
-    each list of states, otherwise our graphs won't start on the Y
-    axis correctly.
+    With minimal response only the first state of an entity is a
+    native State, the other states only provide the "state" and the
+    "last_changed".
     """
     field_map = _FIELD_MAP
     state_class: Callable[
@@ -706,11 +996,6 @@ def _sorted_states_to_dict(
         attr_time = LAST_CHANGED_KEY
         attr_state = STATE_KEY
 
-    # Set all entity IDs to empty lists in result set to maintain the order
-    result: dict[str, list[State | dict[str, Any]]] = {
-        entity_id: [] for entity_id in entity_ids
-    }
-    metadata_id_to_entity_id: dict[int, str] = {}
     metadata_id_to_entity_id = {
         v: k for k, v in entity_id_to_metadata_id.items() if v is not None
     }
@@ -727,88 +1012,114 @@ def _sorted_states_to_dict(
 
     state_idx = field_map["state"]
     last_updated_ts_idx = field_map["last_updated_ts"]
+    _utc_from_timestamp = dt_util.utc_from_timestamp
 
-    # Append all changes to it
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
         attr_cache: dict[str, dict[str, Any]] = {}
-        ent_results = result[entity_id]
+        ent_results: Iterator[State | dict[str, Any]]
         if (
             not minimal_response
             or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
         ):
-            ent_results.extend(
-                [
-                    state_class(
-                        db_state,
-                        attr_cache,
-                        start_time_ts,
-                        entity_id,
-                        db_state[state_idx],
-                        db_state[last_updated_ts_idx],
-                        False,
-                    )
-                    for db_state in group
-                ]
-            )
-            continue
-
-        prev_state: str | None = None
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            if (first_state := next(group, None)) is None:
-                continue
-            prev_state = first_state[state_idx]
-            ent_results.append(
+            ent_results = (
                 state_class(
-                    first_state,
+                    db_state,
                     attr_cache,
                     start_time_ts,
                     entity_id,
-                    prev_state,  # type: ignore[arg-type]
-                    first_state[last_updated_ts_idx],
-                    no_attributes,
+                    db_state[state_idx],
+                    db_state[last_updated_ts_idx],
+                    False,
                 )
+                for db_state in group
             )
-
-        #
-        # minimal_response only makes sense with last_updated == last_updated
-        #
-        # We use last_updated for for last_changed since its the same
-        #
-        # With minimal response we do not care about attribute
-        # changes so we can filter out duplicate states
-        if compressed_state_format:
-            # Compressed state format uses the timestamp directly
-            ent_results.extend(
-                [
+        else:
+            if (first_state := next(group, None)) is None:
+                continue
+            prev_state: str | None = first_state[state_idx]
+            first = state_class(
+                first_state,
+                attr_cache,
+                start_time_ts,
+                entity_id,
+                prev_state,  # type: ignore[arg-type]
+                first_state[last_updated_ts_idx],
+                no_attributes,
+            )
+            #
+            # minimal_response only makes sense with last_updated == last_updated
+            #
+            # We use last_updated for for last_changed since its the same
+            #
+            # With minimal response we do not care about attribute
+            # changes so we can filter out duplicate states
+            if compressed_state_format:
+                # Compressed state format uses the timestamp directly
+                changes: Iterator[dict[str, Any]] = (
                     {
                         attr_state: (prev_state := state),
                         attr_time: row[last_updated_ts_idx],
                     }
                     for row in group
                     if (state := row[state_idx]) != prev_state
-                ]
-            )
+                )
+            else:
+                # Non-compressed state format returns an ISO formatted string
+                changes = (
+                    {
+                        attr_state: (prev_state := state),
+                        attr_time: _utc_from_timestamp(
+                            row[last_updated_ts_idx]
+                        ).isoformat(),
+                    }
+                    for row in group
+                    if (state := row[state_idx]) != prev_state
+                )
+            ent_results = chain((first,), changes)
+
+        if chunk_size is None:
+            yield entity_id, list(ent_results)
             continue
+        while chunk := list(islice(ent_results, chunk_size)):
+            yield entity_id, chunk
 
-        # Non-compressed state format returns an ISO formatted string
-        _utc_from_timestamp = dt_util.utc_from_timestamp
-        ent_results.extend(
-            [
-                {
-                    attr_state: (prev_state := state),
-                    attr_time: _utc_from_timestamp(
-                        row[last_updated_ts_idx]
-                    ).isoformat(),
-                }
-                for row in group
-                if (state := row[state_idx]) != prev_state
-            ]
-        )
+
+def _sorted_states_to_dict(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool = False,
+    compressed_state_format: bool = False,
+    descending: bool = False,
+    no_attributes: bool = False,
+) -> dict[str, list[State | dict[str, Any]]]:
+    """Convert SQL results into JSON friendly data structure.
+
+    This takes our state list and turns it into a JSON friendly data
+    structure {'entity_id': [list of states], 'entity_id2': [list of states]}
+
+    States must be sorted by entity_id and last_updated
+
+    We also need to go back and create a synthetic zero data point for
+    each list of states, otherwise our graphs won't start on the Y
+    axis correctly.
+    """
+    # Set all entity IDs to empty lists in result set to maintain the order
+    result: dict[str, list[State | dict[str, Any]]] = {
+        entity_id: [] for entity_id in entity_ids
+    }
+    for entity_id, ent_results in _sorted_states_to_entity_chunks(
+        states,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes,
+    ):
+        result[entity_id].extend(ent_results)
 
     if descending:
         for ent_results in result.values():
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import contextlib
 from dataclasses import dataclass, replace as dataclass_replace
 from datetime import timedelta
 import logging
-from time import time
+from time import monotonic, time
 from typing import TYPE_CHECKING, Any, cast, final
 from uuid import UUID
 
@@ -73,6 +74,7 @@ from .db_schema import (
     MigrationChanges,
     SchemaChanges,
     States,
+    StatesCheckpoints,
     StatesMeta,
     Statistics,
     StatisticsMeta,
@@ -83,6 +85,11 @@ from .models import process_timestamp
 from .models.time import datetime_to_timestamp_or_none
 from .queries import (
     batch_cleanup_entity_ids,
+    count_entity_ids_to_migrate,
+    count_event_types_to_migrate,
+    count_events_context_ids_to_migrate,
+    count_states_context_ids_to_migrate,
+    delete_all_logbook_index_rows,
     delete_duplicate_short_term_statistics_row,
     delete_duplicate_statistics_row,
     find_entity_ids_to_migrate,
@@ -129,6 +136,13 @@ MIGRATION_NOTE_MINUTES = (
 )
 MIGRATION_NOTE_WHILE = "This will take a while; please be patient!"
 
+# The number of rows updated at once and the number of connections
+# updating them in parallel when backfilling columns, InnoDB takes next-key
+# locks on the ranges so MySQL updates them with a single connection
+MIGRATION_BATCH_SIZE = 100000
+MIGRATION_WORKERS = 4
+MIGRATION_WORKERS_MYSQL = 1
+
 _EMPTY_ENTITY_ID = "missing.entity_id"
 _EMPTY_EVENT_TYPE = "missing_event_type"
 
@@ -1758,6 +1772,30 @@ class _SchemaVersion47Migrator(_SchemaVersionMigrator, target_version=47):
         )
 
 
+class _SchemaVersion48Migrator(_SchemaVersionMigrator, target_version=48):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The table is already there if create_all created it when connecting
+        cast(Table, StatesCheckpoints.__table__).create(self.engine, checkfirst=True)
+
+
+class _SchemaVersion49Migrator(_SchemaVersionMigrator, target_version=49):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        _add_columns(
+            self.session_maker, "logbook_index", ["old_entity_id VARCHAR(255)"]
+        )
+        _create_index(
+            self.session_maker,
+            "logbook_index",
+            "ix_logbook_index_old_entity_id_time_fired_ts",
+        )
+        # The rows written before have no old_entity_id, the index is
+        # started over so the events of renamed entities are not missed
+        with session_scope(session=self.session_maker()) as session:
+            session.execute(delete_all_logbook_index_rows())
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -1883,7 +1921,6 @@ def _migrate_columns_to_timestamp(
     # Migrate all data in Events.time_fired to Events.time_fired_ts
     # Migrate all data in States.last_updated to States.last_updated_ts
     # Migrate all data in States.last_changed to States.last_changed_ts
-    result: CursorResult | None = None
     if engine.dialect.name == SupportedDialect.SQLITE:
         # With SQLite we do this in one go since it is faster
         with session_scope(session=session_maker()) as session:
@@ -1903,65 +1940,126 @@ def _migrate_columns_to_timestamp(
                 )
             )
     elif engine.dialect.name == SupportedDialect.MYSQL:
-        # With MySQL we do this in chunks to avoid hitting the `innodb_buffer_pool_size` limit
-        # We also need to do this in a loop since we can't be sure that we have
-        # updated all rows in the table until the rowcount is 0
-        while result is None or result.rowcount > 0:
-            with session_scope(session=session_maker()) as session:
-                result = session.connection().execute(
-                    text(
-                        "UPDATE events set time_fired_ts="
-                        "IF(time_fired is NULL or UNIX_TIMESTAMP(time_fired) is NULL,0,"
-                        "UNIX_TIMESTAMP(time_fired)"
-                        ") "
-                        "where time_fired_ts is NULL "
-                        "LIMIT 100000;"
-                    )
-                )
-        result = None
-        while result is None or result.rowcount > 0:  # type: ignore[unreachable]
-            with session_scope(session=session_maker()) as session:
-                result = session.connection().execute(
-                    text(
-                        "UPDATE states set last_updated_ts="
-                        "IF(last_updated is NULL or UNIX_TIMESTAMP(last_updated) is NULL,0,"
-                        "UNIX_TIMESTAMP(last_updated) "
-                        "), "
-                        "last_changed_ts="
-                        "UNIX_TIMESTAMP(last_changed) "
-                        "where last_updated_ts is NULL "
-                        "LIMIT 100000;"
-                    )
-                )
+        # With MySQL we do this in ranges of rows to avoid hitting the
+        # `innodb_buffer_pool_size` limit
+        _migrate_table_to_timestamp_in_ranges(
+            instance,
+            session_maker,
+            "events",
+            "event_id",
+            "time_fired_ts",
+            "UPDATE events set time_fired_ts="
+            "IF(time_fired is NULL or UNIX_TIMESTAMP(time_fired) is NULL,0,"
+            "UNIX_TIMESTAMP(time_fired)"
+            ") "
+            "where event_id >= :start and event_id < :end "
+            "and time_fired_ts is NULL;",
+        )
+        _migrate_table_to_timestamp_in_ranges(
+            instance,
+            session_maker,
+            "states",
+            "state_id",
+            "last_updated_ts",
+            "UPDATE states set last_updated_ts="
+            "IF(last_updated is NULL or UNIX_TIMESTAMP(last_updated) is NULL,0,"
+            "UNIX_TIMESTAMP(last_updated) "
+            "), "
+            "last_changed_ts="
+            "UNIX_TIMESTAMP(last_changed) "
+            "where state_id >= :start and state_id < :end "
+            "and last_updated_ts is NULL;",
+        )
     elif engine.dialect.name == SupportedDialect.POSTGRESQL:
-        # With Postgresql we do this in chunks to avoid using too much memory
-        # We also need to do this in a loop since we can't be sure that we have
-        # updated all rows in the table until the rowcount is 0
-        while result is None or result.rowcount > 0:
-            with session_scope(session=session_maker()) as session:
-                result = session.connection().execute(
-                    text(
-                        "UPDATE events SET "
-                        "time_fired_ts= "
-                        "(case when time_fired is NULL then 0 else EXTRACT(EPOCH FROM time_fired::timestamptz) end) "
-                        "WHERE event_id IN ( "
-                        "SELECT event_id FROM events where time_fired_ts is NULL LIMIT 100000 "
-                        " );"
-                    )
+        # With Postgresql we do this in ranges of rows to avoid using too much memory
+        _migrate_table_to_timestamp_in_ranges(
+            instance,
+            session_maker,
+            "events",
+            "event_id",
+            "time_fired_ts",
+            "UPDATE events SET "
+            "time_fired_ts= "
+            "(case when time_fired is NULL then 0 else EXTRACT(EPOCH FROM time_fired::timestamptz) end) "
+            "WHERE event_id >= :start AND event_id < :end "
+            "AND time_fired_ts is NULL;",
+        )
+        _migrate_table_to_timestamp_in_ranges(
+            instance,
+            session_maker,
+            "states",
+            "state_id",
+            "last_updated_ts",
+            "UPDATE states set last_updated_ts="
+            "(case when last_updated is NULL then 0 else EXTRACT(EPOCH FROM last_updated::timestamptz) end), "
+            "last_changed_ts=EXTRACT(EPOCH FROM last_changed::timestamptz) "
+            "where state_id >= :start AND state_id < :end "
+            "AND last_updated_ts is NULL;",
+        )
+
+
+def _migrate_table_to_timestamp_in_ranges(
+    instance: Recorder,
+    session_maker: Callable[[], Session],
+    table: str,
+    id_column: str,
+    timestamp_column: str,
+    update_statement: str,
+) -> None:
+    """Migrate the rows of a table to timestamps in parallel ranges of ids.
+
+    The ranges start at the first row which is not migrated yet, so an
+    interrupted migration resumes where it stopped. The ranges do not
+    overlap and are updated by MIGRATION_WORKERS connections in parallel,
+    a range which fails with a deadlock or a lock wait timeout is retried.
+    """
+    with session_scope(session=session_maker()) as session:
+        first_id, last_id, rows_total = (
+            session.connection()
+            .execute(
+                text(
+                    f"SELECT MIN({id_column}), MAX({id_column}), COUNT(*) "  # noqa: S608
+                    f"FROM {table} WHERE {timestamp_column} is NULL;"
                 )
-        result = None
-        while result is None or result.rowcount > 0:  # type: ignore[unreachable]
-            with session_scope(session=session_maker()) as session:
-                result = session.connection().execute(
-                    text(
-                        "UPDATE states set last_updated_ts="
-                        "(case when last_updated is NULL then 0 else EXTRACT(EPOCH FROM last_updated::timestamptz) end), "
-                        "last_changed_ts=EXTRACT(EPOCH FROM last_changed::timestamptz) "
-                        "where state_id IN ( "
-                        "SELECT state_id FROM states where last_updated_ts is NULL LIMIT 100000 "
-                        " );"
-                    )
+            )
+            .one()
+        )
+    if first_id is None:
+        return
+    progress = MigrationProgress(f"{table}_{timestamp_column}", rows_total)
+    instance.migration_progress = progress
+    statement = text(update_statement)
+    rows_migrated: dict[int, int] = {}
+
+    @database_job_retry_wrapper(f"Migrate {table} range to timestamp")
+    def _migrate_range(instance: Recorder, start: int) -> None:
+        with session_scope(session=session_maker()) as session:
+            rows_migrated[start] = (
+                session.connection()
+                .execute(
+                    statement, {"start": start, "end": start + MIGRATION_BATCH_SIZE}
                 )
+                .rowcount
+            )
+
+    assert instance.engine is not None
+    executor = ThreadPoolExecutor(
+        max_workers=MIGRATION_WORKERS_MYSQL
+        if instance.engine.dialect.name == SupportedDialect.MYSQL
+        else MIGRATION_WORKERS,
+        thread_name_prefix="RecorderMigration",
+    )
+    try:
+        futures = {
+            executor.submit(_migrate_range, instance, start): start
+            for start in range(first_id, last_id + 1, MIGRATION_BATCH_SIZE)
+        }
+        for future in as_completed(futures):
+            future.result()
+            progress.record(rows_migrated.pop(futures[future]))
+    finally:
+        executor.shutdown(cancel_futures=True)
+        instance.migration_progress = None
 
 
 @database_job_retry_wrapper("Migrate statistics columns to timestamp one by one", 3)
@@ -2194,6 +2292,60 @@ class DataMigrationStatus:
 
     needs_migrate: bool
     migration_done: bool
+    rows_migrated: int = 0
+
+
+class MigrationProgress:
+    """Track the progress of a data migration.
+
+    The rows to migrate are counted once when the migration starts, the
+    rows migrated since are used to report the migration rate and an
+    estimate of the remaining time while the migration runs.
+
+    This class is only updated from the recorder thread.
+    """
+
+    __slots__ = ("migration_id", "rows_migrated", "rows_total", "started")
+
+    def __init__(self, migration_id: str, rows_total: int) -> None:
+        """Initialize the progress."""
+        self.migration_id = migration_id
+        self.rows_total = rows_total
+        self.rows_migrated = 0
+        self.started = monotonic()
+
+    def record(self, rows: int) -> None:
+        """Record the number of rows migrated."""
+        self.rows_migrated += rows
+
+    @property
+    def rows_remaining(self) -> int:
+        """Return the estimated number of rows left to migrate."""
+        return max(self.rows_total - self.rows_migrated, 0)
+
+    @property
+    def rows_per_second(self) -> float | None:
+        """Return the number of rows migrated per second."""
+        if not (elapsed := monotonic() - self.started):
+            return None
+        return self.rows_migrated / elapsed
+
+    @property
+    def eta(self) -> float | None:
+        """Return the estimated number of seconds until the migration is done."""
+        if not (rows_per_second := self.rows_per_second):
+            return None
+        return self.rows_remaining / rows_per_second
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress of the migration."""
+        return {
+            "migration_id": self.migration_id,
+            "rows_migrated": self.rows_migrated,
+            "rows_remaining": self.rows_remaining,
+            "rows_per_second": self.rows_per_second,
+            "eta": self.eta,
+        }
 
 
 class BaseRunTimeMigration(ABC):
@@ -2220,7 +2372,12 @@ class BaseRunTimeMigration(ABC):
     @retryable_database_job_method("migrate data")
     def migrate_data(self, instance: Recorder) -> bool:
         """Migrate some data, returns True if migration is completed."""
+        progress = self._get_progress(instance)
         status = self.migrate_data_impl(instance)
+        if progress is not None:
+            progress.record(status.rows_migrated)
+        if not status.needs_migrate:
+            instance.migration_progress = None
         if status.migration_done:
             if self.index_to_drop is not None:
                 table, index = self.index_to_drop
@@ -2230,6 +2387,24 @@ class BaseRunTimeMigration(ABC):
                 _mark_migration_done(session, self.__class__)
         return not status.needs_migrate
 
+    def _get_progress(self, instance: Recorder) -> MigrationProgress | None:
+        """Return the progress of the migration, counting the rows when it starts."""
+        if (
+            progress := instance.migration_progress
+        ) is not None and progress.migration_id == self.migration_id:
+            return progress
+        if (count_query := self.count_rows_query()) is None:
+            return None
+        with session_scope(session=instance.get_session()) as session:
+            rows_total = session.execute(count_query).scalar() or 0
+        progress = MigrationProgress(self.migration_id, rows_total)
+        instance.migration_progress = progress
+        return progress
+
+    def count_rows_query(self) -> StatementLambdaElement | None:
+        """Return the query to count the rows to migrate, if they can be counted."""
+        return None
+
     @abstractmethod
     def migrate_data_impl(self, instance: Recorder) -> DataMigrationStatus:
         """Migrate some data, return if the migration needs to run and if it is done."""
@@ -2326,7 +2501,13 @@ class StatesContextIDMigration(BaseRunTimeMigrationWithQuery):
             is_done = not states
 
         _LOGGER.debug("Migrating states context_ids to binary format: done=%s", is_done)
-        return DataMigrationStatus(needs_migrate=not is_done, migration_done=is_done)
+        return DataMigrationStatus(
+            needs_migrate=not is_done, migration_done=is_done, rows_migrated=len(states)
+        )
+
+    def count_rows_query(self) -> StatementLambdaElement:
+        """Return the query to count the rows to migrate."""
+        return count_states_context_ids_to_migrate()
 
     def needs_migrate_query(self) -> StatementLambdaElement:
         """Return the query to check if the migration needs to run."""
@@ -2369,7 +2550,13 @@ class EventsContextIDMigration(BaseRunTimeMigrationWithQuery):
             is_done = not events
 
         _LOGGER.debug("Migrating events context_ids to binary format: done=%s", is_done)
-        return DataMigrationStatus(needs_migrate=not is_done, migration_done=is_done)
+        return DataMigrationStatus(
+            needs_migrate=not is_done, migration_done=is_done, rows_migrated=len(events)
+        )
+
+    def count_rows_query(self) -> StatementLambdaElement:
+        """Return the query to count the rows to migrate."""
+        return count_events_context_ids_to_migrate()
 
     def needs_migrate_query(self) -> StatementLambdaElement:
         """Return the query to check if the migration needs to run."""
@@ -2442,13 +2629,19 @@ class EventTypeIDMigration(BaseRunTimeMigrationWithQuery):
             is_done = not events
 
         _LOGGER.debug("Migrating event_types done=%s", is_done)
-        return DataMigrationStatus(needs_migrate=not is_done, migration_done=is_done)
+        return DataMigrationStatus(
+            needs_migrate=not is_done, migration_done=is_done, rows_migrated=len(events)
+        )
 
     def migration_done(self, instance: Recorder, session: Session) -> None:
         """Will be called after migrate returns True."""
         _LOGGER.debug("Activating event_types manager as all data is migrated")
         instance.event_type_manager.active = True
 
+    def count_rows_query(self) -> StatementLambdaElement:
+        """Return the query to count the rows to migrate."""
+        return count_event_types_to_migrate()
+
     def needs_migrate_query(self) -> StatementLambdaElement:
         """Check if the data is migrated."""
         return has_event_type_to_migrate()
@@ -2530,7 +2723,9 @@ class EntityIDMigration(BaseRunTimeMigrationWithQuery):
             is_done = not states
 
         _LOGGER.debug("Migrating entity_ids done=%s", is_done)
-        return DataMigrationStatus(needs_migrate=not is_done, migration_done=is_done)
+        return DataMigrationStatus(
+            needs_migrate=not is_done, migration_done=is_done, rows_migrated=len(states)
+        )
 
     def migration_done(self, instance: Recorder, session: Session) -> None:
         """Will be called after migrate returns True."""
@@ -2544,6 +2739,10 @@ class EntityIDMigration(BaseRunTimeMigrationWithQuery):
             migrate = EntityIDPostMigration(self.schema_version, self.migration_changes)
             migrate.do_migrate(instance, session)
 
+    def count_rows_query(self) -> StatementLambdaElement:
+        """Return the query to count the rows to migrate."""
+        return count_entity_ids_to_migrate()
+
     def needs_migrate_query(self) -> StatementLambdaElement:
         """Check if the data is migrated."""
         return has_entity_ids_to_migrate()
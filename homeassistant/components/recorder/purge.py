@@ -7,7 +7,7 @@ from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
@@ -23,8 +23,11 @@ from .queries import (
     delete_event_data_rows,
     delete_event_rows,
     delete_event_types_rows,
+    delete_logbook_index_rows,
     delete_recorder_runs_rows,
     delete_states_attributes_rows,
+    delete_states_checkpoints_rows,
+    delete_states_checkpoints_rows_for_metadata_ids,
     delete_states_meta_rows,
     delete_states_rows,
     delete_statistics_runs_rows,
@@ -33,6 +36,7 @@ from .queries import (
     find_entity_ids_to_purge,
     find_event_types_to_purge,
     find_events_to_purge,
+    find_ids_range_to_purge,
     find_latest_statistics_runs_run_id,
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
@@ -52,6 +56,88 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
+# Seconds a purge task may spend deleting rows before it yields to the
+# other recorder tasks, the purge continues with the next purge task
+DEFAULT_PURGE_TIME_BUDGET = 2.0
+
+
+class PurgeProgress:
+    """Track the progress of a purge spread over several purge tasks.
+
+    The rows to purge are estimated once when the purge starts, every purge
+    task then adds the rows it deleted so the remaining rows and an
+    estimate of the remaining time can be reported while the purge runs.
+    The attributes and data ids which were not checked for use before the
+    time budget of a purge task was spent are kept for the next one.
+
+    This class is only updated from the recorder thread.
+    """
+
+    __slots__ = (
+        "attributes_ids",
+        "data_ids",
+        "deadline",
+        "purge_before",
+        "rows_purged",
+        "rows_total",
+        "slice_rows",
+        "slices",
+        "started",
+    )
+
+    def __init__(self, purge_before: datetime, rows_total: int) -> None:
+        """Initialize the progress."""
+        self.purge_before = purge_before
+        self.rows_total = rows_total
+        self.rows_purged = 0
+        self.slice_rows = 0
+        self.slices = 0
+        self.started = time.monotonic()
+        self.deadline = self.started
+        self.attributes_ids: set[int] = set()
+        self.data_ids: set[int] = set()
+
+    def start_slice(self, time_budget: float) -> None:
+        """Start a purge task which may run for time_budget seconds."""
+        self.slices += 1
+        self.slice_rows = 0
+        self.deadline = time.monotonic() + time_budget
+
+    @property
+    def slice_expired(self) -> bool:
+        """Return if the current purge task should yield to other tasks.
+
+        A purge task always deletes some rows before it yields, even if
+        the time budget is spent, to make sure the purge completes.
+        """
+        return self.slice_rows > 0 and time.monotonic() >= self.deadline
+
+    def record(self, rows: int) -> None:
+        """Record the number of rows deleted."""
+        self.slice_rows += rows
+        self.rows_purged += rows
+
+    @property
+    def rows_remaining(self) -> int:
+        """Return the estimated number of rows left to purge."""
+        return max(self.rows_total - self.rows_purged, 0)
+
+    @property
+    def eta(self) -> float | None:
+        """Return the estimated number of seconds until the purge is done."""
+        if not self.rows_purged:
+            return None
+        elapsed = time.monotonic() - self.started
+        return elapsed / self.rows_purged * self.rows_remaining
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress of the purge."""
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "rows_purged": self.rows_purged,
+            "rows_remaining": self.rows_remaining,
+            "eta": self.eta,
+        }
 
 
 @retryable_database_job("purge")
@@ -62,16 +148,20 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    time_budget: float = DEFAULT_PURGE_TIME_BUDGET,
 ) -> bool:
     """Purge events and states older than purge_before.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    Deletes at most the given number of batches and stops as soon as
+    time_budget seconds are spent, returns False if there is more to purge.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
     with session_scope(session=instance.get_session()) as session:
+        progress = _get_purge_progress(instance, session, purge_before)
+        progress.start_slice(time_budget)
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
         if instance.use_legacy_events_index and _purging_legacy_format(session):
@@ -79,7 +169,9 @@ def purge_old_data(
                 "Purge running in legacy format as there are states with event_id"
                 " remaining"
             )
-            has_more_to_purge |= _purge_legacy_format(instance, session, purge_before)
+            has_more_to_purge |= _purge_legacy_format(
+                instance, session, purge_before, progress
+            )
         else:
             _LOGGER.debug(
                 "Purge running in new format as there are NO states with event_id"
@@ -87,10 +179,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, progress
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, progress
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -123,18 +215,55 @@ def purge_old_data(
             _purge_old_entity_ids(instance, session)
 
         _purge_old_recorder_runs(instance, session, purge_before)
+        _purge_old_states_checkpoints(session, purge_before)
+        if instance.logbook_index:
+            _purge_old_logbook_index(session, purge_before)
+    instance.purge_progress = None
     if repack:
         repack_database(instance)
     return True
 
 
+def _get_purge_progress(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> PurgeProgress:
+    """Return the progress of the purge, estimating the rows when it starts.
+
+    The ids grow with time so the rows to purge are estimated from the
+    oldest id and the newest id older than purge_before of each table,
+    which only takes an index lookup instead of counting the rows.
+    """
+    if (
+        old_progress := instance.purge_progress
+    ) is not None and old_progress.purge_before == purge_before:
+        return old_progress
+    first_state_id, last_state_id, first_event_id, last_event_id = session.execute(
+        find_ids_range_to_purge(purge_before.timestamp())
+    ).one()
+    rows_total = 0
+    if first_state_id is not None and last_state_id is not None:
+        rows_total += last_state_id - first_state_id + 1
+    if first_event_id is not None and last_event_id is not None:
+        rows_total += last_event_id - first_event_id + 1
+    progress = PurgeProgress(purge_before, rows_total)
+    if old_progress is not None:
+        # The ids left to check by the previous purge are still unchecked
+        progress.attributes_ids = old_progress.attributes_ids
+        progress.data_ids = old_progress.data_ids
+    instance.purge_progress = progress
+    return progress
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
 
 
 def _purge_legacy_format(
-    instance: Recorder, session: Session, purge_before: datetime
+    instance: Recorder,
+    session: Session,
+    purge_before: datetime,
+    progress: PurgeProgress,
 ) -> bool:
     """Purge rows that are still linked by the event_ids."""
     (
@@ -149,6 +278,7 @@ def _purge_legacy_format(
     _purge_unused_attributes_ids(instance, session, attributes_ids)
     _purge_event_ids(session, event_ids)
     _purge_unused_data_ids(instance, session, data_ids)
+    progress.record(len(state_ids) + len(event_ids))
 
     # The database may still have some rows that have an event_id but are not
     # linked to any event. These rows are not linked to any event because the
@@ -163,6 +293,7 @@ def _purge_legacy_format(
     )
     _purge_state_ids(instance, session, detached_state_ids)
     _purge_unused_attributes_ids(instance, session, detached_attributes_ids)
+    progress.record(len(detached_state_ids))
     return bool(
         event_ids
         or state_ids
@@ -178,6 +309,7 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -201,13 +333,18 @@ def _purge_states_and_attributes_ids(
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        progress.record(len(state_ids))
+        if progress.slice_expired:
+            break
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    has_remaining_attributes_ids = _purge_unused_attributes_ids(
+        instance, session, attributes_ids_batch, progress
+    )
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
-        has_remaining_state_ids_to_purge,
+        has_remaining_state_ids_to_purge or has_remaining_attributes_ids,
     )
-    return has_remaining_state_ids_to_purge
+    return has_remaining_state_ids_to_purge or has_remaining_attributes_ids
 
 
 def _purge_events_and_data_ids(
@@ -215,6 +352,7 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -227,6 +365,8 @@ def _purge_events_and_data_ids(
     # max_bind_vars
     data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    if progress.slice_expired:
+        return has_remaining_event_ids_to_purge
     for _ in range(events_batch_size):
         event_ids, data_ids = _select_event_data_ids_to_purge(
             session, purge_before, max_bind_vars
@@ -236,13 +376,18 @@ def _purge_events_and_data_ids(
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        progress.record(len(event_ids))
+        if progress.slice_expired:
+            break
 
-    _purge_unused_data_ids(instance, session, data_ids_batch)
+    has_remaining_data_ids = _purge_unused_data_ids(
+        instance, session, data_ids_batch, progress
+    )
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
-        has_remaining_event_ids_to_purge,
+        has_remaining_event_ids_to_purge or has_remaining_data_ids,
     )
-    return has_remaining_event_ids_to_purge
+    return has_remaining_event_ids_to_purge or has_remaining_data_ids
 
 
 def _select_state_attributes_ids_to_purge(
@@ -365,14 +510,37 @@ def _purge_unused_attributes_ids(
     instance: Recorder,
     session: Session,
     attributes_ids_batch: set[int],
-) -> None:
-    """Purge unused attributes ids."""
+    progress: PurgeProgress | None = None,
+) -> bool:
+    """Purge unused attributes ids.
+
+    With a progress, the ids left unchecked by the previous purge task are
+    checked as well and the ids are checked in chunks until the time budget
+    is spent. Returns True if there are ids left for the next purge task.
+    """
     database_engine = instance.database_engine
     assert database_engine is not None
-    if unused_attribute_ids_set := _select_unused_attributes_ids(
-        instance, session, attributes_ids_batch, database_engine
-    ):
-        _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+    if progress is None:
+        if unused_attribute_ids_set := _select_unused_attributes_ids(
+            instance, session, attributes_ids_batch, database_engine
+        ):
+            _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+        return False
+    attributes_ids = list(progress.attributes_ids | attributes_ids_batch)
+    progress.attributes_ids = set()
+    max_bind_vars = instance.max_bind_vars
+    for idx in range(0, len(attributes_ids), max_bind_vars):
+        if unused_attribute_ids_set := _select_unused_attributes_ids(
+            instance,
+            session,
+            set(attributes_ids[idx : idx + max_bind_vars]),
+            database_engine,
+        ):
+            _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+        if progress.slice_expired:
+            progress.attributes_ids.update(attributes_ids[idx + max_bind_vars :])
+            break
+    return bool(progress.attributes_ids)
 
 
 def _select_unused_event_data_ids(
@@ -412,14 +580,38 @@ def _select_unused_event_data_ids(
 
 
 def _purge_unused_data_ids(
-    instance: Recorder, session: Session, data_ids_batch: set[int]
-) -> None:
+    instance: Recorder,
+    session: Session,
+    data_ids_batch: set[int],
+    progress: PurgeProgress | None = None,
+) -> bool:
+    """Purge unused data ids.
+
+    See _purge_unused_attributes_ids for how the time budget is applied.
+    """
     database_engine = instance.database_engine
     assert database_engine is not None
-    if unused_data_ids_set := _select_unused_event_data_ids(
-        instance, session, data_ids_batch, database_engine
-    ):
-        _purge_batch_data_ids(instance, session, unused_data_ids_set)
+    if progress is None:
+        if unused_data_ids_set := _select_unused_event_data_ids(
+            instance, session, data_ids_batch, database_engine
+        ):
+            _purge_batch_data_ids(instance, session, unused_data_ids_set)
+        return False
+    data_ids = list(progress.data_ids | data_ids_batch)
+    progress.data_ids = set()
+    max_bind_vars = instance.max_bind_vars
+    for idx in range(0, len(data_ids), max_bind_vars):
+        if unused_data_ids_set := _select_unused_event_data_ids(
+            instance,
+            session,
+            set(data_ids[idx : idx + max_bind_vars]),
+            database_engine,
+        ):
+            _purge_batch_data_ids(instance, session, unused_data_ids_set)
+        if progress.slice_expired:
+            progress.data_ids.update(data_ids[idx + max_bind_vars :])
+            break
+    return bool(progress.data_ids)
 
 
 def _select_statistics_runs_to_purge(
@@ -591,6 +783,23 @@ def _purge_old_recorder_runs(
     _LOGGER.debug("Deleted %s recorder_runs", deleted_rows)
 
 
+def _purge_old_states_checkpoints(session: Session, purge_before: datetime) -> None:
+    """Purge all old states checkpoints."""
+    # There is one row per entity and hour, no need to batch run it
+    deleted_rows = session.execute(
+        delete_states_checkpoints_rows(purge_before.timestamp())
+    ).rowcount
+    _LOGGER.debug("Deleted %s states_checkpoints", deleted_rows)
+
+
+def _purge_old_logbook_index(session: Session, purge_before: datetime) -> None:
+    """Purge the logbook index rows of the purged events."""
+    deleted_rows = session.execute(
+        delete_logbook_index_rows(purge_before.timestamp())
+    ).rowcount
+    _LOGGER.debug("Deleted %s logbook_index rows", deleted_rows)
+
+
 def _purge_old_event_types(instance: Recorder, session: Session) -> None:
     """Purge all old event types."""
     # Event types is small, no need to batch run it
@@ -622,6 +831,9 @@ def _purge_old_entity_ids(instance: Recorder, session: Session) -> None:
     if not states_metadata_ids:
         return
 
+    session.execute(
+        delete_states_checkpoints_rows_for_metadata_ids(states_metadata_ids)
+    )
     deleted_rows = session.execute(delete_states_meta_rows(states_metadata_ids))
     _LOGGER.debug("Deleted %s states meta", deleted_rows)
 
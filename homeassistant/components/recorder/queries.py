@@ -5,7 +5,16 @@ from __future__ import annotations
 from collections.abc import Iterable
 from datetime import datetime
 
-from sqlalchemy import delete, distinct, func, lambda_stmt, select, union_all, update
+from sqlalchemy import (
+    and_,
+    delete,
+    distinct,
+    func,
+    lambda_stmt,
+    select,
+    union_all,
+    update,
+)
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
@@ -13,10 +22,12 @@ from .db_schema import (
     EventData,
     Events,
     EventTypes,
+    LogbookIndex,
     MigrationChanges,
     RecorderRuns,
     StateAttributes,
     States,
+    StatesCheckpoints,
     StatesMeta,
     Statistics,
     StatisticsRuns,
@@ -614,6 +625,120 @@ def delete_recorder_runs_rows(
     )
 
 
+def delete_states_checkpoints_rows(purge_before: float) -> StatementLambdaElement:
+    """Delete states_checkpoints rows."""
+    return lambda_stmt(
+        lambda: delete(StatesCheckpoints)
+        .filter(StatesCheckpoints.start_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_states_checkpoints_rows_after(after: float) -> StatementLambdaElement:
+    """Delete the states_checkpoints rows which start after a point in time."""
+    return lambda_stmt(
+        lambda: delete(StatesCheckpoints)
+        .filter(StatesCheckpoints.start_ts > after)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_states_checkpoints_rows_for_metadata_ids(
+    metadata_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Delete the states_checkpoints rows of states_meta rows."""
+    return lambda_stmt(
+        lambda: delete(StatesCheckpoints)
+        .where(StatesCheckpoints.metadata_id.in_(metadata_ids))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_states_checkpoint_start(
+    after: float, before: float
+) -> StatementLambdaElement:
+    """Find the start of the newest states checkpoint between after and before."""
+    return lambda_stmt(
+        lambda: select(func.max(StatesCheckpoints.start_ts)).filter(
+            StatesCheckpoints.start_ts >= after, StatesCheckpoints.start_ts <= before
+        )
+    )
+
+
+def find_latest_states_checkpoint_start() -> StatementLambdaElement:
+    """Find the start of the newest states checkpoint."""
+    return lambda_stmt(lambda: select(func.max(StatesCheckpoints.start_ts)))
+
+
+def find_states_checkpoint_states(start_ts: float) -> StatementLambdaElement:
+    """Find the metadata_id and state_id of the states in a states checkpoint.
+
+    The rows pointing to purged states are skipped.
+    """
+    return lambda_stmt(
+        lambda: select(StatesCheckpoints.metadata_id, StatesCheckpoints.state_id)
+        .join(States, States.state_id == StatesCheckpoints.state_id)
+        .filter(StatesCheckpoints.start_ts == start_ts)
+    )
+
+
+def delete_logbook_index_rows(purge_before: float) -> StatementLambdaElement:
+    """Delete the logbook_index rows of events fired before purge_before.
+
+    The row marking the start of the index is kept.
+    """
+    return lambda_stmt(
+        lambda: delete(LogbookIndex)
+        .filter(LogbookIndex.time_fired_ts < purge_before)
+        .filter(LogbookIndex.event_id.is_not(None))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_all_logbook_index_rows() -> StatementLambdaElement:
+    """Delete all the logbook_index rows."""
+    return lambda_stmt(
+        lambda: delete(LogbookIndex).execution_options(synchronize_session=False)
+    )
+
+
+def find_logbook_index_start() -> StatementLambdaElement:
+    """Find the time the logbook index was started."""
+    return lambda_stmt(
+        lambda: select(func.min(LogbookIndex.time_fired_ts)).filter(
+            LogbookIndex.event_id.is_(None)
+        )
+    )
+
+
+def find_latest_states_during_period(
+    start_ts: float, end_ts: float
+) -> StatementLambdaElement:
+    """Find the metadata_id and state_id of the latest state of entities in a period."""
+    return lambda_stmt(
+        lambda: select(States.metadata_id, func.max(States.state_id))
+        .join(
+            most_recent_states := (
+                select(
+                    States.metadata_id.label("max_metadata_id"),
+                    func.max(States.last_updated_ts).label("max_last_updated"),
+                )
+                .filter(
+                    (States.last_updated_ts >= start_ts)
+                    & (States.last_updated_ts < end_ts)
+                )
+                .group_by(States.metadata_id)
+                .subquery()
+            ),
+            and_(
+                States.metadata_id == most_recent_states.c.max_metadata_id,
+                States.last_updated_ts == most_recent_states.c.max_last_updated,
+            ),
+        )
+        .group_by(States.metadata_id)
+    )
+
+
 def find_events_to_purge(
     purge_before: float, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -636,6 +761,26 @@ def find_states_to_purge(
     )
 
 
+def find_ids_range_to_purge(purge_before: float) -> StatementLambdaElement:
+    """Find the oldest id and the newest id to purge of the states and events."""
+    return lambda_stmt(
+        lambda: select(
+            select(func.min(States.state_id)).scalar_subquery(),
+            select(States.state_id)
+            .filter(States.last_updated_ts < purge_before)
+            .order_by(States.last_updated_ts.desc())
+            .limit(1)
+            .scalar_subquery(),
+            select(func.min(Events.event_id)).scalar_subquery(),
+            select(Events.event_id)
+            .filter(Events.time_fired_ts < purge_before)
+            .order_by(Events.time_fired_ts.desc())
+            .limit(1)
+            .scalar_subquery(),
+        )
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -805,6 +950,42 @@ def has_entity_ids_to_migrate() -> StatementLambdaElement:
     )
 
 
+def count_events_context_ids_to_migrate() -> StatementLambdaElement:
+    """Count the events context ids to migrate."""
+    return lambda_stmt(
+        lambda: select(func.count(Events.event_id)).filter(
+            Events.context_id_bin.is_(None)
+        )
+    )
+
+
+def count_states_context_ids_to_migrate() -> StatementLambdaElement:
+    """Count the states context ids to migrate."""
+    return lambda_stmt(
+        lambda: select(func.count(States.state_id)).filter(
+            States.context_id_bin.is_(None)
+        )
+    )
+
+
+def count_event_types_to_migrate() -> StatementLambdaElement:
+    """Count the event_types to migrate."""
+    return lambda_stmt(
+        lambda: select(func.count(Events.event_id)).filter(
+            Events.event_type_id.is_(None)
+        )
+    )
+
+
+def count_entity_ids_to_migrate() -> StatementLambdaElement:
+    """Count the entity_ids to migrate."""
+    return lambda_stmt(
+        lambda: select(func.count(States.state_id)).filter(
+            States.metadata_id.is_(None)
+        )
+    )
+
+
 def find_states_context_ids_to_migrate(max_bind_vars: int) -> StatementLambdaElement:
     """Find events context_ids to migrate."""
     return lambda_stmt(
@@ -0,0 +1,229 @@
+"""Spill the recorder queue to disk while the database can not keep up."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+import shutil
+import threading
+from typing import TYPE_CHECKING, Any, Final
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
+
+if TYPE_CHECKING:
+    from .tasks import RecorderTask
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of events written to a segment file at once
+SPILL_SEGMENT_SIZE: Final = 5000
+
+
+def _event_to_json(event: Event) -> bytes:
+    """Serialize an event to a line of JSON."""
+    return json_bytes(
+        {
+            "event_type": event.event_type,
+            "data": event.data,
+            "origin": event.origin.value,
+            "time_fired_ts": event.time_fired_timestamp,
+            "context": event.context.as_dict(),
+        }
+    )
+
+
+def _event_from_json(line: bytes) -> Event:
+    """Deserialize an event from a line of JSON."""
+    event: dict[str, Any] = json_loads(line)  # type: ignore[assignment]
+    data: dict[str, Any] = event["data"]
+    if event["event_type"] == EVENT_STATE_CHANGED:
+        data["old_state"] = State.from_dict(data["old_state"])
+        data["new_state"] = State.from_dict(data["new_state"])
+    context = event["context"]
+    return Event(
+        event["event_type"],
+        data,
+        EventOrigin(event["origin"]),
+        event["time_fired_ts"],
+        Context(
+            id=context["id"],
+            user_id=context["user_id"],
+            parent_id=context["parent_id"],
+        ),
+    )
+
+
+class SpillSegment:
+    """A run of spilled events, kept in memory until written to disk."""
+
+    __slots__ = ("consumed", "events", "path", "size")
+
+    def __init__(self, events: list[Event]) -> None:
+        """Initialize the segment."""
+        self.events: list[Event] | None = events
+        self.size = len(events)
+        self.path: str | None = None
+        self.consumed = False
+
+
+class SpillQueue:
+    """Keep the events queued for the recorder on disk.
+
+    While spilling, the events and tasks queued for the recorder are kept
+    here in order instead of in the in-memory recorder queue. The events
+    are written to segment files in the spill directory by a dedicated
+    writer thread and only the tasks stay in memory. The recorder thread
+    replays the events and tasks in order when it reaches the task which
+    was queued when spilling started, spilling stops once it caught up.
+
+    Spilling only keeps the backlog out of memory, it does not make the
+    queue durable. The spilled events which were not replayed yet are
+    dropped when the recorder shuts down, like the events left in the
+    in-memory recorder queue, and the segments left by a crash are deleted
+    when spilling starts again. They are never replayed across restarts.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the spill queue."""
+        self.path = path
+        self.active = False
+        self.size = 0
+        self._lock = threading.Lock()
+        self._items: deque[SpillSegment | RecorderTask] = deque()
+        self._pending: list[Event] = []
+        self._segment_id = 0
+        self._writer: ThreadPoolExecutor | None = None
+
+    def start(
+        self,
+        marker: RecorderTask,
+        queue_put: Callable[[RecorderTask | Event], None],
+    ) -> None:
+        """Start spilling the items queued after marker."""
+        with self._lock:
+            if self.active:
+                return
+            self.active = True
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="RecorderSpill"
+                )
+                self._writer.submit(self._prepare_directory)
+            queue_put(marker)
+
+    def put(self, item: RecorderTask | Event) -> bool:
+        """Spill an event or a task, return False if not spilling.
+
+        This method is thread-safe.
+        """
+        with self._lock:
+            if not self.active:
+                return False
+            self.size += 1
+            # Event is never subclassed so we can use a fast type check
+            if type(item) is Event:
+                self._pending.append(item)
+                if len(self._pending) >= SPILL_SEGMENT_SIZE:
+                    self._flush_pending()
+                return True
+            if self._pending:
+                self._flush_pending()
+            self._items.append(item)  # type: ignore[arg-type]
+            return True
+
+    def _flush_pending(self) -> None:
+        """Move the pending events to a segment and write it to disk."""
+        segment = SpillSegment(self._pending)
+        self._pending = []
+        self._items.append(segment)
+        assert self._writer is not None
+        self._segment_id += 1
+        self._writer.submit(self._write_segment, segment, self._segment_id)
+
+    def pop(self) -> SpillSegment | RecorderTask | None:
+        """Return the next spilled item, stop spilling if there are none left.
+
+        This method is only called from the recorder thread.
+        """
+        with self._lock:
+            if self._items:
+                item = self._items.popleft()
+            elif self._pending:
+                item = SpillSegment(self._pending)
+                self._pending = []
+            else:
+                self.active = False
+                return None
+            self.size -= item.size if type(item) is SpillSegment else 1
+            return item
+
+    def load(self, segment: SpillSegment) -> list[Event]:
+        """Return the events of a segment and delete its file.
+
+        This method is only called from the recorder thread.
+        """
+        with self._lock:
+            segment.consumed = True
+            if (events := segment.events) is not None:
+                return events
+            path = segment.path
+        assert path is not None
+        try:
+            with open(path, "rb") as segment_file:
+                lines = segment_file.read().splitlines()
+            os.unlink(path)
+            return [_event_from_json(line) for line in lines]
+        except (OSError, KeyError, ValueError):
+            _LOGGER.exception("Error reading the spilled recorder queue from %s", path)
+            return []
+
+    def clear(self) -> None:
+        """Stop spilling and drop the spilled events."""
+        with self._lock:
+            if self.size:
+                _LOGGER.warning(
+                    "Dropping %s events and tasks of the spilled recorder queue",
+                    self.size,
+                )
+            self.active = False
+            self.size = 0
+            self._items.clear()
+            self._pending = []
+            writer = self._writer
+            self._writer = None
+        if writer is not None:
+            writer.shutdown(wait=True, cancel_futures=True)
+            shutil.rmtree(self.path, ignore_errors=True)
+
+    def _prepare_directory(self) -> None:
+        """Create the spill directory, dropping the segments left by a crash."""
+        shutil.rmtree(self.path, ignore_errors=True)
+        os.makedirs(self.path, exist_ok=True)
+
+    def _write_segment(self, segment: SpillSegment, segment_id: int) -> None:
+        """Write the events of a segment to disk and release them from memory."""
+        with self._lock:
+            if segment.consumed or (events := segment.events) is None:
+                return
+        path = os.path.join(self.path, f"segment_{segment_id}")
+        try:
+            with open(path, "wb") as segment_file:
+                segment_file.write(
+                    b"\n".join(_event_to_json(event) for event in events)
+                )
+        except (OSError, TypeError, ValueError):
+            _LOGGER.exception("Error spilling the recorder queue to %s", path)
+            return
+        with self._lock:
+            if not segment.consumed:
+                segment.path = path
+                segment.events = None
+                return
+        # The recorder thread took the events while they were written
+        os.unlink(path)
@@ -0,0 +1,152 @@
+"""Keep the recent states of entities with a state class."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Final
+
+from homeassistant.components.sensor import ATTR_STATE_CLASS
+from homeassistant.core import Event, EventStateChangedData, State
+
+# The buffer is restarted when it holds more states than this, which
+# happens when the statistics have not been compiled for a long time
+MAX_BUFFERED_STATES: Final = 200_000
+
+
+def _last_updated_timestamp(state: State) -> float:
+    """Return the last_updated timestamp of a state."""
+    return state.last_updated_timestamp
+
+
+class StatesBuffer:
+    """Keep the states of entities with a state class since the last compile.
+
+    The buffer is seeded with the current states when it is started and
+    fed with the state_changed events processed by the recorder thread so
+    the 5-minute statistics can be compiled without reading the states of
+    the period back from the database. It only holds the states recorded
+    since start_ts, periods starting before are read from the database.
+    When the buffer was restarted without seeding it, the periods of
+    entities without a buffered state at their start are also read from
+    the database.
+
+    This class is only used from the recorder thread.
+    """
+
+    __slots__ = ("_seeded", "_size", "_states", "start_ts")
+
+    def __init__(self) -> None:
+        """Initialize the buffer."""
+        self._states: dict[str, list[State]] = {}
+        self._size = 0
+        self._seeded = False
+        self.start_ts: float | None = None
+
+    def start(self, start_ts: float, states: Iterable[State] | None = None) -> None:
+        """Start buffering the states changed from start_ts.
+
+        The states are the current states of all the entities at start_ts,
+        if they are not known the buffer is not seeded.
+        """
+        self.clear()
+        self.start_ts = start_ts
+        if states is None:
+            return
+        self._seeded = True
+        for state in states:
+            if state.attributes.get(ATTR_STATE_CLASS) is not None:
+                self._states[state.entity_id] = [state]
+                self._size += 1
+
+    def clear(self) -> None:
+        """Drop the buffered states, tracking restarts with the next event."""
+        self._states.clear()
+        self._size = 0
+        self._seeded = False
+        self.start_ts = None
+
+    def add(self, event: Event[EventStateChangedData]) -> None:
+        """Add the new state of a state_changed event."""
+        if self.start_ts is None:
+            self.start(event.time_fired_timestamp)
+        elif self._size >= MAX_BUFFERED_STATES:
+            # The last state of each entity is still its state at the
+            # new start since no event was missed
+            seeded = self._seeded
+            self.start(
+                event.time_fired_timestamp,
+                [states[-1] for states in self._states.values()],
+            )
+            self._seeded = seeded
+        entity_id = event.data["entity_id"]
+        new_state = event.data["new_state"]
+        if new_state is None or new_state.attributes.get(ATTR_STATE_CLASS) is None:
+            # The entity was removed or no longer has a state class
+            if states := self._states.pop(entity_id, None):
+                self._size -= len(states)
+            return
+        if (states := self._states.get(entity_id)) is None:
+            states = self._states[entity_id] = []
+        states.append(new_state)
+        self._size += 1
+
+    def get_period(
+        self,
+        start: datetime,
+        end: datetime,
+        entity_ids: Iterable[str],
+        significant_changes_only: bool,
+    ) -> dict[str, list[State]] | None:
+        """Return the states of entities during a period.
+
+        Like the history queries, the last state before start is included
+        and entities without states are left out. With
+        significant_changes_only, only the states where the state changed
+        are returned during the period.
+
+        Return None if the buffer does not hold all the states of the period,
+        which is also the case when it was not seeded and one of the
+        entities has no buffered state at or before start.
+        """
+        start_ts = start.timestamp()
+        if self.start_ts is None or start_ts < self.start_ts:
+            return None
+        end_ts = end.timestamp()
+        result: dict[str, list[State]] = {}
+        for entity_id in entity_ids:
+            states = self._states.get(entity_id)
+            first_idx = (
+                bisect_right(states, start_ts, key=_last_updated_timestamp)
+                if states
+                else 0
+            )
+            if not first_idx and not self._seeded:
+                return None
+            if not states:
+                continue
+            last_idx = bisect_left(states, end_ts, key=_last_updated_timestamp)
+            entity_states = states[first_idx:last_idx]
+            if significant_changes_only:
+                entity_states = [
+                    state
+                    for state in entity_states
+                    if state.last_changed_timestamp == state.last_updated_timestamp
+                ]
+            if start_idx := bisect_left(states, start_ts, key=_last_updated_timestamp):
+                entity_states.insert(0, states[start_idx - 1])
+            if entity_states:
+                result[entity_id] = entity_states
+        return result
+
+    def prune(self, before: datetime) -> None:
+        """Drop the states which are not needed for periods starting at before.
+
+        The last state of each entity before that point is kept.
+        """
+        before_ts = before.timestamp()
+        for states in self._states.values():
+            if (idx := bisect_left(states, before_ts, key=_last_updated_timestamp)) > 1:
+                del states[: idx - 1]
+                self._size -= idx - 1
@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Hashable, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import groupby
 import logging
+import math
 from operator import itemgetter
 import re
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import (
+    Select,
+    and_,
+    bindparam,
+    case,
+    func,
+    insert,
+    lambda_stmt,
+    select,
+    text,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
@@ -26,6 +38,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.singleton import singleton
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.util import dt as dt_util
+from homeassistant.util.collection import chunked
 from homeassistant.util.unit_conversion import (
     BaseUnitConverter,
     ConductivityConverter,
@@ -58,6 +71,7 @@ from .const import (
 )
 from .db_schema import (
     STATISTICS_TABLES,
+    StatesCheckpoints,
     Statistics,
     StatisticsBase,
     StatisticsRuns,
@@ -71,6 +85,11 @@ from .models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
 )
+from .queries import (
+    find_latest_states_during_period,
+    find_states_checkpoint_start,
+    find_states_checkpoint_states,
+)
 from .util import (
     execute,
     execute_stmt_lambda_element,
@@ -157,18 +176,6 @@ UNIT_CLASSES = {
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
 
-
-def mean(values: list[float]) -> float | None:
-    """Return the mean of the values.
-
-    This is a very simple version that only works
-    with a non-empty list of floats. The built-in
-    statistics.mean is more robust but is almost
-    an order of magnitude slower.
-    """
-    return sum(values) / len(values)
-
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -445,6 +452,50 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
     )
 
 
+def _compile_states_checkpoint(
+    instance: Recorder, session: Session, start: datetime
+) -> None:
+    """Write the latest state of each entity before the start of an hour.
+
+    The checkpoint is built from the previous checkpoint and the states
+    recorded since, or from the states recorded since the recorder run
+    started if there is no previous checkpoint.
+    """
+    start_ts = start.timestamp()
+    if (run := instance.recorder_runs_manager.get(start)) is None:
+        return
+    previous_ts: float | None = session.execute(
+        find_states_checkpoint_start(0, start_ts)
+    ).scalar()
+    if previous_ts == start_ts:
+        return
+    state_ids: dict[int, int] = {}
+    if previous_ts is not None:
+        state_ids.update(
+            session.execute(find_states_checkpoint_states(previous_ts)).tuples()
+        )
+    else:
+        previous_ts = process_timestamp(run.start).timestamp()
+    state_ids.update(
+        session.execute(
+            find_latest_states_during_period(previous_ts, start_ts)
+        ).tuples()
+    )
+    if state_ids:
+        session.execute(
+            insert(StatesCheckpoints),
+            [
+                {"start_ts": start_ts, "metadata_id": metadata_id, "state_id": state_id}
+                for metadata_id, state_id in state_ids.items()
+            ],
+        )
+        if (
+            instance.states_checkpoint_ts is None
+            or start_ts > instance.states_checkpoint_ts
+        ):
+            instance.states_checkpoint_ts = start_ts
+
+
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
     """Compile missing statistics."""
@@ -483,6 +534,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
                 periods_without_commit = 0
             start = end
 
+    instance.statistics_cache.invalidate()
     return True
 
 
@@ -509,6 +561,13 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
             instance, session, start, fire_events
         )
 
+    # The states of the compiled period are no longer needed
+    instance.states_buffer.prune(start + StatisticsShortTerm.duration)
+    # The hourly statistics compiled at the end of an hour start with the hour
+    instance.statistics_cache.invalidate(
+        None if modified_statistic_ids else start.replace(minute=0).timestamp()
+    )
+
     if modified_statistic_ids:
         # In the rare case that we have modified statistic_ids, we reload the modified
         # statistics meta data into the cache in a fresh session to ensure that the
@@ -601,6 +660,7 @@ def _compile_statistics(
     if start.minute == 55:
         # A full hour is ready, summarize it
         _compile_hourly_statistics(session, start)
+        _compile_states_checkpoint(instance, session, end)
 
     session.add(StatisticsRuns(start=start))
 
@@ -747,6 +807,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    instance.statistics_cache.invalidate()
 
 
 def update_statistics_metadata(
@@ -772,6 +833,7 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+    instance.statistics_cache.invalidate()
 
 
 async def async_list_statistic_ids(
@@ -900,65 +962,6 @@ def list_statistic_ids(
     return _flatten_list_statistic_ids_metadata_result(result)
 
 
-def _reduce_statistics(
-    stats: dict[str, list[StatisticsRow]],
-    same_period: Callable[[float, float], bool],
-    period_start_end: Callable[[float], tuple[float, float]],
-    period: timedelta,
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily or monthly statistics."""
-    result: dict[str, list[StatisticsRow]] = defaultdict(list)
-    period_seconds = period.total_seconds()
-    _want_mean = "mean" in types
-    _want_min = "min" in types
-    _want_max = "max" in types
-    _want_last_reset = "last_reset" in types
-    _want_state = "state" in types
-    _want_sum = "sum" in types
-    for statistic_id, stat_list in stats.items():
-        max_values: list[float] = []
-        mean_values: list[float] = []
-        min_values: list[float] = []
-        prev_stat: StatisticsRow = stat_list[0]
-        fake_entry: StatisticsRow = {"start": stat_list[-1]["start"] + period_seconds}
-
-        # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_entry,)):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, end = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                row: StatisticsRow = {
-                    "start": start,
-                    "end": end,
-                }
-                if _want_mean:
-                    row["mean"] = mean(mean_values) if mean_values else None
-                    mean_values.clear()
-                if _want_min:
-                    row["min"] = min(min_values) if min_values else None
-                    min_values.clear()
-                if _want_max:
-                    row["max"] = max(max_values) if max_values else None
-                    max_values.clear()
-                if _want_last_reset:
-                    row["last_reset"] = prev_stat.get("last_reset")
-                if _want_state:
-                    row["state"] = prev_stat.get("state")
-                if _want_sum:
-                    row["sum"] = prev_stat["sum"]
-                result[statistic_id].append(row)
-            if _want_max and (_max := statistic.get("max")) is not None:
-                max_values.append(_max)
-            if _want_mean and (_mean := statistic.get("mean")) is not None:
-                mean_values.append(_mean)
-            if _want_min and (_min := statistic.get("min")) is not None:
-                min_values.append(_min)
-            prev_stat = statistic
-
-    return result
-
-
 def reduce_day_ts_factory() -> (
     tuple[
         Callable[[float, float], bool],
@@ -997,17 +1000,6 @@ def reduce_day_ts_factory() -> (
     return _same_day_ts, _day_start_end_ts_cached
 
 
-def _reduce_statistics_per_day(
-    stats: dict[str, list[StatisticsRow]],
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily statistics."""
-    _same_day_ts, _day_start_end_ts = reduce_day_ts_factory()
-    return _reduce_statistics(
-        stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
-    )
-
-
 def reduce_week_ts_factory() -> (
     tuple[
         Callable[[float, float], bool],
@@ -1047,17 +1039,6 @@ def reduce_week_ts_factory() -> (
     return _same_week_ts, _week_start_end_ts_cached
 
 
-def _reduce_statistics_per_week(
-    stats: dict[str, list[StatisticsRow]],
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to weekly statistics."""
-    _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
-    return _reduce_statistics(
-        stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
-    )
-
-
 def _find_month_end_time(timestamp: datetime) -> datetime:
     """Return the end of the month (midnight at the first day of the next month)."""
     # We add 4 days to the end to make sure we are in the next month
@@ -1102,17 +1083,6 @@ def reduce_month_ts_factory() -> (
     return _same_month_ts, _month_start_end_ts_cached
 
 
-def _reduce_statistics_per_month(
-    stats: dict[str, list[StatisticsRow]],
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to monthly statistics."""
-    _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
-    return _reduce_statistics(
-        stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
-    )
-
-
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1136,6 +1106,139 @@ def _generate_statistics_during_period_stmt(
     return stmt
 
 
+_REDUCED_PERIODS = {
+    "day": reduce_day_ts_factory,
+    "week": reduce_week_ts_factory,
+    "month": reduce_month_ts_factory,
+}
+
+
+def _generate_reduced_statistics_stmt(
+    metadata_ids: list[int] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+    periods: list[tuple[float, float]],
+) -> Select:
+    """Create the statement reducing the hourly statistics of periods.
+
+    The periods must be consecutive. The hourly statistics are put in the
+    bucket of their period with a CASE expression, the max, mean and min are
+    aggregated per bucket, the last_reset, state and sum are the ones of the
+    last hourly statistic of the bucket.
+    """
+    period_start = case(
+        *((Statistics.start_ts < end_ts, start_ts) for start_ts, end_ts in periods)
+    ).label("period_start_ts")
+    period_stmt = select(
+        Statistics.metadata_id,
+        period_start,
+        func.max(Statistics.start_ts).label("last_start_ts"),
+    )
+    if "max" in types:
+        period_stmt = period_stmt.add_columns(func.max(Statistics.max).label("max"))
+    if "mean" in types:
+        period_stmt = period_stmt.add_columns(func.avg(Statistics.mean).label("mean"))
+    if "min" in types:
+        period_stmt = period_stmt.add_columns(func.min(Statistics.min).label("min"))
+    period_stmt = period_stmt.filter(
+        Statistics.start_ts >= periods[0][0],
+        Statistics.start_ts < periods[-1][1],
+    )
+    if metadata_ids:
+        period_stmt = period_stmt.filter(Statistics.metadata_id.in_(metadata_ids))
+    # Group by the label to not repeat the bind parameters of the buckets
+    period_statistics = period_stmt.group_by(
+        Statistics.metadata_id, "period_start_ts"
+    ).subquery()
+    stmt = select(
+        Statistics.metadata_id,
+        Statistics.start_ts,
+        *(period_statistics.c[key] for key in ("max", "mean", "min") if key in types),
+        *(
+            getattr(Statistics, _type_column_mapping[key])
+            for key in ("last_reset", "state", "sum")
+            if key in types
+        ),
+    )
+    return stmt.join(
+        period_statistics,
+        and_(
+            Statistics.metadata_id == period_statistics.c.metadata_id,
+            Statistics.start_ts == period_statistics.c.last_start_ts,
+        ),
+    )
+
+
+def _reduced_statistics_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    period_start_end: Callable[[float], tuple[float, float]],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce hourly statistics to daily, weekly or monthly statistics.
+
+    The periods are found with period_start_end and the hourly statistics
+    are grouped by period in the database, with one query per batch of
+    periods to stay within the bind variable limit of the database.
+    """
+    first_last_stmt = select(
+        func.min(Statistics.start_ts), func.max(Statistics.start_ts)
+    ).filter(Statistics.start_ts >= start_time.timestamp())
+    if end_time is not None:
+        first_last_stmt = first_last_stmt.filter(
+            Statistics.start_ts < end_time.timestamp()
+        )
+    if metadata_ids:
+        first_last_stmt = first_last_stmt.filter(
+            Statistics.metadata_id.in_(metadata_ids)
+        )
+    connection = session.connection()
+    first_start_ts, last_start_ts = connection.execute(first_last_stmt).one()
+    if first_start_ts is None:
+        return {}
+
+    periods: list[tuple[float, float]] = []
+    period_start_ts = first_start_ts
+    while period_start_ts <= last_start_ts:
+        period = period_start_end(period_start_ts)
+        periods.append(period)
+        period_start_ts = period[1]
+
+    # Each period takes two bind variables in the bucket expression
+    periods_per_query = max(
+        1,
+        (get_instance(hass).max_bind_vars - len(metadata_ids or ())) // 2 - 1,
+    )
+    stats: list[Row] = []
+    for periods_chunk in chunked(periods, periods_per_query):
+        stats.extend(
+            connection.execute(
+                _generate_reduced_statistics_stmt(metadata_ids, types, periods_chunk)
+            )
+        )
+    if not stats:
+        return {}
+
+    # Group the statistics by metadata_id with the periods in order
+    stats.sort(key=itemgetter(0, 1))
+    result = _sorted_statistics_to_dict(
+        hass, stats, statistic_ids, metadata, True, Statistics, units, types
+    )
+    # The rows start at the last hourly statistic of their period
+    period_starts = [period[0] for period in periods]
+    for stat_list in result.values():
+        for row in stat_list:
+            row["start"], row["end"] = periods[
+                bisect_right(period_starts, row["start"]) - 1
+            ]
+    return result
+
+
 def _generate_max_mean_min_statistic_in_sub_period_stmt(
     columns: Select,
     start_time: datetime | None,
@@ -1698,6 +1801,84 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _align_period_times(
+    start_time: datetime,
+    end_time: datetime | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+) -> tuple[datetime, datetime | None]:
+    """Align start_time and end_time with the day, week or month period."""
+    if period == "day":
+        start_time = dt_util.as_local(start_time).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        if end_time is not None:
+            end_local = dt_util.as_local(end_time)
+            end_time = end_local.replace(
+                hour=0, minute=0, second=0, microsecond=0
+            ) + timedelta(days=1)
+    elif period == "week":
+        start_local = dt_util.as_local(start_time)
+        start_time = start_local.replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) - timedelta(days=start_local.weekday())
+        if end_time is not None:
+            end_local = dt_util.as_local(end_time)
+            end_time = (
+                end_local.replace(hour=0, minute=0, second=0, microsecond=0)
+                - timedelta(days=end_local.weekday())
+                + timedelta(days=7)
+            )
+    elif period == "month":
+        start_time = dt_util.as_local(start_time).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        if end_time is not None:
+            end_time = _find_month_end_time(dt_util.as_local(end_time))
+    return start_time, end_time
+
+
+def statistics_during_period_cache_key(
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str],
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> tuple[Hashable, float | None]:
+    """Return the cache key and end of a statistics_during_period request.
+
+    Statistics start on period boundaries, the start and end of the request
+    are rounded up to the next boundary so requests made at slightly
+    different times for the same statistics share the same key.
+    """
+    if period in _REDUCED_PERIODS:
+        aligned_start, aligned_end = _align_period_times(start_time, end_time, period)
+        start_ts = aligned_start.timestamp()
+        end_ts = aligned_end.timestamp() if aligned_end is not None else None
+        time_zone = str(dt_util.get_default_time_zone())
+    else:
+        duration = (
+            StatisticsShortTerm.duration if period == "5minute" else Statistics.duration
+        ).total_seconds()
+        start_ts = math.ceil(start_time.timestamp() / duration) * duration
+        end_ts = (
+            math.ceil(end_time.timestamp() / duration) * duration
+            if end_time is not None
+            else None
+        )
+        time_zone = None
+    key = (
+        start_ts,
+        end_ts,
+        tuple(sorted(statistic_ids)),
+        period,
+        tuple(sorted(units.items())) if units else None,
+        tuple(sorted(types)),
+        time_zone,
+    )
+    return key, end_ts
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1735,68 +1916,48 @@ def _statistics_during_period_with_session(
     if statistic_ids is not None:
         metadata_ids = _extract_metadata_and_discard_impossible_columns(metadata, types)
 
-    # Align start_time and end_time with the period
-    if period == "day":
-        start_time = dt_util.as_local(start_time).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        start_time = start_time.replace()
-        if end_time is not None:
-            end_local = dt_util.as_local(end_time)
-            end_time = end_local.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            ) + timedelta(days=1)
-    elif period == "week":
-        start_local = dt_util.as_local(start_time)
-        start_time = start_local.replace(
-            hour=0, minute=0, second=0, microsecond=0
-        ) - timedelta(days=start_local.weekday())
-        if end_time is not None:
-            end_local = dt_util.as_local(end_time)
-            end_time = (
-                end_local.replace(hour=0, minute=0, second=0, microsecond=0)
-                - timedelta(days=end_local.weekday())
-                + timedelta(days=7)
-            )
-    elif period == "month":
-        start_time = dt_util.as_local(start_time).replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-        if end_time is not None:
-            end_time = _find_month_end_time(dt_util.as_local(end_time))
+    start_time, end_time = _align_period_times(start_time, end_time, period)
 
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
-
-    if not stats:
-        return {}
-
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
-
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+    if period in _REDUCED_PERIODS:
+        _, period_start_end = _REDUCED_PERIODS[period]()
+        result = _reduced_statistics_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata,
+            metadata_ids,
+            period_start_end,
+            units,
+            types,
+        )
+        if not result:
+            return {}
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if not stats:
+            return {}
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        result = _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+        )
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2432,9 +2593,11 @@ def import_statistics(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
+        imported = _import_statistics_with_session(
             instance, session, metadata, statistics, table
         )
+    instance.statistics_cache.invalidate()
+    return imported
 
 
 @retryable_database_job("adjust_statistics")
@@ -2476,6 +2639,7 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+    instance.statistics_cache.invalidate()
     return True
 
 
@@ -2543,6 +2707,7 @@ def change_statistics_unit(
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
         )
+    instance.statistics_cache.invalidate()
 
 
 @callback
@@ -0,0 +1,76 @@
+"""Cache the statistics returned to the frontend."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+import threading
+from typing import Final
+
+from lru import LRU
+
+# Every dashboard card asks for its own statistics, the cache should
+# hold the statistics of a few dashboards opened at the same time
+MAX_CACHED_RESULTS: Final = 64
+
+
+class StatisticsResultCache:
+    """Cache serialized statistics until the statistics they cover change.
+
+    Results are stored with the end of the period they cover. When new
+    statistics are compiled only the results covering the compiled period
+    are dropped, all results are dropped when statistics are imported,
+    adjusted or their metadata changes.
+
+    The cache is read from the executor threads and invalidated from the
+    recorder thread after the changes are committed. A result fetched
+    while the cache was invalidated is not stored since it may have been
+    read before the changes were committed.
+    """
+
+    __slots__ = ("_generation", "_lock", "_results")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._results: LRU[Hashable, tuple[float | None, bytes]] = LRU(
+            MAX_CACHED_RESULTS
+        )
+
+    @property
+    def generation(self) -> int:
+        """Return the generation to pass to set when the result is fetched."""
+        return self._generation
+
+    def get(self, key: Hashable) -> bytes | None:
+        """Return the cached result for key."""
+        with self._lock:
+            if (cached := self._results.get(key)) is None:
+                return None
+            return cached[1]
+
+    def set(
+        self, key: Hashable, generation: int, end_ts: float | None, result: bytes
+    ) -> None:
+        """Cache a result covering statistics until end_ts.
+
+        The result is not cached if the cache was invalidated since
+        generation was read.
+        """
+        with self._lock:
+            if generation == self._generation:
+                self._results[key] = (end_ts, result)
+
+    def invalidate(self, start_ts: float | None = None) -> None:
+        """Drop the results which may include statistics from start_ts.
+
+        All results are dropped if start_ts is None.
+        """
+        with self._lock:
+            self._generation += 1
+            if start_ts is None:
+                self._results.clear()
+                return
+            for key, (end_ts, _) in self._results.items():
+                if end_ts is None or end_ts > start_ts:
+                    del self._results[key]
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Collection, Iterable
+from collections.abc import Collection, Iterable, Mapping
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
+from lru import LRU
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event, EventStateChangedData
@@ -18,6 +19,8 @@ from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
 if TYPE_CHECKING:
+    from homeassistant.helpers.entity import StateInfo
+
     from ..core import Recorder
 
 # The number of attribute ids to cache in memory
@@ -37,11 +40,32 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        # The state machine reuses the attributes object of the previous
+        # state when the attributes did not change, so we keep the last
+        # serialized attributes per entity_id to skip serializing them again.
+        # It is an LRU so the entities which are gone don't keep their last
+        # serialized attributes alive.
+        self._last_serialized: LRU[
+            str, tuple[Mapping[str, Any], StateInfo | None, bytes]
+        ] = LRU(CACHE_SIZE)
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
-        """Serialize event data."""
+        """Serialize event data.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        entity_id = event.data["entity_id"]
+        if (new_state := event.data["new_state"]) is None:
+            self._last_serialized.pop(entity_id, None)
+        elif (
+            (last_serialized := self._last_serialized.get(entity_id))
+            and last_serialized[0] is new_state.attributes
+            and last_serialized[1] is new_state.state_info
+        ):
+            return last_serialized[2]
         try:
-            return StateAttributes.shared_attrs_bytes_from_event(
+            shared_attrs_bytes = StateAttributes.shared_attrs_bytes_from_event(
                 event, self.recorder.dialect_name
             )
         except JSON_ENCODE_EXCEPTIONS as ex:
@@ -51,6 +75,13 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
                 ex,
             )
             return None
+        if new_state is not None:
+            self._last_serialized[entity_id] = (
+                new_state.attributes,
+                new_state.state_info,
+                shared_attrs_bytes,
+            )
+        return shared_attrs_bytes
 
     def load(
         self, events: list[Event[EventStateChangedData]], session: Session
@@ -152,3 +183,23 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             state_attributes_ids_reversed
         ):
             id_map.pop(state_attributes_ids_reversed[purged_attributes_id], None)
+
+    def adjust_lru_size(self, new_size: int) -> None:
+        """Adjust the LRU cache size.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().adjust_lru_size(new_size)
+        lru = self._last_serialized
+        if new_size > lru.get_size():
+            lru.set_size(new_size)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._last_serialized.clear()
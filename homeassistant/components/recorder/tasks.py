@@ -117,9 +117,12 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
+        finished = purge.purge_old_data(
             instance, self.purge_before, self.repack, self.apply_filter
-        ):
+        )
+        # Old short term statistics may have been purged
+        instance.statistics_cache.invalidate()
+        if finished:
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -251,6 +254,20 @@ class WaitTask(RecorderTask):
         instance._queue_watch.set()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class ReplaySpilledTask(RecorderTask):
+    """An object to insert into the recorder queue when spilling to disk starts.
+
+    The events and tasks queued since are replayed when the task runs.
+    """
+
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._replay_spilled_queue()  # noqa: SLF001
+
+
 @dataclass(slots=True)
 class DatabaseLockTask(RecorderTask):
     """An object to insert into the recorder queue to prevent writes to the database."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import base64
 from collections.abc import Callable, Generator, Sequence
 import contextlib
 from contextlib import contextmanager
@@ -34,7 +35,9 @@ from homeassistant.helpers.recorder import (  # noqa: F401
     get_instance,
     session_scope,
 )
+from homeassistant.helpers.json import json_bytes
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
     DEFAULT_MAX_BIND_VARS,
@@ -208,6 +211,23 @@ def execute_stmt_lambda_element(
     raise RuntimeError  # pragma: no cover
 
 
+def cursor_to_token(cursor: list[Any]) -> str:
+    """Encode the position after a page of rows as an opaque token."""
+    return base64.urlsafe_b64encode(json_bytes(cursor)).decode("ascii")
+
+
+def token_to_cursor(token: str) -> list[Any] | None:
+    """Decode a token made by cursor_to_token.
+
+    None is returned if the token is not valid.
+    """
+    try:
+        cursor = json_loads(base64.urlsafe_b64decode(token.encode("ascii")))
+    except ValueError:
+        return None
+    return cursor if isinstance(cursor, list) else None
+
+
 def validate_or_move_away_sqlite_database(dburl: str) -> bool:
     """Ensure that the database is valid or move it away."""
     dbpath = dburl_to_path(dburl)
@@ -622,6 +642,26 @@ def setup_connection_for_dialect(
     )
 
 
+def setup_read_only_connection_for_dialect(
+    dialect_name: str, dbapi_connection: DBAPIConnection
+) -> None:
+    """Execute statements needed for a read only dialect connection."""
+    if dialect_name == SupportedDialect.SQLITE:
+        # The journal mode is set up by the connections of the recorder
+        execute_on_connection(dbapi_connection, "PRAGMA cache_size = -16384")
+        execute_on_connection(dbapi_connection, "PRAGMA query_only = ON")
+    elif dialect_name == SupportedDialect.MYSQL:
+        execute_on_connection(dbapi_connection, "SET session wait_timeout=28800")
+        execute_on_connection(dbapi_connection, "SET time_zone = '+00:00'")
+        execute_on_connection(dbapi_connection, "SET SESSION TRANSACTION READ ONLY")
+    elif dialect_name == SupportedDialect.POSTGRESQL:
+        execute_on_connection(
+            dbapi_connection, "SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY"
+        )
+    else:
+        _fail_unsupported_dialect(dialect_name)
+
+
 def end_incomplete_runs(session: Session, start_time: datetime) -> None:
     """End any incomplete recorder runs."""
     for run in session.query(RecorderRuns).filter_by(end=None):
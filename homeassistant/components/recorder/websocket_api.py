@@ -44,6 +44,7 @@ from .statistics import (
     list_statistic_ids,
     statistic_during_period,
     statistics_during_period,
+    statistics_during_period_cache_key,
     update_statistics_issues,
     validate_statistics,
 )
@@ -134,7 +135,7 @@ async def ws_get_statistic_during_period(
     start_time, end_time = resolve_period(cast(StatisticPeriod, msg))
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_only_executor_job(
             _ws_get_statistic_during_period,
             hass,
             msg["id"],
@@ -157,24 +158,36 @@ def _ws_get_statistics_during_period(
     units: dict[str, str],
     types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> bytes:
-    """Fetch statistics and convert them to json in the executor."""
-    result = statistics_during_period(
-        hass,
-        start_time,
-        end_time,
-        statistic_ids,
-        period,
-        units,
-        types,
+    """Fetch statistics and convert them to json in the executor.
+
+    Dashboards opened in several browsers request the same statistics, the
+    serialized statistics are cached until statistics of the period change.
+    """
+    cache = get_instance(hass).statistics_cache
+    key, end_ts = statistics_during_period_cache_key(
+        start_time, end_time, statistic_ids, period, units, types
     )
-    include_last_reset = "last_reset" in types
-    for statistic_rows in result.values():
-        for row in statistic_rows:
-            row["start"] = int(row["start"] * 1000)
-            row["end"] = int(row["end"] * 1000)
-            if include_last_reset and (last_reset := row["last_reset"]) is not None:
-                row["last_reset"] = int(last_reset * 1000)
-    return json_bytes(messages.result_message(msg_id, result))
+    if (payload := cache.get(key)) is None:
+        generation = cache.generation
+        result = statistics_during_period(
+            hass,
+            start_time,
+            end_time,
+            statistic_ids,
+            period,
+            units,
+            types,
+        )
+        include_last_reset = "last_reset" in types
+        for statistic_rows in result.values():
+            for row in statistic_rows:
+                row["start"] = int(row["start"] * 1000)
+                row["end"] = int(row["end"] * 1000)
+                if include_last_reset and (last_reset := row["last_reset"]) is not None:
+                    row["last_reset"] = int(last_reset * 1000)
+        payload = json_bytes(result)
+        cache.set(key, generation, end_ts, payload)
+    return messages.construct_result_message(msg_id, payload)
 
 
 async def ws_handle_get_statistics_during_period(
@@ -202,7 +215,7 @@ async def ws_handle_get_statistics_during_period(
     if (types := msg.get("types")) is None:
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_only_executor_job(
             _ws_get_statistics_during_period,
             hass,
             msg["id"],
@@ -257,7 +270,7 @@ async def ws_handle_list_statistic_ids(
 ) -> None:
     """Fetch a list of available statistic_id."""
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_only_executor_job(
             _ws_get_list_statistic_ids,
             hass,
             msg["id"],
@@ -78,6 +78,9 @@ WARN_UNSUPPORTED_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unsupported_u
 WARN_UNSTABLE_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unstable_unit")
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Time weighted averages are calculated in the process pool when more states than
+# this are averaged, for fewer states pickling the states costs more than it saves
+PROCESS_POOL_MIN_STATES = 50_000
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -100,7 +103,9 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
 
 
 def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
+    fstates: list[tuple[float, datetime.datetime]],
+    start: datetime.datetime,
+    end: datetime.datetime,
 ) -> float:
     """Calculate a time weighted average.
 
@@ -112,10 +117,10 @@ def _time_weighted_average(
     old_start_time: datetime.datetime | None = None
     accumulated = 0.0
 
-    for fstate, state in fstates:
+    for fstate, last_updated in fstates:
         # The recorder will give us the last known state, which may be well
         # before the requested start time for the statistics
-        start_time = max(state.last_updated, start)
+        start_time = max(last_updated, start)
         if old_start_time is None:
             # Adjust start time, if there was no last known state
             start = start_time
@@ -146,6 +151,21 @@ def _time_weighted_average(
     return accumulated / period_seconds
 
 
+def _time_weighted_averages(
+    series: dict[str, list[tuple[float, datetime.datetime]]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> dict[str, float]:
+    """Calculate the time weighted averages of several entities.
+
+    This function may be run in a worker process of the process pool.
+    """
+    return {
+        entity_id: _time_weighted_average(fstates, start, end)
+        for entity_id, fstates in series.items()
+    }
+
+
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
     """Return a set of all units."""
     return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
@@ -402,6 +422,36 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+def _get_history(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    entity_ids: list[str],
+    significant_changes_only: bool,
+) -> dict[str, list[State]]:
+    """Return the states of entities during start-end.
+
+    The states are taken from the states buffer of the recorder when it
+    holds the whole period, otherwise they are read from the database.
+    """
+    history_start = start - datetime.timedelta.resolution
+    if (
+        history_list := get_instance(hass).states_buffer.get_period(
+            history_start, end, entity_ids, significant_changes_only
+        )
+    ) is not None:
+        return history_list
+    return history.get_full_significant_states_with_session(
+        hass,
+        session,
+        history_start,
+        end,
+        entity_ids=entity_ids,
+        significant_changes_only=significant_changes_only,
+    )
+
+
 def compile_statistics(  # noqa: C901
     hass: HomeAssistant,
     session: Session,
@@ -419,13 +469,8 @@ def compile_statistics(  # noqa: C901
     ]
     history_list: dict[str, list[State]] = {}
     if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
+        history_list = _get_history(
+            hass, session, start, end, entities_full_history, False
         )
     entities_significant_history = [
         i.entity_id
@@ -433,12 +478,8 @@ def compile_statistics(  # noqa: C901
         if "sum" not in wanted_statistics[i.entity_id]
     ]
     if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+        _history_list = _get_history(
+            hass, session, start, end, entities_significant_history, True
         )
         history_list = {**history_list, **_history_list}
 
@@ -482,6 +523,15 @@ def compile_statistics(  # noqa: C901
     last_stats = statistics.get_latest_short_term_statistics_with_session(
         hass, session, to_query, {"last_reset", "state", "sum"}, metadata=old_metadatas
     )
+    mean_series = {
+        entity_id: [(fstate, state.last_updated) for fstate, state in float_states]
+        for entity_id, _, _, float_states in to_process
+        if "mean" in wanted_statistics[entity_id]
+    }
+    if sum(map(len, mean_series.values())) > PROCESS_POOL_MIN_STATES:
+        means = hass.process_pool.run(_time_weighted_averages, mean_series, start, end)
+    else:
+        means = _time_weighted_averages(mean_series, start, end)
     for (  # pylint: disable=too-many-nested-blocks
         entity_id,
         statistics_unit,
@@ -535,7 +585,7 @@ def compile_statistics(  # noqa: C901
             )
 
         if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            stat["mean"] = means[entity_id]
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
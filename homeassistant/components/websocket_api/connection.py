@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal
@@ -45,6 +46,7 @@ class ActiveConnection:
         "supported_features",
         "handlers",
         "binary_handlers",
+        "_wait_drained",
     )
 
     def __init__(
@@ -54,6 +56,7 @@ class ActiveConnection:
         send_message: Callable[[bytes | str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        wait_drained: Callable[[], asyncio.Future[None]] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
@@ -69,12 +72,26 @@ class ActiveConnection:
             self.hass.data[const.DOMAIN]
         )
         self.binary_handlers: list[BinaryHandler | None] = []
+        self._wait_drained = wait_drained
         current_connection.set(self)
 
     def __repr__(self) -> str:
         """Return the representation."""
         return f"<ActiveConnection {self.get_description(None)}>"
 
+    @callback
+    def async_wait_drained(self) -> asyncio.Future[None]:
+        """Return a future done once the queued messages are written.
+
+        Handlers streaming large responses await this between messages
+        so they never run ahead of the client.
+        """
+        if self._wait_drained is None:
+            future: asyncio.Future[None] = self.hass.loop.create_future()
+            future.set_result(None)
+            return future
+        return self._wait_drained()
+
     def set_supported_features(self, features: dict[str, float]) -> None:
         """Set supported features."""
         self.supported_features = features
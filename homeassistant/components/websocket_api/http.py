@@ -82,6 +82,7 @@ class WebSocketHandler:
         "_message_queue",
         "_ready_future",
         "_release_ready_queue_size",
+        "_drain_waiters",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -105,6 +106,9 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        # Futures done once the message queue is written, see
+        # ActiveConnection.async_wait_drained
+        self._drain_waiters: list[asyncio.Future[None]] = []
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -132,6 +136,7 @@ class WebSocketHandler:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
         message_queue = self._message_queue
+        drain_waiters = self._drain_waiters
         logger = self._logger
         wsock = self._wsock
         loop = self._loop
@@ -158,6 +163,8 @@ class WebSocketHandler:
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
+                    if drain_waiters and not message_queue:
+                        self._release_drain_waiters()
                     continue
 
                 coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
@@ -165,6 +172,8 @@ class WebSocketHandler:
                 if is_debug_log_enabled():
                     debug("%s: Sending %s", self.description, coalesced_messages)
                 await send_bytes_text(coalesced_messages)
+                if drain_waiters and not message_queue:
+                    self._release_drain_waiters()
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -174,6 +183,25 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            self._release_drain_waiters()
+
+    @callback
+    def _async_wait_drained(self) -> asyncio.Future[None]:
+        """Return a future done once the queued messages are written."""
+        future: asyncio.Future[None] = self._loop.create_future()
+        if self._closing or not self._message_queue:
+            future.set_result(None)
+        else:
+            self._drain_waiters.append(future)
+        return future
+
+    @callback
+    def _release_drain_waiters(self) -> None:
+        """Release the futures waiting for the queued messages to be written."""
+        for future in self._drain_waiters:
+            if not future.done():
+                future.set_result(None)
+        self._drain_waiters.clear()
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -286,6 +314,7 @@ class WebSocketHandler:
         """Cancel the connection."""
         self._closing = True
         self._cancel_peak_checker()
+        self._release_drain_waiters()
         if self._handle_task is not None:
             self._handle_task.cancel()
         if self._writer_task is not None:
@@ -336,7 +365,13 @@ class WebSocketHandler:
 
         send_bytes_text = partial(send_frame, opcode=WSMsgType.TEXT)
         auth = AuthPhase(
-            logger, hass, self._send_message, self._cancel, request, send_bytes_text
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            send_bytes_text,
+            self._async_wait_drained,
         )
         connection: ActiveConnection | None = None
         disconnect_warn: str | None = None
@@ -366,6 +401,7 @@ class WebSocketHandler:
                 connection.async_handle_close()
 
             self._closing = True
+            self._release_drain_waiters()
             if self._ready_future and not self._ready_future.done():
                 self._ready_future.set_result(len(self._message_queue))
 
@@ -221,9 +221,11 @@ def _state_diff_event(
             additions[COMPRESSED_STATE_CONTEXT]["id"] = new_state_context.id
         else:
             additions[COMPRESSED_STATE_CONTEXT] = new_state_context.id
-    if (old_attributes := old_state.attributes) != (
+    # The state machine reuses the attributes object when the
+    # attributes did not change so we can avoid comparing them
+    if (old_attributes := old_state.attributes) is not (
         new_attributes := new_state.attributes
-    ):
+    ) and old_attributes != new_attributes:
         if added := {
             key: value
             for key, value in new_attributes.items()
@@ -106,9 +106,10 @@ from .util.async_ import (
     shutdown_run_callback_threadsafe,
 )
 from .util.event_type import EventType
-from .util.executor import InterruptibleThreadPoolExecutor
+from .util.executor import InterruptibleThreadPoolExecutor, ProcessJobPool
 from .util.hass_dict import HassDict
 from .util.json import JsonObjectType
+from .util.loop_monitor import LoopMonitor
 from .util.read_only_dict import ReadOnlyDict
 from .util.timeout import TimeoutManager
 from .util.ulid import ulid_at_time, ulid_now
@@ -455,7 +456,12 @@ class HomeAssistant:
         self.import_executor = InterruptibleThreadPoolExecutor(
             max_workers=1, thread_name_prefix="ImportExecutor"
         )
+        self.process_pool = ProcessJobPool()
         self.loop_thread_id = getattr(self.loop, "_thread_id")
+        self.loop_monitor: LoopMonitor | None = None
+        # If not None, callbacks run by async_run_hass_job and
+        # executor jobs are timed
+        self._job_timer: LoopMonitor | None = None
 
     def verify_event_loop_thread(self, what: str) -> None:
         """Report and raise if we are not running in the event loop thread."""
@@ -769,7 +775,10 @@ class HomeAssistant:
         else:
             if TYPE_CHECKING:
                 hassjob = cast(HassJob[..., _R], hassjob)
-            task = self.loop.run_in_executor(None, hassjob.target, *args)
+            target = hassjob.target
+            if self._job_timer is not None:
+                target = self._job_timer.async_wrap_executor_job(target)
+            task = self.loop.run_in_executor(None, target, *args)
 
         task_bucket = self._background_tasks if background else self._tasks
         task_bucket.add(task)
@@ -878,6 +887,8 @@ class HomeAssistant:
         self, target: Callable[[*_Ts], _T], *args: *_Ts
     ) -> asyncio.Future[_T]:
         """Add an executor job from within the event loop."""
+        if self._job_timer is not None:
+            target = self._job_timer.async_wrap_executor_job(target)
         task = self.loop.run_in_executor(None, target, *args)
 
         tracked = asyncio.current_task() in self._tasks
@@ -897,6 +908,19 @@ class HomeAssistant:
         """
         return self.loop.run_in_executor(self.import_executor, target, *args)
 
+    @callback
+    def async_add_process_job[*_Ts, _T](
+        self, target: Callable[[*_Ts], _T], *args: *_Ts
+    ) -> asyncio.Future[_T]:
+        """Add a CPU bound job to the process pool from within the event loop.
+
+        The target must be a module level function and its arguments and
+        result must be picklable.
+        """
+        return self.async_create_task_internal(
+            self.process_pool.async_run(target, *args), eager_start=True
+        )
+
     @overload
     @callback
     def async_run_hass_job[_R](
@@ -938,11 +962,70 @@ class HomeAssistant:
         if hassjob.job_type is HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob = cast(HassJob[..., _R], hassjob)
-            hassjob.target(*args)
+            if (job_timer := self._job_timer) is None:
+                hassjob.target(*args)
+                return None
+            start = time.perf_counter()
+            try:
+                hassjob.target(*args)
+            finally:
+                job_timer.async_record_job(
+                    hassjob.target, time.perf_counter() - start
+                )
             return None
 
         return self._async_add_hass_job(hassjob, *args, background=background)
 
+    @callback
+    def async_start_loop_monitor(self) -> LoopMonitor:
+        """Start monitoring the event loop.
+
+        While the monitor is running the event loop lag is sampled.
+
+        This method must be run in the event loop.
+        """
+        if self.loop_monitor is None:
+            self.loop_monitor = LoopMonitor(self.loop)
+        self.loop_monitor.async_start()
+        return self.loop_monitor
+
+    @callback
+    def async_stop_loop_monitor(self) -> None:
+        """Stop monitoring the event loop.
+
+        This method must be run in the event loop.
+        """
+        self.async_stop_job_timing()
+        if self.loop_monitor is not None:
+            self.loop_monitor.async_stop()
+            self.loop_monitor = None
+
+    @callback
+    def async_start_job_timing(self) -> LoopMonitor:
+        """Start timing jobs per integration with the loop monitor.
+
+        While job timing runs the execution time of callbacks run with
+        async_run_hass_job, of tasks and of executor jobs added through this
+        object is recorded per integration. Timing adds overhead to every
+        job so it only runs when started explicitly.
+
+        This method must be run in the event loop.
+        """
+        loop_monitor = self.async_start_loop_monitor()
+        loop_monitor.async_start_job_timing()
+        self._job_timer = loop_monitor
+        return loop_monitor
+
+    @callback
+    def async_stop_job_timing(self) -> None:
+        """Stop timing jobs per integration.
+
+        This method must be run in the event loop.
+        """
+        if self._job_timer is not None:
+            self._job_timer.async_stop_job_timing()
+            self._job_timer = None
+
     @overload
     @callback
     def async_run_job[_R, *_Ts](
@@ -1144,6 +1227,7 @@ class HomeAssistant:
             task.add_done_callback(self._tasks.remove)
             task.cancel("Home Assistant is stopping")
         self._cancel_cancellable_timers()
+        self.async_stop_loop_monitor()
 
         self.exit_code = exit_code
 
@@ -1222,6 +1306,9 @@ class HomeAssistant:
             )
             self._async_log_running_tasks("close")
 
+        if self.process_pool.started:
+            await self.loop.run_in_executor(None, self.process_pool.shutdown)
+
         self.set_state(CoreState.stopped)
         self.import_executor.shutdown()
 
@@ -1295,7 +1382,11 @@ class Context:
     @under_cached_property
     def _as_read_only_dict(self) -> ReadOnlyDict[str, str | None]:
         """Return a ReadOnlyDict representation of the context."""
-        return ReadOnlyDict(self._as_dict)
+        read_only_dict = ReadOnlyDict(self._as_dict)
+        # Replace the cached dict with the ReadOnlyDict since they
+        # have the same contents to avoid keeping two copies in memory.
+        self._cache["_as_dict"] = read_only_dict
+        return read_only_dict
 
     @under_cached_property
     def json_fragment(self) -> json_fragment:
@@ -1902,14 +1993,22 @@ class State:
     ) -> ReadOnlyDict[str, datetime.datetime | Collection[Any]]:
         """Return a ReadOnlyDict representation of the State."""
         as_dict = self._as_dict
-        context = as_dict["context"]
         # json_fragment will serialize data from a ReadOnlyDict
         # or a normal dict so its ok to have either. We only
         # mutate the cache if someone asks for the as_dict version
         # to avoid storing multiple copies of the data in memory.
-        if type(context) is not ReadOnlyDict:
-            as_dict["context"] = ReadOnlyDict(context)
-        return ReadOnlyDict(as_dict)
+        # The ReadOnlyDict of the context is cached on the context
+        # so it is shared with every state and event created with it.
+        if type(as_dict["context"]) is not ReadOnlyDict:
+            # _as_read_only_dict is marked as protected
+            # to avoid callers outside of this module
+            # from misusing it by mistake.
+            as_dict["context"] = self.context._as_read_only_dict  # noqa: SLF001
+        read_only_dict = ReadOnlyDict(as_dict)
+        # Replace the cached dict with the ReadOnlyDict since they
+        # have the same contents to avoid keeping two copies in memory.
+        self._cache["_as_dict"] = read_only_dict
+        return read_only_dict
 
     @under_cached_property
     def as_dict_json(self) -> bytes:
@@ -2318,7 +2417,9 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            same_attr = (
+                old_state.attributes is attributes or old_state.attributes == attributes
+            )
             last_changed = old_state.last_changed if same_state else None
 
         # It is much faster to convert a timestamp to a utc datetime object
@@ -2358,6 +2459,8 @@ class StateMachine:
         if same_attr:
             if TYPE_CHECKING:
                 assert old_state is not None
+            # Reuse the attributes object of the old state so consumers
+            # can detect unchanged attributes with an identity check
             attributes = old_state.attributes
 
         # This is intentionally called with positional only arguments for performance
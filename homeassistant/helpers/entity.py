@@ -40,6 +40,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import (
     CALLBACK_TYPE,
+    DOMAIN as HOMEASSISTANT_DOMAIN,
     Context,
     Event,
     HassJobType,
@@ -85,6 +86,26 @@ CAPABILITIES_UPDATE_LIMIT = 100
 
 CONTEXT_RECENT_TIME_SECONDS = 5  # Time that a context is considered recent
 
+# Properties the static state attributes are calculated from, the static state
+# attributes are cached if all of them are cached properties
+STATIC_ATTRIBUTES_PROPERTIES: Final = frozenset(
+    {
+        "assumed_state",
+        "attribution",
+        "device_class",
+        "entity_picture",
+        "has_entity_name",
+        "icon",
+        "name",
+        "supported_features",
+        "use_device_name",
+    }
+)
+
+# Entity registry option of the homeassistant options domain to coalesce state
+# writes made within the given number of seconds
+MIN_WRITE_INTERVAL: Final = "min_write_interval"
+
 
 @callback
 def async_setup(hass: HomeAssistant) -> None:
@@ -196,6 +217,25 @@ def get_unit_of_measurement(hass: HomeAssistant, entity_id: str) -> str | None:
     return entry.unit_of_measurement
 
 
+def _coerce_min_write_interval(entity_id: str, value: Any) -> float | None:
+    """Return the minimum write interval option as a positive float.
+
+    Invalid values are ignored and state writes are not coalesced.
+    """
+    if value is None:
+        return None
+    try:
+        min_write_interval = float(value)
+    except (TypeError, ValueError):
+        min_write_interval = math.nan
+    if not math.isfinite(min_write_interval) or min_write_interval < 0:
+        _LOGGER.warning(
+            "Ignoring invalid %s %s for %s", MIN_WRITE_INTERVAL, value, entity_id
+        )
+        return None
+    return min_write_interval or None
+
+
 ENTITY_CATEGORIES_SCHEMA: Final = vol.Coerce(EntityCategory)
 
 
@@ -310,6 +350,7 @@ class CachedProperties(type):
         def deleter(name: str) -> Callable[[Any], None]:
             """Create a deleter for an _attr_ property."""
             private_attr_name = f"__attr_{name}"
+            static = name in STATIC_ATTRIBUTES_PROPERTIES
 
             def _deleter(o: Any) -> None:
                 """Delete an _attr_ property.
@@ -322,6 +363,9 @@ class CachedProperties(type):
                 """
                 # Invalidate the cache of the cached property
                 o.__dict__.pop(name, None)
+                if static:
+                    # Invalidate the cached static state attributes
+                    o.__dict__.pop("_static_attributes", None)
                 # Delete the __attr_ attribute
                 delattr(o, private_attr_name)
 
@@ -330,6 +374,7 @@ class CachedProperties(type):
         def setter(name: str) -> Callable[[Any, Any], None]:
             """Create a setter for an _attr_ property."""
             private_attr_name = f"__attr_{name}"
+            static = name in STATIC_ATTRIBUTES_PROPERTIES
 
             def _setter(o: Any, val: Any) -> None:
                 """Set an _attr_ property to the backing __attr attribute.
@@ -344,6 +389,9 @@ class CachedProperties(type):
                 setattr(o, private_attr_name, val)
                 # Invalidate the cache of the cached property
                 o.__dict__.pop(name, None)
+                if static:
+                    # Invalidate the cached static state attributes
+                    o.__dict__.pop("_static_attributes", None)
 
             return _setter
 
@@ -498,6 +546,13 @@ class Entity(
     _context: Context | None = None
     _context_set: float | None = None
 
+    # Coalesced state writes, the minimum write interval is set from the
+    # entity registry options
+    _min_write_interval: float | None = None
+    _write_window_end: float | None = None
+    _coalesced_write: asyncio.TimerHandle | None = None
+    _coalesced_context: Context | None = None
+
     # If entity is added to an entity platform
     _platform_state = EntityPlatformState.NOT_ADDED
 
@@ -514,6 +569,21 @@ class Entity(
     # Job type cache
     _job_types: dict[str, HassJobType] | None = None
 
+    # Static state attributes cache, only used if all properties the static
+    # state attributes are calculated from are cached properties, set
+    # automatically by __init_subclass__
+    __static_attributes_cacheable: bool = False
+    _static_attributes: (
+        tuple[
+            er.RegistryEntry | None,
+            dr.DeviceEntry | None,
+            dict[str, Any],
+            str | None,
+            int | None,
+        ]
+        | None
+    ) = None
+
     # StateInfo. Set by EntityPlatform by calling async_internal_added_to_hass
     # While not purely typed, it makes typehinting more useful for us
     # and removes the need for constant None checks or asserts.
@@ -553,6 +623,12 @@ class Entity(
         cls.__combined_unrecorded_attributes = (
             cls._entity_component_unrecorded_attributes | cls._unrecorded_attributes
         )
+        # We need to use type.__getattribute__ to retrieve the underlying
+        # property or cached_property object instead of the property's value.
+        cls.__static_attributes_cacheable = all(
+            isinstance(type.__getattribute__(cls, property_name), cached_property)
+            for property_name in STATIC_ATTRIBUTES_PROPERTIES
+        )
 
     def get_hassjob_type(self, function_name: str) -> HassJobType:
         """Get the job type function for the given name.
@@ -1076,6 +1152,40 @@ class Entity(
         if (unit_of_measurement := self.unit_of_measurement) is not None:
             attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
 
+        if (
+            (static := self._static_attributes) is None
+            or static[0] is not entry
+            or static[1] is not self.device_entry
+        ):
+            static = self.__async_calculate_static_attributes(entry)
+            if self.__static_attributes_cacheable:
+                self._static_attributes = static
+
+        _, _, static_attr, original_device_class, supported_features = static
+        attr.update(static_attr)
+
+        return (state, attr, capability_attr, original_device_class, supported_features)
+
+    def __async_calculate_static_attributes(
+        self, entry: er.RegistryEntry | None
+    ) -> tuple[
+        er.RegistryEntry | None,
+        dr.DeviceEntry | None,
+        dict[str, Any],
+        str | None,
+        int | None,
+    ]:
+        """Calculate the state attributes which rarely change.
+
+        Returns a tuple:
+        entry - the entity registry entry the attributes are calculated from
+        device_entry - the device registry entry the attributes are calculated from
+        attr - the attribute dictionary
+        original_device_class - the device class which may be overridden
+        supported_features - the supported features
+        """
+        attr: dict[str, Any] = {}
+
         if assumed_state := self.assumed_state:
             attr[ATTR_ASSUMED_STATE] = assumed_state
 
@@ -1102,7 +1212,22 @@ class Entity(
         if (supported_features := self.supported_features) is not None:
             attr[ATTR_SUPPORTED_FEATURES] = supported_features
 
-        return (state, attr, capability_attr, original_device_class, supported_features)
+        return (
+            entry,
+            self.device_entry,
+            attr,
+            original_device_class,
+            supported_features,
+        )
+
+    @callback
+    def _async_invalidate_static_attributes(self) -> None:
+        """Invalidate the cached static state attributes.
+
+        Must be called when the cache of a property the static state attributes
+        are calculated from is cleared without using its _attr_ setter.
+        """
+        self._static_attributes = None
 
     @callback
     def _async_write_ha_state(self) -> None:
@@ -1207,6 +1332,13 @@ class Entity(
             self._context = None
             self._context_set = None
 
+        if self._min_write_interval is not None and self.__async_coalesce_write(
+            state, attr
+        ):
+            # The context may have expired by the time the write is done
+            self._coalesced_context = self._context
+            return
+
         try:
             hass.states.async_set_internal(
                 entity_id,
@@ -1225,6 +1357,89 @@ class Entity(
                 entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
             )
 
+    @callback
+    def __async_coalesce_write(self, state: str, attr: dict[str, Any]) -> bool:
+        """Return if the state write should be deferred to the end of the window.
+
+        The first write opens a window of the minimum write interval, writes
+        within the window are coalesced into a single write of the latest
+        state at the end of the window unless they are significant.
+        """
+        assert self._min_write_interval is not None
+        hass = self.hass
+        now = hass.loop.time()
+        if (
+            (window_end := self._write_window_end) is not None
+            and now < window_end
+            and not self.__async_is_significant_write(state, attr)
+        ):
+            if self._coalesced_write is None:
+                self._coalesced_write = hass.loop.call_at(
+                    window_end, self._async_write_coalesced_state
+                )
+            return True
+
+        self._async_cancel_coalesced_write()
+        self._write_window_end = now + self._min_write_interval
+        return False
+
+    @callback
+    def __async_is_significant_write(self, state: str, attr: dict[str, Any]) -> bool:
+        """Return if a state write is significant and should not be coalesced."""
+        # pylint: disable-next=import-outside-toplevel
+        from .significant_change import async_is_significant_change
+
+        if (old_state := self.hass.states.get(self.entity_id)) is None:
+            return True
+        return async_is_significant_change(self.hass, old_state, state, attr)
+
+    @callback
+    def _async_write_coalesced_state(self) -> None:
+        """Write the latest state at the end of the write window."""
+        self._coalesced_write = None
+        self._write_window_end = None
+        # Write with the context of the coalesced write, clearing the
+        # context set time keeps it from expiring during this write
+        context, context_set = self._context, self._context_set
+        self._context, self._context_set = self._coalesced_context, None
+        self._coalesced_context = None
+        try:
+            self._async_write_ha_state()
+        finally:
+            self._context, self._context_set = context, context_set
+
+    @callback
+    def _async_cancel_coalesced_write(self) -> None:
+        """Cancel a pending coalesced state write."""
+        if self._coalesced_write is not None:
+            self._coalesced_write.cancel()
+            self._coalesced_write = None
+            self._coalesced_context = None
+
+    async def __async_update_min_write_interval(self) -> None:
+        """Update the minimum write interval from the entity registry options."""
+        min_write_interval: float | None = None
+        if (entry := self.registry_entry) is not None and (
+            core_options := entry.options.get(HOMEASSISTANT_DOMAIN)
+        ):
+            min_write_interval = _coerce_min_write_interval(
+                self.entity_id, core_options.get(MIN_WRITE_INTERVAL)
+            )
+
+        if min_write_interval == self._min_write_interval:
+            return
+
+        self._min_write_interval = min_write_interval
+        self._write_window_end = None
+        if min_write_interval is None:
+            self._async_cancel_coalesced_write()
+            return
+
+        # pylint: disable-next=import-outside-toplevel
+        from .significant_change import async_initialize
+
+        await async_initialize(self.hass)
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -1477,12 +1692,14 @@ class Entity(
                 )
             )
             self._async_subscribe_device_updates()
+            await self.__async_update_min_write_interval()
 
     async def async_internal_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass.
 
         Not to be extended by integrations.
         """
+        self._async_cancel_coalesced_write()
         # The check for self.platform guards against integrations not using an
         # EntityComponent and can be removed in HA Core 2024.1
         if self.platform:
@@ -1532,6 +1749,7 @@ class Entity(
 
         assert old is not None
         if registry_entry.entity_id == old.entity_id:
+            await self.__async_update_min_write_interval()
             self.async_registry_entry_updated()
             self.async_write_ha_state()
             return
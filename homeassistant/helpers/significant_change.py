@@ -110,6 +110,40 @@ async def _initialize(hass: HomeAssistant) -> None:
     await async_process_integration_platforms(hass, PLATFORM, process_platform)
 
 
+async def async_initialize(hass: HomeAssistant) -> None:
+    """Load the significant change platforms."""
+    await _initialize(hass)
+
+
+@callback
+def async_is_significant_change(
+    hass: HomeAssistant,
+    old_state: State,
+    new_state: str,
+    new_attrs: dict[str, Any],
+) -> bool:
+    """Return if a state change is significant.
+
+    Changes from or to unknown/unavailable are always significant. Other changes
+    are checked with the significant change platform of the domain, a platform
+    that doesn't know is not significant. Without a platform only a change of
+    the state is significant.
+    """
+    if old_state.state != new_state and (
+        old_state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE)
+        or new_state in (STATE_UNKNOWN, STATE_UNAVAILABLE)
+    ):
+        return True
+
+    functions = hass.data.get(DATA_FUNCTIONS)
+    if functions is None or (check := functions.get(old_state.domain)) is None:
+        return old_state.state != new_state
+
+    return (
+        check(hass, old_state.state, old_state.attributes, new_state, new_attrs) is True
+    )
+
+
 def either_one_none(val1: Any | None, val2: Any | None) -> bool:
     """Test if exactly one value is None."""
     return (val1 is None and val2 is not None) or (val1 is not None and val2 is None)
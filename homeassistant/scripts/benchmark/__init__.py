@@ -6,17 +6,28 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+from itertools import chain
 import logging
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from statistics import fmean
 from timeit import default_timer as timer
+import tracemalloc
 
-from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant import config_entries, core, loader
+from homeassistant.const import EVENT_STATE_CHANGED, UnitOfPower
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.recorder import async_initialize_recorder
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from homeassistant.util.executor import ProcessJobPool
+from homeassistant.util.loop_monitor import LoopMonitor
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -308,3 +319,312 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def state_machine_memory(hass):
+    """Measure state machine memory with 10k and 50k synthetic entities.
+
+    The serialized forms requested by the frontend and the REST API
+    are generated for every state since they are cached on the state.
+    """
+    start = timer()
+    for entity_count in (10**4, 5 * 10**4):
+        states = core.StateMachine(hass.bus, hass.loop)
+        tracemalloc.start()
+        for idx in range(entity_count):
+            states.async_set(
+                f"sensor.benchmark_{idx}",
+                str(idx % 100),
+                {
+                    "device_class": "temperature",
+                    "friendly_name": f"Benchmark {idx}",
+                    "state_class": "measurement",
+                    "unit_of_measurement": "°C",
+                },
+            )
+        loaded, _ = tracemalloc.get_traced_memory()
+        for state in states.async_all():
+            state.as_dict()
+            state.as_dict_json  # noqa: B018
+            state.as_compressed_state_json  # noqa: B018
+        serialized, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{entity_count} entities: {loaded / entity_count:.0f} bytes per state"
+            f" loaded, {serialized / entity_count:.0f} bytes per state serialized"
+        )
+    return timer() - start
+
+
+@benchmark
+async def sensor_entity_write_state(hass):
+    """Write the state of a power sensor 100k times.
+
+    The writes are run for a sensor with cached static state attributes and
+    for a sensor which calculates them on every write.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.entity_platform import EntityPlatform
+
+    platform = EntityPlatform(
+        hass=hass,
+        logger=logging.getLogger(__name__),
+        domain="sensor",
+        platform_name="benchmark",
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+
+    class CachedSensor(SensorEntity):
+        _attr_device_class = SensorDeviceClass.POWER
+        _attr_icon = "mdi:flash"
+        _attr_name = "Power"
+        _attr_native_unit_of_measurement = UnitOfPower.WATT
+
+    class UncachedSensor(CachedSensor):
+        @property
+        def icon(self) -> str:
+            return "mdi:flash"
+
+    writes = 10**5
+    start = timer()
+    for sensor_cls in (CachedSensor, UncachedSensor):
+        sensor = sensor_cls()
+        sensor.add_to_platform_start(hass, platform, None)
+        sensor.entity_id = f"sensor.{sensor_cls.__name__.lower()}"
+        sensor_start = timer()
+        for value in range(writes):
+            sensor._attr_native_value = value  # noqa: SLF001
+            sensor.async_write_ha_state()
+        sensor_runtime = timer() - sensor_start
+        print(f"{sensor_cls.__name__}: {writes / sensor_runtime:.0f} writes/s")
+    return timer() - start
+
+
+def _cpu_bound_job(count: int) -> int:
+    """Return the sum of the squares below count."""
+    return sum(value * value for value in range(count))
+
+
+@benchmark
+async def cpu_bound_jobs_loop_lag(hass):
+    """Measure the event loop lag while running CPU bound jobs.
+
+    The jobs are run in the executor and in the process pool.
+    """
+    hass.process_pool = ProcessJobPool(max(hass.process_pool.max_workers, 1))
+    # Start the worker processes before measuring
+    await hass.async_add_process_job(_cpu_bound_job, 1)
+
+    jobs = 20
+    count = 10**6
+    start = timer()
+    for name, add_job in (
+        ("executor", hass.async_add_executor_job),
+        ("process pool", hass.async_add_process_job),
+    ):
+        monitor = LoopMonitor(hass.loop, interval=0.005)
+        monitor.async_start()
+        job_start = timer()
+        await asyncio.gather(*(add_job(_cpu_bound_job, count) for _ in range(jobs)))
+        job_runtime = timer() - job_start
+        monitor.async_stop()
+        print(
+            f"{name}: {job_runtime:.2f}s, max loop lag"
+            f" {monitor.lag_max * 1000:.1f}ms over {monitor.lag_samples} samples"
+        )
+    return timer() - start
+
+
+@benchmark
+async def recorder_write_states(hass):
+    """Record 50k state changes of 300 entities in a SQLite database."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import get_instance
+
+    count = 50_000
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        async_initialize_recorder(hass)
+        db_url = f"sqlite:///{Path(config_dir, 'benchmark.db')}"
+        await async_setup_component(hass, "recorder", {"recorder": {"db_url": db_url}})
+        instance = get_instance(hass)
+        await hass.async_start()
+        await instance.async_recorder_ready.wait()
+
+        start = timer()
+        for value in range(count):
+            hass.states.async_set(
+                f"sensor.power_{value % 300}", str(value), {"unit_of_measurement": "W"}
+            )
+        await instance.async_block_till_done()
+        runtime = timer() - start
+        print(f"{count / runtime:.0f} events/s")
+        await hass.async_stop()
+    return runtime
+
+
+def _insert_hourly_statistics(hass, statistic_ids, start, hours):
+    """Insert hourly mean and sum statistics of the statistic ids."""
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import insert
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.db_schema import (
+        Statistics,
+        StatisticsMeta,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.util import session_scope
+
+    start_ts = start.timestamp()
+    with session_scope(hass=hass) as session:
+        for statistic_id in statistic_ids:
+            meta = StatisticsMeta.from_meta(
+                {
+                    "has_mean": True,
+                    "has_sum": True,
+                    "name": None,
+                    "source": "recorder",
+                    "statistic_id": statistic_id,
+                    "unit_of_measurement": "kWh",
+                }
+            )
+            session.add(meta)
+            session.flush()
+            session.execute(
+                insert(Statistics),
+                [
+                    {
+                        "metadata_id": meta.id,
+                        "created_ts": start_ts,
+                        "start_ts": start_ts + hour * 3600,
+                        "mean": float(hour % 24),
+                        "min": 0.0,
+                        "max": float(hour % 48),
+                        "state": float(hour),
+                        "sum": float(hour),
+                    }
+                    for hour in range(hours)
+                ],
+            )
+            # Keep the transactions short, the recorder thread writes too
+            session.commit()
+
+
+def _reduce_hourly_statistics(stats, factory, period):
+    """Reduce hourly statistics to longer periods in Python.
+
+    This is how the statistics were reduced before it was done in the
+    database, it is kept as the baseline of statistics_during_period.
+    """
+    same_period, period_start_end = factory()
+    period_seconds = period.total_seconds()
+    result = {}
+    for statistic_id, stat_list in stats.items():
+        rows = result[statistic_id] = []
+        max_values, mean_values, min_values = [], [], []
+        prev_stat = stat_list[0]
+        fake_entry = {"start": stat_list[-1]["start"] + period_seconds}
+        for stat in chain(stat_list, (fake_entry,)):
+            if not same_period(prev_stat["start"], stat["start"]):
+                start, end = period_start_end(prev_stat["start"])
+                rows.append(
+                    {
+                        "start": start,
+                        "end": end,
+                        "mean": fmean(mean_values) if mean_values else None,
+                        "min": min(min_values) if min_values else None,
+                        "max": max(max_values) if max_values else None,
+                        "sum": prev_stat["sum"],
+                    }
+                )
+                max_values.clear()
+                mean_values.clear()
+                min_values.clear()
+            if (value := stat.get("max")) is not None:
+                max_values.append(value)
+            if (value := stat.get("mean")) is not None:
+                mean_values.append(value)
+            if (value := stat.get("min")) is not None:
+                min_values.append(value)
+            prev_stat = stat
+    return result
+
+
+@benchmark
+async def statistics_during_period(hass):
+    """Fetch a year of hourly, daily, weekly and monthly statistics of 100 ids.
+
+    The reduction in the database is compared with the baseline fetching
+    the hourly statistics and reducing them in Python.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import get_instance, statistics
+
+    types = {"max", "mean", "min", "sum"}
+    statistic_ids = {f"sensor.energy_{idx}" for idx in range(100)}
+    start_time = dt_util.start_of_local_day() - timedelta(days=365)
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        async_initialize_recorder(hass)
+        db_url = f"sqlite:///{Path(config_dir, 'benchmark.db')}"
+        await async_setup_component(hass, "recorder", {"recorder": {"db_url": db_url}})
+        instance = get_instance(hass)
+        await hass.async_start()
+        await instance.async_recorder_ready.wait()
+        await instance.async_block_till_done()
+        await instance.async_add_executor_job(
+            _insert_hourly_statistics, hass, statistic_ids, start_time, 365 * 24
+        )
+
+        start = timer()
+        for period in ("hour", "day", "week", "month"):
+            period_start = timer()
+            await instance.async_add_executor_job(
+                statistics.statistics_during_period,
+                hass,
+                start_time,
+                None,
+                statistic_ids,
+                period,
+                None,
+                types,
+            )
+            print(f"{period}: {timer() - period_start:.3f}s")
+        runtime = timer() - start
+
+        for period, factory, length in (
+            ("day", statistics.reduce_day_ts_factory, timedelta(days=1)),
+            ("week", statistics.reduce_week_ts_factory, timedelta(days=7)),
+            ("month", statistics.reduce_month_ts_factory, timedelta(days=31)),
+        ):
+            period_start = timer()
+            hourly = await instance.async_add_executor_job(
+                statistics.statistics_during_period,
+                hass,
+                start_time,
+                None,
+                statistic_ids,
+                "hour",
+                None,
+                types,
+            )
+            await instance.async_add_executor_job(
+                _reduce_hourly_statistics, hourly, factory, length
+            )
+            print(f"{period} (python baseline): {timer() - period_start:.3f}s")
+        await hass.async_stop()
+    return runtime
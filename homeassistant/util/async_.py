@@ -42,6 +42,9 @@ def create_eager_task[_T](
             frame.report("attempted to create an asyncio task from a thread")
             raise
 
+    if (task_factory := loop.get_task_factory()) is not None:
+        # The loop monitor sets a task factory while it is timing tasks
+        return task_factory(loop, coro, name=name, eager_start=True)  # type: ignore[call-arg]
     return Task(coro, loop=loop, name=name, eager_start=True)
 
 
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import contextlib
 import logging
+import multiprocessing
+import os
 import sys
-from threading import Thread
+from threading import Lock, Thread
 import time
 import traceback
 from typing import Any
@@ -21,6 +25,10 @@ _JOIN_ATTEMPTS = 10
 
 EXECUTOR_SHUTDOWN_TIMEOUT = 10
 
+# Every worker process imports the modules of the jobs it runs, so the number
+# of workers is kept low to limit the memory used on small systems
+PROCESS_POOL_MAX_WORKERS = min(max((os.cpu_count() or 1) - 1, 0), 2)
+
 
 def _log_thread_running_at_shutdown(name: str, ident: int) -> None:
     """Log the stack of a thread that was still running at shutdown."""
@@ -100,3 +108,82 @@ class InterruptibleThreadPoolExecutor(ThreadPoolExecutor):
             )
             if timeout_remaining <= 0:
                 return
+
+
+def _warm_up_process() -> None:
+    """Do nothing, used to start a worker process."""
+
+
+class ProcessJobPool:
+    """A lazily started pool of worker processes for CPU bound jobs.
+
+    Jobs run in the worker processes don't hold the GIL of the main
+    interpreter. The targets must be module level functions and their
+    arguments and results must be picklable. The workers are spawned and
+    warmed up the first time the pool is used. Without workers, jobs are
+    run in a thread of the main process.
+    """
+
+    __slots__ = ("_executor", "_lock", "max_workers")
+
+    def __init__(self, max_workers: int = PROCESS_POOL_MAX_WORKERS) -> None:
+        """Initialize the pool."""
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = Lock()
+        self.max_workers = max_workers
+
+    @property
+    def started(self) -> bool:
+        """Return if the worker processes have been started."""
+        return self._executor is not None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the executor, starting the worker processes if needed.
+
+        This method must be run in a thread.
+        """
+        with self._lock:
+            if (executor := self._executor) is None:
+                executor = ProcessPoolExecutor(
+                    self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+                warm_up = [
+                    executor.submit(_warm_up_process) for _ in range(self.max_workers)
+                ]
+                for future in warm_up:
+                    future.result()
+                self._executor = executor
+            return executor
+
+    def run[_T](self, target: Callable[..., _T], *args: Any) -> _T:
+        """Run a job in a worker process and wait for its result.
+
+        This method must be run in a thread.
+        """
+        if not self.max_workers:
+            return target(*args)
+        return self._get_executor().submit(target, *args).result()
+
+    async def async_run[_T](self, target: Callable[..., _T], *args: Any) -> _T:
+        """Run a job in a worker process from within the event loop.
+
+        The worker processes are started in the default executor the first
+        time the pool is used. Without workers, jobs are run in the default
+        executor.
+        """
+        loop = asyncio.get_running_loop()
+        if not self.max_workers:
+            return await loop.run_in_executor(None, target, *args)
+        if (executor := self._executor) is None:
+            executor = await loop.run_in_executor(None, self._get_executor)
+        return await asyncio.wrap_future(executor.submit(target, *args))
+
+    def shutdown(self) -> None:
+        """Cancel the queued jobs and stop the worker processes.
+
+        This method must be run in a thread.
+        """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
@@ -0,0 +1,357 @@
+"""Monitor event loop lag and callback execution times."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Coroutine, Generator
+from dataclasses import dataclass, field
+import functools
+import threading
+import time
+from typing import Any, Final
+
+# Upper bounds in seconds of the event loop lag histogram buckets,
+# lags above the last bucket are counted in an overflow bucket
+LAG_BUCKETS: Final = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# Callbacks taking longer than this are counted as slow, this
+# matches the asyncio default for debug mode
+SLOW_CALLBACK_DURATION: Final = 0.1
+
+# How often the event loop lag is sampled
+SAMPLE_INTERVAL: Final = 1.0
+
+# Number of lag samples to keep for recent lag
+RECENT_SAMPLES: Final = 60
+
+CORE_INTEGRATION: Final = "homeassistant"
+
+
+@functools.lru_cache(1024)
+def integration_from_module(module: str | None) -> str:
+    """Return the integration domain a module belongs to.
+
+    Modules outside of an integration are attributed to the core.
+    """
+    if not module:
+        return CORE_INTEGRATION
+    parts = module.split(".", 3)
+    if len(parts) > 2 and parts[0] == "homeassistant" and parts[1] == "components":
+        return parts[2]
+    if len(parts) > 1 and parts[0] == "custom_components":
+        return parts[1]
+    return CORE_INTEGRATION
+
+
+def integration_from_target(target: Callable[..., Any]) -> str:
+    """Return the integration domain a callable belongs to."""
+    while isinstance(target, functools.partial):
+        target = target.func
+    return integration_from_module(getattr(target, "__module__", None))
+
+
+def integration_from_coroutine(coro: Coroutine[Any, Any, Any]) -> str:
+    """Return the integration domain a coroutine belongs to."""
+    if (frame := getattr(coro, "cr_frame", None)) is None:
+        return CORE_INTEGRATION
+    return integration_from_module(frame.f_globals.get("__name__"))
+
+
+@dataclass(slots=True)
+class JobStats:
+    """Execution time statistics of the jobs of an integration."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    slow: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the statistics."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+            "slow": self.slow,
+        }
+
+
+@dataclass(slots=True)
+class IntegrationStats:
+    """Time spent running the jobs of an integration in the event loop."""
+
+    callbacks: JobStats = field(default_factory=JobStats)
+    tasks: JobStats = field(default_factory=JobStats)
+
+    @property
+    def loop_time(self) -> float:
+        """Return the time spent in the event loop."""
+        return self.callbacks.total + self.tasks.total
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the statistics."""
+        return {
+            "callbacks": self.callbacks.as_dict(),
+            "tasks": self.tasks.as_dict(),
+            "loop_time": self.loop_time,
+        }
+
+
+class _TimedCoroutine[_R](Coroutine[Any, Any, _R]):
+    """Coroutine wrapper that records the time spent in each step."""
+
+    __slots__ = ("_coro", "_domain", "_monitor")
+
+    def __init__(
+        self, coro: Coroutine[Any, Any, _R], domain: str, monitor: LoopMonitor
+    ) -> None:
+        """Initialize the wrapper."""
+        self._coro = coro
+        self._domain = domain
+        self._monitor = monitor
+
+    def send(self, value: Any) -> Any:
+        """Run the coroutine until its next suspension point."""
+        start = time.perf_counter()
+        try:
+            return self._coro.send(value)
+        finally:
+            self._monitor.async_record_task_step(
+                self._domain, time.perf_counter() - start
+            )
+
+    def throw(self, *args: Any) -> Any:
+        """Raise an exception in the coroutine."""
+        start = time.perf_counter()
+        try:
+            return self._coro.throw(*args)
+        finally:
+            self._monitor.async_record_task_step(
+                self._domain, time.perf_counter() - start
+            )
+
+    def close(self) -> None:
+        """Close the coroutine."""
+        self._coro.close()
+
+    def __await__(self) -> Generator[Any, None, _R]:
+        """Return an iterator for the wrapped coroutine."""
+        return self._coro.__await__()
+
+    def __repr__(self) -> str:
+        """Return the representation of the wrapped coroutine."""
+        return repr(self._coro)
+
+
+class LoopMonitor:
+    """Record event loop lag and callback execution times.
+
+    The lag is sampled by scheduling a timer and measuring how late it runs.
+    While job timing is started, callback, task and executor job execution
+    times are attributed to the integration the callable or coroutine is
+    defined in.
+    """
+
+    __slots__ = (
+        "_executor_lock",
+        "_handle",
+        "_interval",
+        "_loop",
+        "_next_sample",
+        "_recent_lags",
+        "executor_jobs",
+        "integrations",
+        "lag_histogram",
+        "lag_max",
+        "lag_samples",
+        "slow_callback_duration",
+        "slow_callbacks",
+        "started",
+        "timing_jobs",
+    )
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        slow_callback_duration: float = SLOW_CALLBACK_DURATION,
+        interval: float = SAMPLE_INTERVAL,
+    ) -> None:
+        """Initialize the monitor."""
+        self._loop = loop
+        self._interval = interval
+        self._handle: asyncio.TimerHandle | None = None
+        self._next_sample = 0.0
+        self._recent_lags: deque[float] = deque(maxlen=RECENT_SAMPLES)
+        self.slow_callback_duration = slow_callback_duration
+        self.lag_histogram = [0] * (len(LAG_BUCKETS) + 1)
+        self.lag_max = 0.0
+        self.lag_samples = 0
+        self.slow_callbacks = 0
+        self.started = time.time()
+        self.integrations: dict[str, IntegrationStats] = {}
+        # Executor jobs are recorded from the executor threads
+        self._executor_lock = threading.Lock()
+        self.executor_jobs: dict[str, JobStats] = {}
+        self.timing_jobs = False
+
+    @property
+    def running(self) -> bool:
+        """Return if the monitor is sampling the event loop."""
+        return self._handle is not None
+
+    @property
+    def recent_lag(self) -> float:
+        """Return the highest event loop lag of the recent samples."""
+        return max(self._recent_lags, default=0.0)
+
+    def async_start(self) -> None:
+        """Start sampling the event loop lag."""
+        if self._handle is None:
+            self._async_schedule_sample()
+
+    def async_stop(self) -> None:
+        """Stop sampling the event loop lag."""
+        self.async_stop_job_timing()
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def async_start_job_timing(self) -> None:
+        """Start timing the tasks created in the event loop.
+
+        The coroutine of every task is wrapped to time its steps, which
+        is slower than running it directly, so job timing should only
+        be started while diagnosing a problem.
+        """
+        if not self.timing_jobs:
+            self.timing_jobs = True
+            self._loop.set_task_factory(self._async_task_factory)
+
+    def async_stop_job_timing(self) -> None:
+        """Stop timing the tasks created in the event loop."""
+        if self.timing_jobs:
+            self.timing_jobs = False
+            self._loop.set_task_factory(None)
+
+    def _async_task_factory(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        coro: Coroutine[Any, Any, Any],
+        **kwargs: Any,
+    ) -> asyncio.Task[Any]:
+        """Create a task timing the steps of the coroutine."""
+        return asyncio.Task(self.async_wrap_coroutine(coro), loop=loop, **kwargs)
+
+    def _async_schedule_sample(self) -> None:
+        """Schedule the next lag sample."""
+        self._next_sample = self._loop.time() + self._interval
+        self._handle = self._loop.call_at(self._next_sample, self._async_sample)
+
+    def _async_sample(self) -> None:
+        """Record how late the sample timer ran."""
+        lag = max(self._loop.time() - self._next_sample, 0.0)
+        self.lag_samples += 1
+        self._recent_lags.append(lag)
+        self.lag_max = max(lag, self.lag_max)
+        for idx, upper_bound in enumerate(LAG_BUCKETS):
+            if lag <= upper_bound:
+                self.lag_histogram[idx] += 1
+                break
+        else:
+            self.lag_histogram[-1] += 1
+        self._async_schedule_sample()
+
+    def _async_get_stats(self, domain: str) -> IntegrationStats:
+        """Return the statistics of an integration."""
+        if (stats := self.integrations.get(domain)) is None:
+            stats = self.integrations[domain] = IntegrationStats()
+        return stats
+
+    def _record_duration(
+        self, stats: JobStats, duration: float, in_loop: bool
+    ) -> None:
+        """Record a job execution time."""
+        stats.count += 1
+        stats.total += duration
+        stats.max = max(duration, stats.max)
+        if duration >= self.slow_callback_duration:
+            stats.slow += 1
+            if in_loop:
+                self.slow_callbacks += 1
+
+    def async_record_job(self, target: Callable[..., Any], duration: float) -> None:
+        """Record the execution time of a callable run in the event loop."""
+        stats = self._async_get_stats(integration_from_target(target))
+        self._record_duration(stats.callbacks, duration, True)
+
+    def async_record_task_step(self, domain: str, duration: float) -> None:
+        """Record the execution time of a task step run in the event loop."""
+        self._record_duration(self._async_get_stats(domain).tasks, duration, True)
+
+    def async_wrap_coroutine[_R](
+        self, coro: Coroutine[Any, Any, _R]
+    ) -> Coroutine[Any, Any, _R]:
+        """Wrap a coroutine to record the time spent running it."""
+        return _TimedCoroutine(coro, integration_from_coroutine(coro), self)
+
+    def async_wrap_executor_job[_T](
+        self, target: Callable[..., _T]
+    ) -> Callable[..., _T]:
+        """Wrap an executor job to record the time spent running it."""
+        return functools.partial(
+            self._run_executor_job, integration_from_target(target), target
+        )
+
+    def _run_executor_job[_T](
+        self, domain: str, target: Callable[..., _T], *args: Any
+    ) -> _T:
+        """Run an executor job and record its execution time.
+
+        This method is run in the executor thread.
+        """
+        start = time.perf_counter()
+        try:
+            return target(*args)
+        finally:
+            duration = time.perf_counter() - start
+            with self._executor_lock:
+                if (stats := self.executor_jobs.get(domain)) is None:
+                    stats = self.executor_jobs[domain] = JobStats()
+                self._record_duration(stats, duration, False)
+
+    def async_top_integrations(self, limit: int) -> list[tuple[str, float]]:
+        """Return the integrations that spent the most time in the event loop."""
+        return sorted(
+            ((domain, stats.loop_time) for domain, stats in self.integrations.items()),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:limit]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the collected data."""
+        with self._executor_lock:
+            executor_jobs = {
+                domain: stats.as_dict() for domain, stats in self.executor_jobs.items()
+            }
+        no_jobs = JobStats().as_dict()
+        return {
+            "lag": {
+                "buckets": [*LAG_BUCKETS, None],
+                "histogram": list(self.lag_histogram),
+                "max": self.lag_max,
+                "recent": self.recent_lag,
+                "samples": self.lag_samples,
+            },
+            "slow_callback_duration": self.slow_callback_duration,
+            "slow_callbacks": self.slow_callbacks,
+            "started": self.started,
+            "timing_jobs": self.timing_jobs,
+            "integrations": {
+                domain: {
+                    **self.integrations.get(domain, IntegrationStats()).as_dict(),
+                    "executor": executor_jobs.get(domain, no_jobs),
+                }
+                for domain in self.integrations.keys() | executor_jobs.keys()
+            },
+        }
@@ -97,6 +97,7 @@ from homeassistant.util.async_ import (
 )
 import homeassistant.util.dt as dt_util
 from homeassistant.util.event_type import EventType
+from homeassistant.util.executor import ProcessJobPool
 from homeassistant.util.json import (
     JsonArrayType,
     JsonObjectType,
@@ -199,6 +200,8 @@ async def async_test_home_assistant(
 ) -> AsyncGenerator[HomeAssistant]:
     """Return a Home Assistant object pointing at test config dir."""
     hass = HomeAssistant(config_dir or get_test_config_dir())
+    # Run process jobs in the executor threads so their targets can be patched
+    hass.process_pool = ProcessJobPool(0)
     store = auth_store.AuthStore(hass)
     hass.auth = auth.AuthManager(hass, store, {}, {})
     ensure_auth_manager_loaded(hass.auth)
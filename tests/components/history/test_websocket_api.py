@@ -1,7 +1,10 @@
 """The tests the History component websocket_api."""
 
 import asyncio
+from collections.abc import Iterator
 from datetime import timedelta
+import threading
+from typing import Any
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
@@ -173,6 +176,355 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_stream(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sending the states in chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("1", "2", "3", "4", "5"):
+        hass.states.async_set("sensor.test", state, attributes={"any": "attr"})
+        await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.other", "on")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "STREAM_CHUNK_SIZE", 2):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.test", "sensor.other"],
+                "minimal_response": True,
+                "no_attributes": True,
+                "stream": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 1
+        assert response["result"] is None
+
+        chunks: list[dict[str, Any]] = []
+        while not (response := await client.receive_json())["event"].get("complete"):
+            assert response["id"] == 1
+            assert response["type"] == "event"
+            chunks.append(response["event"]["states"])
+    assert response["event"] == {"states": {}, "complete": True}
+
+    assert [list(chunk) for chunk in chunks] == [
+        ["sensor.test"],
+        ["sensor.test"],
+        ["sensor.test"],
+        ["sensor.other"],
+    ]
+    assert [state["s"] for chunk in chunks[:3] for state in chunk["sensor.test"]] == [
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+    ]
+    assert [state["s"] for state in chunks[3]["sensor.other"]] == ["on"]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": (now + timedelta(days=1)).isoformat(),
+            "entity_ids": ["sensor.test"],
+            "stream": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+    response = await client.receive_json()
+    assert response["event"] == {"states": {}, "complete": True}
+
+
+async def test_history_during_period_stream_unsubscribe(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period stops streaming when the client unsubscribes."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.test", "on")
+    await async_wait_recording_done(hass)
+
+    unsubscribed = threading.Event()
+    finished = threading.Event()
+    fetched: list[str] = []
+
+    def _stream_significant_states(*args: Any) -> Iterator[tuple[str, list[Any]]]:
+        try:
+            for state in ("1", "2", "3"):
+                fetched.append(state)
+                yield "sensor.test", [{"s": state}]
+                unsubscribed.wait(5)
+        finally:
+            finished.set()
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.recorder.history.stream_significant_states",
+        _stream_significant_states,
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.test"],
+                "stream": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"] == {"states": {"sensor.test": [{"s": "1"}]}}
+
+        await client.send_json(
+            {"id": 2, "type": "unsubscribe_events", "subscription": 1}
+        )
+        response = await client.receive_json()
+        assert response["id"] == 2
+        assert response["success"]
+        unsubscribed.set()
+        await hass.async_add_executor_job(finished.wait, 5)
+
+    # The second chunk was fetched but not sent, the third was not fetched
+    assert fetched == ["1", "2"]
+    await client.send_json({"id": 3, "type": "ping"})
+    response = await client.receive_json()
+    assert response == {"id": 3, "type": "pong"}
+
+
+async def test_history_during_period_stream_error(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period ends the stream with an error when it fails."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.test", "on")
+    await async_wait_recording_done(hass)
+
+    def _stream_significant_states(*args: Any) -> Iterator[tuple[str, list[Any]]]:
+        yield "sensor.test", [{"s": "1"}]
+        raise ValueError("boom")
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.recorder.history.stream_significant_states",
+        _stream_significant_states,
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.test"],
+                "stream": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"] == {"states": {"sensor.test": [{"s": "1"}]}}
+        response = await client.receive_json()
+    assert response["id"] == 1
+    assert response["event"] == {
+        "states": {},
+        "complete": True,
+        "error": {"code": "unknown_error", "message": "Unknown error"},
+    }
+    await client.send_json({"id": 2, "type": "ping"})
+    response = await client.receive_json()
+    assert response == {"id": 2, "type": "pong"}
+
+
+async def test_history_during_period_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsampling the states."""
+    now = dt_util.utcnow()
+    values = ["1", "2", "3", "50", "4", "5", "unavailable", "6", "-10", "7", "8"]
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(now) as freezer:
+        for value in values:
+            freezer.tick()
+            hass.states.async_set("sensor.power", value)
+            hass.states.async_set("sensor.other", "on" if value == "1" else "off")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power", "sensor.other"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 4,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    # The first and last states, the unavailable state and the
+    # minimum and maximum of each half of the period are kept
+    assert [state["s"] for state in result["sensor.power"]] == [
+        "1",
+        "50",
+        "unavailable",
+        "-10",
+        "8",
+    ]
+    assert [state["s"] for state in result["sensor.other"]] == ["on", "off"]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "max_points": 4,
+            "stream": True,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
+async def test_history_during_period_limit(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period returning the states in pages."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(now) as freezer:
+        for state in ("1", "2", "3", "4", "5"):
+            freezer.tick()
+            hass.states.async_set("sensor.test", state)
+            await async_recorder_block_till_done(hass)
+        freezer.tick()
+        hass.states.async_set("sensor.other", "on")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    pages: list[dict[str, list[str]]] = []
+    cursor: str | None = None
+    while True:
+        await client.send_json_auto_id(
+            {
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.test", "sensor.other"],
+                "minimal_response": True,
+                "no_attributes": True,
+                "limit": 2,
+                **({"cursor": cursor} if cursor else {}),
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        pages.append(
+            {
+                entity_id: [state["s"] for state in states]
+                for entity_id, states in response["result"]["states"].items()
+            }
+        )
+        if not (cursor := response["result"]["cursor"]):
+            break
+
+    assert pages == [
+        {"sensor.test": ["1", "2"]},
+        {"sensor.test": ["3", "4"]},
+        {"sensor.test": ["5"], "sensor.other": ["on"]},
+    ]
+
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "cursor": "not a cursor",
+            "limit": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_cursor"
+
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "limit": 2,
+            "stream": True,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
+async def test_history_during_period_limit_same_last_updated(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test states sharing last_updated are not skipped at a page boundary."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(now) as freezer:
+        freezer.tick()
+        for state in ("1", "2", "3", "4"):
+            hass.states.async_set("sensor.test", state)
+            await async_recorder_block_till_done(hass)
+        freezer.tick()
+        hass.states.async_set("sensor.test", "5")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    pages: list[list[str]] = []
+    cursor: str | None = None
+    while True:
+        await client.send_json_auto_id(
+            {
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.test"],
+                "minimal_response": True,
+                "no_attributes": True,
+                "limit": 3,
+                **({"cursor": cursor} if cursor else {}),
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        pages.append(
+            [state["s"] for state in response["result"]["states"]["sensor.test"]]
+        )
+        if not (cursor := response["result"]["cursor"]):
+            break
+
+    # The page boundary falls between states with the same last_updated
+    assert pages == [["1", "2", "3"], ["4", "5"]]
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -19,6 +19,8 @@ from homeassistant.components.logbook.models import EventAsRow, LazyEventPartial
 from homeassistant.components.logbook.processor import EventProcessor
 from homeassistant.components.logbook.queries.common import PSEUDO_EVENT_STATE_CHANGED
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import LogbookIndex
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.sensor import SensorStateClass
 from homeassistant.const import (
@@ -2764,6 +2766,206 @@ async def test_get_events_with_device_ids(
     assert isinstance(results[3]["when"], float)
 
 
+@pytest.mark.parametrize("recorder_config", [{"logbook_index": True}])
+@pytest.mark.usefixtures("recorder_mock")
+async def test_get_events_with_logbook_index(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    """Test logbook get_events finds the events in the logbook index."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    instance = recorder.get_instance(hass)
+    assert instance.logbook_index_start_ts is not None
+    assert instance.logbook_index_start_ts <= now.timestamp()
+
+    entry = MockConfigEntry(domain="test", data={"first": True}, options=None)
+    entry.add_to_hass(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+        name="device name",
+    )
+
+    class MockLogbookPlatform:
+        """Mock a logbook platform."""
+
+        @ha.callback
+        def async_describe_events(
+            hass: HomeAssistant,  # noqa: N805
+            async_describe_event: Callable[
+                [str, str, Callable[[Event], dict[str, str]]], None
+            ],
+        ) -> None:
+            """Describe logbook events."""
+
+            @ha.callback
+            def async_describe_test_event(event: Event) -> dict[str, str]:
+                """Describe mock logbook event."""
+                return {
+                    "name": "device name",
+                    "message": "is on fire",
+                }
+
+            async_describe_event("test", "mock_event", async_describe_test_event)
+
+    logbook._process_logbook_platform(hass, "test", MockLogbookPlatform)
+
+    hass.bus.async_fire("mock_event", {"device_id": device.id})
+    hass.bus.async_fire("mock_event", {"device_id": "other"})
+    logbook.async_log_entry(
+        hass, "Alarm", "is triggered", "switch", "switch.test_switch"
+    )
+    logbook.async_log_entry(hass, "Alarm", "is off", "switch", "switch.other")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        indexed = {
+            (row.entity_id, row.device_id)
+            for row in session.query(LogbookIndex).filter(
+                LogbookIndex.event_id.is_not(None)
+            )
+        }
+    assert indexed == {
+        (None, device.id),
+        (None, "other"),
+        ("switch.test_switch", None),
+        ("switch.other", None),
+    }
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "device_ids": [device.id],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    results = response["result"]
+    assert len(results) == 1
+    assert results[0]["name"] == "device name"
+    assert results[0]["message"] == "is on fire"
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "entity_ids": ["switch.test_switch"],
+            "device_ids": [device.id],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    results = response["result"]
+    assert len(results) == 2
+    assert results[0]["message"] == "is on fire"
+    assert results[1]["message"] == "is triggered"
+    assert results[1]["entity_id"] == "switch.test_switch"
+
+    # Periods starting before the index was started are not in it
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "logbook/get_events",
+            "start_time": (now - timedelta(hours=1)).isoformat(),
+            "entity_ids": ["switch.test_switch"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    results = response["result"]
+    assert len(results) == 1
+    assert results[0]["message"] == "is triggered"
+
+
+@pytest.mark.parametrize("recorder_config", [{"logbook_index": True}])
+@pytest.mark.usefixtures("recorder_mock")
+async def test_get_events_with_logbook_index_old_entity_id(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the logbook index has the old entity_id and skips ids too long."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+
+    class MockLogbookPlatform:
+        """Mock a logbook platform."""
+
+        @ha.callback
+        def async_describe_events(
+            hass: HomeAssistant,  # noqa: N805
+            async_describe_event: Callable[
+                [str, str, Callable[[Event], dict[str, str]]], None
+            ],
+        ) -> None:
+            """Describe logbook events."""
+
+            @ha.callback
+            def async_describe_test_event(event: Event) -> dict[str, str]:
+                """Describe mock logbook event."""
+                return {
+                    "name": "switch",
+                    "message": "was renamed",
+                }
+
+            async_describe_event("test", "mock_event", async_describe_test_event)
+
+    logbook._process_logbook_platform(hass, "test", MockLogbookPlatform)
+
+    hass.bus.async_fire(
+        "mock_event",
+        {"entity_id": "switch.new_name", "old_entity_id": "switch.old_name"},
+    )
+    hass.bus.async_fire(
+        "mock_event", {"entity_id": f"switch.{'x' * 255}", "device_id": "d" * 65}
+    )
+    hass.bus.async_fire(
+        "mock_event", {"entity_id": "switch.other", "device_id": "d" * 65}
+    )
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        indexed = {
+            (row.entity_id, row.old_entity_id, row.device_id)
+            for row in session.query(LogbookIndex).filter(
+                LogbookIndex.event_id.is_not(None)
+            )
+        }
+    assert indexed == {
+        ("switch.new_name", "switch.old_name", None),
+        ("switch.other", None, None),
+    }
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "entity_ids": ["switch.old_name"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    results = response["result"]
+    assert len(results) == 1
+    assert results[0]["message"] == "was renamed"
+
+
 @pytest.mark.usefixtures("recorder_mock")
 async def test_logbook_select_entities_context_id(
     hass: HomeAssistant, hass_client: ClientSessionGenerator
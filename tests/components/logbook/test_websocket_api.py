@@ -22,11 +22,13 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_NAME,
+    ATTR_SERVICE,
     ATTR_UNIT_OF_MEASUREMENT,
     CONF_DOMAINS,
     CONF_ENTITIES,
     CONF_EXCLUDE,
     CONF_INCLUDE,
+    EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
     STATE_OFF,
@@ -356,6 +358,140 @@ async def test_get_events_entities_filtered_away(
     assert len(results) == 0
 
 
+async def test_get_events_limit(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events returning the events in pages."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    # The events are fired at the same time so the pages have to be split
+    # between events with the same time_fired_ts
+    with freeze_time(now + timedelta(seconds=1)):
+        for state in (STATE_OFF, STATE_ON, STATE_OFF, STATE_ON, STATE_OFF):
+            hass.states.async_set("light.kitchen", state)
+            await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    pages: list[list[str]] = []
+    cursor: str | None = None
+    while True:
+        await client.send_json_auto_id(
+            {
+                "type": "logbook/get_events",
+                "start_time": now.isoformat(),
+                "entity_ids": ["light.kitchen"],
+                "limit": 2,
+                **({"cursor": cursor} if cursor else {}),
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        pages.append([event["state"] for event in response["result"]["events"]])
+        if not (cursor := response["result"]["cursor"]):
+            break
+
+    assert pages == [["off", "on"], ["off", "on"], ["off"]]
+
+    await client.send_json_auto_id(
+        {
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "entity_ids": ["light.kitchen"],
+            "cursor": "not a cursor",
+            "limit": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_cursor"
+
+    await client.send_json_auto_id(
+        {
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "entity_ids": ["light.kitchen"],
+            "cursor": "not a cursor",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
+async def test_get_events_limit_context_in_earlier_page(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the events of a page are augmented with contexts of earlier pages."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    await hass.async_block_till_done()
+    now = dt_util.utcnow()
+
+    context = core.Context(
+        id="01GTDGKBCH00GW0X476W5TVAAA",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    with freeze_time(now) as freezer:
+        freezer.tick()
+        hass.bus.async_fire(
+            EVENT_CALL_SERVICE,
+            {ATTR_DOMAIN: "light", ATTR_SERVICE: "turn_on"},
+            context=context,
+        )
+        for state in (STATE_ON, STATE_OFF):
+            freezer.tick()
+            hass.states.async_set("light.kitchen", state, context=context)
+            await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    events: list[dict[str, Any]] = []
+    cursor: str | None = None
+    while True:
+        await client.send_json_auto_id(
+            {
+                "type": "logbook/get_events",
+                "start_time": now.isoformat(),
+                "entity_ids": ["light.kitchen"],
+                "limit": 1,
+                **({"cursor": cursor} if cursor else {}),
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        events.extend(response["result"]["events"])
+        if not (cursor := response["result"]["cursor"]):
+            break
+
+    # The call_service event only links the context, it is in none of the pages
+    assert [
+        (
+            event["state"],
+            event["context_event_type"],
+            event["context_domain"],
+            event["context_service"],
+        )
+        for event in events
+    ] == [
+        (STATE_ON, EVENT_CALL_SERVICE, "light", "turn_on"),
+        (STATE_OFF, EVENT_CALL_SERVICE, "light", "turn_on"),
+    ]
+
+
 async def test_get_events_future_start_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -25,8 +25,10 @@ from homeassistant.components.profiler import (
     SERVICE_MEMORY,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_START,
+    SERVICE_START_JOB_TIMING,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_STOP_JOB_TIMING,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
 )
@@ -446,3 +448,49 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_job_timing(hass: HomeAssistant) -> None:
+    """Test starting and stopping job timing."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    loop_monitor = hass.loop_monitor
+    assert loop_monitor is not None
+    assert not loop_monitor.timing_jobs
+    assert hass.loop.get_task_factory() is None
+
+    with pytest.raises(HomeAssistantError, match="Job timing not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_JOB_TIMING, {}, blocking=True
+        )
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_JOB_TIMING, {}, blocking=True)
+    assert loop_monitor.timing_jobs
+    assert hass.loop.get_task_factory() is not None
+
+    async def _job() -> None:
+        """Mock job."""
+
+    await hass.async_create_task(_job())
+    assert loop_monitor.integrations["homeassistant"].tasks.count >= 1
+
+    with pytest.raises(HomeAssistantError, match="Job timing already started"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_JOB_TIMING, {}, blocking=True
+        )
+
+    await hass.services.async_call(DOMAIN, SERVICE_STOP_JOB_TIMING, {}, blocking=True)
+    assert not loop_monitor.timing_jobs
+    assert hass.loop.get_task_factory() is None
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_JOB_TIMING, {}, blocking=True)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.loop_monitor is None
+    assert not loop_monitor.timing_jobs
+    assert hass.loop.get_task_factory() is None
@@ -0,0 +1,40 @@
+"""Test the profiler sensors."""
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from tests.common import MockConfigEntry, async_fire_time_changed
+
+
+async def test_sensors(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the event loop sensors."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    lag_entry = entity_registry.async_get("sensor.event_loop_lag")
+    assert lag_entry
+    assert lag_entry.unique_id == f"{entry.entry_id}_event_loop_lag"
+    assert float(hass.states.get("sensor.event_loop_lag").state) >= 0
+    assert hass.states.get("sensor.slow_callbacks").state == "0"
+
+    assert hass.loop_monitor is not None
+    hass.loop_monitor.async_record_job(print, 1.0)
+    freezer.tick(timedelta(seconds=30))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.slow_callbacks").state == "1"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,27 @@
+"""Test profiler system health."""
+
+from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockConfigEntry, get_system_health_info
+
+
+async def test_profiler_system_health(hass: HomeAssistant) -> None:
+    """Test profiler system health."""
+    assert await async_setup_component(hass, "system_health", {})
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.loop_monitor is not None
+    hass.loop_monitor.async_record_job(print, 1.0)
+    info = await get_system_health_info(hass, DOMAIN)
+    assert info["slow_callbacks"] == 1
+    assert info["event_loop_lag"].endswith(" ms")
+    assert info["top_integrations"].startswith("homeassistant (1.")
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert await get_system_health_info(hass, DOMAIN) == {}
@@ -0,0 +1,46 @@
+"""Test the profiler websocket API."""
+
+from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.core import HomeAssistant, callback
+
+from tests.common import MockConfigEntry
+from tests.typing import WebSocketGenerator
+
+
+async def test_loop_stats(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the event loop statistics."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.loop_monitor is not None
+    hass.async_start_job_timing()
+
+    @callback
+    def listener(event):
+        """Mock listener."""
+
+    hass.bus.async_listen("test_event", listener)
+    hass.bus.async_fire("test_event")
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id({"type": "profiler/loop_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["slow_callbacks"] == 0
+    assert result["integrations"]["homeassistant"]["callbacks"]["count"] >= 1
+    assert result["timing_jobs"] is True
+    assert set(result["lag"]) == {"buckets", "histogram", "max", "recent", "samples"}
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.loop_monitor is None
+
+    await client.send_json_auto_id({"type": "profiler/loop_stats"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
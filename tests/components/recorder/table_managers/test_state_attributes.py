@@ -0,0 +1,61 @@
+"""The tests for the recorder StateAttributesManager."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.core import HomeAssistant
+
+from ..common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+async def test_serialize_reuses_unchanged_attributes(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test unchanged attributes are only serialized once per entity."""
+    await async_setup_recorder_instance(hass, {recorder.CONF_COMMIT_INTERVAL: 0})
+
+    with patch.object(
+        StateAttributes,
+        "shared_attrs_bytes_from_event",
+        wraps=StateAttributes.shared_attrs_bytes_from_event,
+    ) as shared_attrs_bytes_from_event:
+        hass.states.async_set("sensor.power", "1", {"unit_of_measurement": "W"})
+        hass.states.async_set("sensor.power", "2", {"unit_of_measurement": "W"})
+        hass.states.async_set("sensor.power", "3", {"unit_of_measurement": "W"})
+        await async_wait_recording_done(hass)
+        assert shared_attrs_bytes_from_event.call_count == 1
+
+        hass.states.async_set("sensor.power", "4", {"unit_of_measurement": "kW"})
+        await async_wait_recording_done(hass)
+        assert shared_attrs_bytes_from_event.call_count == 2
+
+        hass.states.async_remove("sensor.power")
+        hass.states.async_set("sensor.power", "4", {"unit_of_measurement": "kW"})
+        await async_wait_recording_done(hass)
+        assert shared_attrs_bytes_from_event.call_count == 4
+
+
+async def test_last_serialized_is_bounded(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the last serialized attributes are kept in an LRU."""
+    await async_setup_recorder_instance(hass, {recorder.CONF_COMMIT_INTERVAL: 0})
+    instance = recorder.get_instance(hass)
+    manager = instance.state_attributes_manager
+    manager._last_serialized.set_size(2)
+
+    for idx in range(3):
+        hass.states.async_set(f"sensor.power_{idx}", "1", {"unit_of_measurement": "W"})
+    await async_wait_recording_done(hass)
+    assert list(manager._last_serialized.keys()) == [
+        "sensor.power_2",
+        "sensor.power_1",
+    ]
+
+    manager.adjust_lru_size(4)
+    assert manager._last_serialized.get_size() == 4
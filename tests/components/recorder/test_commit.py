@@ -0,0 +1,59 @@
+"""Test the recorder commit scheduler."""
+
+from homeassistant.components.recorder.commit import CommitScheduler
+from homeassistant.components.recorder.const import (
+    COMMIT_BACKLOG_HIGH,
+    COMMIT_BACKLOG_LOW,
+)
+
+
+def test_commit_interval_adapts_to_backlog() -> None:
+    """Test the commit interval is shortened while the backlog is high."""
+    scheduler = CommitScheduler(5)
+
+    assert scheduler.next_interval(0) == 5
+    assert scheduler.next_interval(COMMIT_BACKLOG_HIGH) == 2.5
+    assert scheduler.next_interval(COMMIT_BACKLOG_HIGH) == 1.25
+    assert scheduler.next_interval(COMMIT_BACKLOG_HIGH) == 1
+    assert scheduler.next_interval(COMMIT_BACKLOG_LOW) == 5
+    assert scheduler.next_interval(COMMIT_BACKLOG_HIGH) == 2.5
+    assert scheduler.next_interval(COMMIT_BACKLOG_LOW - 1) == 5
+    assert scheduler.next_interval(0) == 5
+
+
+def test_commit_interval_stretched_up_to_max_commit_interval() -> None:
+    """Test the commit interval is stretched while the backlog is low."""
+    scheduler = CommitScheduler(5, 15)
+
+    assert scheduler.next_interval(0) == 10
+    assert scheduler.next_interval(COMMIT_BACKLOG_LOW - 1) == 15
+    assert scheduler.next_interval(0) == 15
+    assert scheduler.next_interval(COMMIT_BACKLOG_LOW) == 5
+    assert scheduler.next_interval(0) == 10
+    assert scheduler.next_interval(COMMIT_BACKLOG_HIGH) == 2.5
+
+    # A max commit interval below the commit interval is ignored
+    scheduler = CommitScheduler(5, 1)
+    assert scheduler.next_interval(0) == 5
+
+
+def test_commit_diagnostics() -> None:
+    """Test the commit diagnostics."""
+    scheduler = CommitScheduler(5)
+    assert scheduler.as_dict() == {
+        "commit_interval": 5,
+        "commit_latency": 0.0,
+        "commit_latency_max": 0.0,
+        "commits": 0,
+        "rows_per_commit": 0.0,
+    }
+
+    scheduler.record_commit(10, 0.5)
+    scheduler.record_commit(30, 0.1)
+    assert scheduler.as_dict() == {
+        "commit_interval": 5,
+        "commit_latency": 0.3,
+        "commit_latency_max": 0.5,
+        "commits": 2,
+        "rows_per_commit": 20.0,
+    }
@@ -5,6 +5,7 @@ from __future__ import annotations
 from copy import copy
 from datetime import datetime, timedelta
 import json
+from typing import Any
 from unittest.mock import sentinel
 
 from freezegun import freeze_time
@@ -15,6 +16,7 @@ from homeassistant.components.recorder import Recorder, history
 from homeassistant.components.recorder.db_schema import (
     StateAttributes,
     States,
+    StatesCheckpoints,
     StatesMeta,
 )
 from homeassistant.components.recorder.filters import Filters
@@ -31,6 +33,7 @@ from .common import (
     assert_states_equal_without_context,
     async_recorder_block_till_done,
     async_wait_recording_done,
+    do_adhoc_statistics,
 )
 
 from tests.typing import RecorderInstanceGenerator
@@ -544,6 +547,115 @@ async def test_get_significant_states_with_initial(
     assert_dict_of_states_equal_without_context_and_last_changed(states, hist)
 
 
+async def test_get_significant_states_with_initial_from_checkpoint(
+    hass: HomeAssistant,
+) -> None:
+    """Test the start time states are found from a states checkpoint."""
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) + timedelta(
+        hours=2
+    )
+    with freeze_time(hour - timedelta(minutes=30)) as freezer:
+        hass.states.async_set("sensor.one", "1")
+        hass.states.async_set("sensor.two", "1")
+        freezer.move_to(hour - timedelta(minutes=20))
+        hass.states.async_set("sensor.one", "2")
+        freezer.move_to(hour + timedelta(minutes=10))
+        hass.states.async_set("sensor.two", "2")
+        await async_wait_recording_done(hass)
+
+        # The checkpoint is written when the hourly statistics are compiled
+        do_adhoc_statistics(hass, start=hour - timedelta(minutes=5))
+        await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        checkpoints = (
+            session.query(StatesMeta.entity_id, States.state)
+            .join(StatesCheckpoints, StatesCheckpoints.state_id == States.state_id)
+            .join(StatesMeta, StatesMeta.metadata_id == States.metadata_id)
+            .filter(StatesCheckpoints.start_ts == hour.timestamp())
+            .all()
+        )
+    assert sorted(checkpoints) == [("sensor.one", "2"), ("sensor.two", "1")]
+
+    for start_time, expected in (
+        (hour, {"sensor.one": ["2"], "sensor.two": ["1", "2"]}),
+        (hour + timedelta(minutes=20), {"sensor.one": ["2"], "sensor.two": ["2"]}),
+    ):
+        hist = history.get_significant_states(
+            hass, start_time, None, ["sensor.one", "sensor.two"]
+        )
+        assert {
+            entity_id: [state.state for state in states]
+            for entity_id, states in hist.items()
+        } == expected
+
+
+async def test_get_significant_states_with_initial_without_checkpoint(
+    hass: HomeAssistant,
+) -> None:
+    """Test the start time states are found when there is no states checkpoint."""
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) + timedelta(
+        hours=2
+    )
+    with freeze_time(hour - timedelta(minutes=30)) as freezer:
+        hass.states.async_set("sensor.one", "1")
+        hass.states.async_set("sensor.two", "1")
+        freezer.move_to(hour - timedelta(minutes=20))
+        hass.states.async_set("sensor.one", "2")
+        freezer.move_to(hour + timedelta(minutes=10))
+        hass.states.async_set("sensor.two", "2")
+        await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatesCheckpoints).count() == 0
+
+    hist = history.get_significant_states(
+        hass, hour, None, ["sensor.one", "sensor.two"]
+    )
+    assert {
+        entity_id: [state.state for state in states]
+        for entity_id, states in hist.items()
+    } == {"sensor.one": ["2"], "sensor.two": ["1", "2"]}
+
+
+async def test_states_checkpoint_invalidated_by_late_state(
+    hass: HomeAssistant,
+) -> None:
+    """Test a state recorded after a checkpoint it belongs to invalidates it."""
+    instance = recorder.get_instance(hass)
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) + timedelta(
+        hours=2
+    )
+    with freeze_time(hour - timedelta(minutes=30)) as freezer:
+        hass.states.async_set("sensor.one", "1")
+        hass.states.async_set("sensor.two", "1")
+        freezer.move_to(hour + timedelta(minutes=10))
+        hass.states.async_set("sensor.two", "2")
+        await async_wait_recording_done(hass)
+        do_adhoc_statistics(hass, start=hour - timedelta(minutes=5))
+        await async_wait_recording_done(hass)
+        assert instance.states_checkpoint_ts == hour.timestamp()
+
+        # A state from before the checkpoint is recorded late, for example
+        # when the spilled queue is replayed
+        late = hour - timedelta(minutes=10)
+        freezer.move_to(late)
+        hass.states.async_set("sensor.one", "late")
+        await async_wait_recording_done(hass)
+
+    assert instance.states_checkpoint_ts == late.timestamp()
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatesCheckpoints).count() == 0
+
+    hist = history.get_significant_states(
+        hass, hour, None, ["sensor.one", "sensor.two"]
+    )
+    assert {
+        entity_id: [state.state for state in states]
+        for entity_id, states in hist.items()
+    } == {"sensor.one": ["late"], "sensor.two": ["1", "2"]}
+
+
 async def test_get_significant_states_without_initial(
     hass: HomeAssistant,
 ) -> None:
@@ -618,6 +730,45 @@ async def test_get_significant_states_multiple_entity_ids(
     )
 
 
+@pytest.mark.parametrize("minimal_response", [False, True])
+async def test_stream_significant_states(
+    hass: HomeAssistant, minimal_response: bool
+) -> None:
+    """Test streaming the significant states in chunks."""
+    zero, four, _ = record_states(hass)
+    await async_wait_recording_done(hass)
+    entity_ids = ["media_player.test", "media_player.test2", "thermostat.test"]
+
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids,
+        minimal_response=minimal_response,
+        compressed_state_format=True,
+    )
+
+    def _stream() -> list[tuple[str, list[State | dict[str, Any]]]]:
+        return list(
+            history.stream_significant_states(
+                hass,
+                zero,
+                four,
+                entity_ids,
+                minimal_response=minimal_response,
+                compressed_state_format=True,
+                chunk_size=2,
+            )
+        )
+
+    chunks = await recorder.get_instance(hass).async_add_executor_job(_stream)
+    assert all(len(chunk) <= 2 for _, chunk in chunks)
+    streamed: dict[str, list[State | dict[str, Any]]] = {}
+    for entity_id, chunk in chunks:
+        streamed.setdefault(entity_id, []).extend(chunk)
+    assert streamed == hist
+
+
 async def test_get_significant_states_are_ordered(
     hass: HomeAssistant,
 ) -> None:
@@ -13,6 +13,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import text
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 from sqlalchemy.pool import QueuePool
 
@@ -131,9 +132,12 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         auto_repack=True,
         keep_days=7,
         commit_interval=1,
+        max_commit_interval=None,
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
+        db_read_only_workers=4,
+        logbook_index=False,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
     )
@@ -394,19 +398,13 @@ async def test_saving_state_with_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
-
     with (
         patch("time.sleep"),
-        patch.object(
-            get_instance(hass).event_session,
-            "flush",
-            side_effect=_throw_if_state_in_session,
+        patch(
+            "homeassistant.components.recorder.bulk_insert.BulkInsertBuffer._write_states",
+            side_effect=OperationalError(
+                "insert the state", "fake params", "forced to fail"
+            ),
         ),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
@@ -427,6 +425,72 @@ async def test_saving_state_with_exception(
     assert "Error saving events" not in caplog.text
 
 
+async def test_saving_state_with_commit_exception(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    setup_recorder: None,
+) -> None:
+    """Test the buffered states are written again when the commit is retried."""
+    entity_id = "test.recorder"
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    hass.states.async_set(entity_id, "on", attributes)
+    await async_wait_recording_done(hass)
+
+    instance = get_instance(hass)
+    event_session = instance.event_session
+    assert event_session is not None
+    commit = event_session.commit
+    failed_commits = 0
+
+    def _fail_first_commit() -> None:
+        nonlocal failed_commits
+        if not failed_commits:
+            failed_commits += 1
+            # The database rolls back the transaction when the commit fails
+            event_session.rollback()
+            raise OperationalError("commit", "fake params", "forced to fail")
+        commit()
+
+    with (
+        patch("time.sleep"),
+        patch.object(event_session, "commit", side_effect=_fail_first_commit),
+    ):
+        hass.states.async_set(entity_id, "off", attributes)
+        await async_wait_recording_done(hass)
+
+    assert failed_commits == 1
+    assert "Error executing query" in caplog.text
+    assert len(instance._bulk_insert_buffer) == 0
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert [db_state.state for db_state in db_states] == ["on", "off"]
+        assert db_states[1].old_state_id == db_states[0].state_id
+
+
+async def test_saving_state_with_unwritten_old_state(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test a state is written without its old state when it was never written."""
+    entity_id = "test.recorder"
+    instance = get_instance(hass)
+
+    with patch.object(
+        instance.states_manager, "pop_pending", return_value=States(state="lost")
+    ):
+        hass.states.async_set(entity_id, "on")
+        await async_wait_recording_done(hass)
+
+    hass.states.async_set(entity_id, "off")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert [db_state.state for db_state in db_states] == ["on", "off"]
+        assert db_states[0].old_state_id is None
+        assert db_states[1].old_state_id == db_states[0].state_id
+
+
 async def test_saving_state_with_sqlalchemy_exception(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -437,19 +501,13 @@ async def test_saving_state_with_sqlalchemy_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
-
     with (
         patch("time.sleep"),
-        patch.object(
-            get_instance(hass).event_session,
-            "flush",
-            side_effect=_throw_if_state_in_session,
+        patch(
+            "homeassistant.components.recorder.bulk_insert.BulkInsertBuffer._write_states",
+            side_effect=SQLAlchemyError(
+                "insert the state", "fake params", "forced to fail"
+            ),
         ),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
@@ -2183,6 +2241,69 @@ async def test_deduplication_state_attributes_inside_commit_interval(
         assert first_attributes_id == last_attributes_id
 
 
+@pytest.mark.parametrize("recorder_config", [{CONF_COMMIT_INTERVAL: 60}])
+async def test_commit_when_max_rows_pending(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test the pending rows are committed once there are enough of them."""
+    scheduler = get_instance(hass).commit_scheduler
+    await async_wait_recording_done(hass)
+    commits = scheduler.commits
+    rows = scheduler.rows
+
+    with patch.object(recorder.core, "MAX_ROWS_PER_COMMIT", 3):
+        hass.states.async_set("test.one", "on")
+        hass.states.async_set("test.one", "off")
+        await async_recorder_block_till_done(hass)
+        assert scheduler.commits == commits
+
+        hass.states.async_set("test.one", "on")
+        await async_recorder_block_till_done(hass)
+        assert scheduler.commits == commits + 1
+        assert scheduler.rows == rows + 3
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_COMMIT_INTERVAL: 10}])
+@pytest.mark.parametrize("executemany_returning", [True, False])
+async def test_old_state_ids_inside_commit_interval(
+    hass: HomeAssistant, setup_recorder: None, executemany_returning: bool
+) -> None:
+    """Test the states of an entity are linked inside the commit interval."""
+    instance = get_instance(hass)
+    with patch.object(
+        instance.engine.dialect,
+        "insert_executemany_returning_sort_by_parameter_order",
+        executemany_returning,
+    ):
+        for value in range(3):
+            hass.states.async_set("test.one", str(value))
+            hass.states.async_set("test.two", str(value))
+            hass.bus.async_fire("this_event", {"value": value})
+        await instance.async_block_till_done()
+        hass.states.async_set("test.one", "3")
+        await instance.async_block_till_done()
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(States.state_id, States.old_state_id, StatesMeta.entity_id)
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .order_by(States.state_id)
+        )
+        events = list(
+            session.query(Events).filter(
+                Events.event_type_id.in_(select_event_type_ids(("this_event",)))
+            )
+        )
+    assert len(events) == 3
+    for entity_id, values in (("test.one", 4), ("test.two", 3)):
+        entity_states = [state for state in states if state.entity_id == entity_id]
+        assert len(entity_states) == values
+        old_state_id = None
+        for state in entity_states:
+            assert state.old_state_id == old_state_id
+            old_state_id = state.state_id
+
+
 async def test_async_block_till_done(
     hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
 ) -> None:
@@ -2746,3 +2867,40 @@ async def test_empty_entity_id(
     hass.bus.async_fire("hello", {"entity_id": ""})
     await async_wait_recording_done(hass)
     assert "Invalid entity ID" not in caplog.text
+
+
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_read_only_executor(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test read only executor jobs use query only connections.
+
+    On-disk database because the MutexPool shares its connection.
+    """
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_DB_READ_ONLY_WORKERS: 2}
+    )
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+
+    def _read_and_write() -> tuple[Any, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            bind = session.get_bind()
+            states = session.query(States).count()
+            with pytest.raises(OperationalError, match="readonly"):
+                session.execute(text("DELETE FROM states"))
+        return bind, states
+
+    assert instance.read_only_engine is not None
+    bind, states = await instance.async_add_read_only_executor_job(_read_and_write)
+    assert bind is instance.read_only_engine
+    assert states == 1
+    assert len(instance.read_only_thread_ids) == 1
+
+    def _get_bind() -> Any:
+        with session_scope(hass=hass, read_only=True) as session:
+            return session.get_bind()
+
+    # Read only sessions of the other executor use the recorder connections
+    assert await instance.async_add_executor_job(_get_bind) is instance.engine
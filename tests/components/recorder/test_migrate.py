@@ -2,6 +2,7 @@
 
 import datetime
 import importlib
+from pathlib import Path
 import sqlite3
 import sys
 from unittest.mock import ANY, Mock, PropertyMock, call, patch
@@ -501,6 +502,7 @@ async def test_events_during_migration_queue_exhausted(
         patch.object(
             recorder.core, "MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG", sys.maxsize
         ),
+        patch.object(recorder.core, "MAX_SPILLED_BACKLOG", 0),
     ):
         await async_setup_recorder_instance(
             hass, {"commit_interval": 0}, wait_recorder=False, wait_recorder_setup=False
@@ -533,6 +535,60 @@ async def test_events_during_migration_queue_exhausted(
     assert len(db_states) == 2
 
 
+async def test_events_during_migration_spilled_to_disk(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    instrument_migration: InstrumentedMigration,
+    tmp_path: Path,
+) -> None:
+    """Test that events are spilled to disk when the queue is exhausted during migration."""
+    spill_path = tmp_path / "spill"
+
+    assert recorder.util.async_migration_in_progress(hass) is False
+
+    with (
+        patch(
+            "homeassistant.components.recorder.core.create_engine",
+            new=create_engine_test,
+        ),
+        patch.object(recorder.core, "MAX_QUEUE_BACKLOG_MIN_VALUE", 1),
+        patch.object(
+            recorder.core, "MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG", sys.maxsize
+        ),
+        patch.object(recorder.spill_queue, "SPILL_SEGMENT_SIZE", 1),
+        patch.object(recorder.core, "SPILL_DIRECTORY", str(spill_path)),
+    ):
+        await async_setup_recorder_instance(
+            hass, {"commit_interval": 0}, wait_recorder=False, wait_recorder_setup=False
+        )
+        await hass.async_add_executor_job(instrument_migration.migration_started.wait)
+        assert recorder.util.async_migration_in_progress(hass) is True
+        hass.states.async_set("my.entity", "on", {})
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, dt_util.utcnow() + datetime.timedelta(hours=2))
+        await hass.async_block_till_done()
+        instance = recorder.get_instance(hass)
+        assert instance._spill_queue.active is True
+        hass.states.async_set("my.entity", "off", {})
+        hass.states.async_set("my.entity", "on", {})
+        await hass.async_block_till_done()
+        assert instance._spill_queue.size >= 2
+
+        # Let migration finish
+        instrument_migration.migration_stall.set()
+        await instance.async_recorder_ready.wait()
+        await async_wait_recording_done(hass)
+
+    assert recorder.util.async_migration_in_progress(hass) is False
+    assert instance._spill_queue.active is False
+    assert instance._spill_queue.size == 0
+    db_states = await instance.async_add_executor_job(
+        _get_native_states, hass, "my.entity"
+    )
+    assert [state.state for state in db_states] == ["on", "off", "on"]
+    assert instance._spill_queue.path == str(spill_path)
+
+
 @pytest.mark.parametrize(
     ("start_version", "live"),
     [
@@ -641,6 +697,84 @@ async def test_schema_migrate(
         assert instrument_migration.apply_update_mock.called
 
 
+def test_migration_progress() -> None:
+    """Test the progress of a data migration."""
+    with patch.object(migration, "monotonic", return_value=100.0):
+        progress = migration.MigrationProgress("test_migration", 1000)
+        assert progress.as_dict() == {
+            "migration_id": "test_migration",
+            "rows_migrated": 0,
+            "rows_remaining": 1000,
+            "rows_per_second": None,
+            "eta": None,
+        }
+
+    progress.record(200)
+    with patch.object(migration, "monotonic", return_value=110.0):
+        assert progress.as_dict() == {
+            "migration_id": "test_migration",
+            "rows_migrated": 200,
+            "rows_remaining": 800,
+            "rows_per_second": 20.0,
+            "eta": 40.0,
+        }
+
+    # The rows inserted after counting are migrated too
+    progress.record(1000)
+    assert progress.rows_remaining == 0
+
+
+def test_migrate_table_to_timestamp_in_ranges_retries_deadlock() -> None:
+    """Test a range which fails with a deadlock is retried."""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE events "
+                "(event_id INTEGER PRIMARY KEY, time_fired_ts FLOAT)"
+            )
+        )
+        connection.execute(text("INSERT INTO events (event_id) VALUES (1), (2), (3)"))
+    real_session_maker = sessionmaker(bind=engine)
+    deadlock_session = Mock()
+    deadlock_session.connection.return_value.execute.side_effect = OperationalError(
+        "statement", {}, Exception(1213, "Deadlock found")
+    )
+    # The first session counts the rows, the second one deadlocks
+    sessions = iter((real_session_maker(), deadlock_session))
+
+    def _session_maker() -> Session:
+        return next(sessions, None) or real_session_maker()
+
+    instance = Mock(db_retry_wait=0, migration_progress=None)
+    instance.engine.dialect.name = "mysql"
+    with patch.object(migration, "MIGRATION_BATCH_SIZE", 2):
+        migration._migrate_table_to_timestamp_in_ranges(
+            instance,
+            _session_maker,
+            "events",
+            "event_id",
+            "time_fired_ts",
+            "UPDATE events SET time_fired_ts=1 "
+            "WHERE event_id >= :start AND event_id < :end "
+            "AND time_fired_ts is NULL;",
+        )
+
+    assert deadlock_session.connection.return_value.execute.call_count == 1
+    with engine.connect() as connection:
+        assert (
+            connection.execute(
+                text("SELECT COUNT(*) FROM events WHERE time_fired_ts is NULL")
+            ).scalar()
+            == 0
+        )
+    assert instance.migration_progress is None
+
+
 def test_invalid_update(hass: HomeAssistant) -> None:
     """Test that an invalid new version raises an exception."""
     with pytest.raises(ValueError):
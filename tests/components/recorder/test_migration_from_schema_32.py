@@ -795,8 +795,18 @@ async def test_migrate_event_type_ids(
     await async_wait_recording_done(hass)
     # This is a threadsafe way to add a task to the recorder
     migrator = migration.EventTypeIDMigration(None, None)
-    recorder_mock.queue_task(migrator.task(migrator))
-    await _async_wait_migration_done(hass)
+    with patch.object(
+        migration.MigrationProgress, "record", autospec=True
+    ) as record_mock:
+        recorder_mock.queue_task(migrator.task(migrator))
+        await _async_wait_migration_done(hass)
+
+    # The progress is tracked while migrating and dropped when done
+    progress = record_mock.call_args_list[0].args[0]
+    assert progress.migration_id == migration.EventTypeIDMigration.migration_id
+    assert progress.rows_total >= 3
+    assert record_mock.call_args_list[0].args[1] >= 3
+    assert recorder_mock.migration_progress is None
 
     def _fetch_migrated_events():
         with session_scope(hass=hass, read_only=True) as session:
@@ -4,7 +4,7 @@ from collections.abc import Generator
 from datetime import datetime, timedelta
 import json
 import sqlite3
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
 import pytest
@@ -25,7 +25,12 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    PurgeProgress,
+    _purge_unused_attributes_ids,
+    _purge_unused_data_ids,
+    purge_old_data,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -243,6 +248,74 @@ async def test_purge_old_states_encouters_database_corruption(
         assert states_after_purge.count() == 0
 
 
+async def test_purge_old_states_time_budget(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the purge yields when its time budget is spent and reports progress."""
+    await _add_test_states(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    # Without a time budget, every purge task deletes a single batch of rows
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 2),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 2),
+    ):
+        finished = purge_old_data(
+            recorder_mock, purge_before, repack=False, time_budget=0
+        )
+        assert not finished
+
+        progress = recorder_mock.purge_progress
+        assert progress is not None
+        assert progress.slices == 1
+        assert progress.as_dict() == {
+            "purge_before": purge_before.isoformat(),
+            "rows_purged": 2,
+            "rows_remaining": 2,
+            "eta": ANY,
+        }
+        assert progress.eta is not None
+
+        with session_scope(hass=hass) as session:
+            assert session.query(States).count() == 4
+
+        while not purge_old_data(
+            recorder_mock, purge_before, repack=False, time_budget=0
+        ):
+            assert recorder_mock.purge_progress is progress
+
+    assert progress.slices == 3
+    assert progress.rows_remaining == 0
+    assert recorder_mock.purge_progress is None
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+
+
+async def test_purge_unused_ids_time_budget(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the unused attributes and data ids are checked within the time budget."""
+    progress = PurgeProgress(dt_util.utcnow(), 0)
+    progress.start_slice(0)
+    progress.record(1)
+
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 2),
+        session_scope(hass=hass) as session,
+    ):
+        # One chunk is checked, the other ids are left for the next purge task
+        assert _purge_unused_attributes_ids(recorder_mock, session, {1, 2, 3}, progress)
+        assert len(progress.attributes_ids) == 1
+        assert _purge_unused_data_ids(recorder_mock, session, {1, 2, 3}, progress)
+        assert len(progress.data_ids) == 1
+
+        assert not _purge_unused_attributes_ids(recorder_mock, session, set(), progress)
+        assert progress.attributes_ids == set()
+        assert not _purge_unused_data_ids(recorder_mock, session, set(), progress)
+        assert progress.data_ids == set()
+
+
 async def test_purge_old_states_encounters_temporary_mysql_error(
     hass: HomeAssistant,
     recorder_mock: Recorder,
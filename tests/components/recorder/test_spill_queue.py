@@ -0,0 +1,112 @@
+"""Test the recorder spill queue."""
+
+import os
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from homeassistant.components.recorder import spill_queue
+from homeassistant.components.recorder.spill_queue import SpillQueue, SpillSegment
+from homeassistant.components.recorder.tasks import StopTask, WaitTask
+from homeassistant.core import Context, Event, EventOrigin, State
+import homeassistant.util.dt as dt_util
+
+
+def _wait_written(queue: SpillQueue) -> None:
+    """Wait for the writer thread to write the submitted segments."""
+    assert queue._writer is not None
+    queue._writer.submit(lambda: None).result()
+
+
+def test_spill_queue_not_active(tmp_path: Path) -> None:
+    """Test nothing is spilled before spilling starts."""
+    queue = SpillQueue(str(tmp_path / "spill"))
+    assert queue.put(Event("test_event")) is False
+    assert queue.size == 0
+    assert queue.pop() is None
+    assert not os.path.exists(queue.path)
+
+
+def test_spill_queue_round_trip(tmp_path: Path) -> None:
+    """Test spilled events and tasks are returned in order."""
+    queue = SpillQueue(str(tmp_path / "spill"))
+    queue_put = Mock()
+    marker = WaitTask()
+    queue.start(marker, queue_put)
+    queue_put.assert_called_once_with(marker)
+    assert queue.active is True
+
+    now = dt_util.utcnow()
+    context = Context(user_id="abc", parent_id="def")
+    old_state = State("sensor.test", "1", {"unit": "W"}, last_updated=now)
+    new_state = State("sensor.test", "2", {"unit": "W"}, context=context)
+    state_changed = Event(
+        "state_changed",
+        {"entity_id": "sensor.test", "old_state": old_state, "new_state": new_state},
+        EventOrigin.local,
+        new_state.last_updated_timestamp,
+        context,
+    )
+    other = Event("test_event", {"any": "data"}, EventOrigin.remote, context=context)
+    task = StopTask()
+
+    with patch.object(spill_queue, "SPILL_SEGMENT_SIZE", 2):
+        assert queue.put(state_changed) is True
+        assert queue.put(other) is True
+    assert queue.put(task) is True
+    assert queue.put(Event("after_task")) is True
+    assert queue.size == 4
+    _wait_written(queue)
+
+    segment = queue.pop()
+    assert type(segment) is SpillSegment
+    assert segment.events is None
+    assert segment.path is not None
+    assert os.path.exists(segment.path)
+    events = queue.load(segment)
+    assert not os.path.exists(segment.path)
+    assert [event.event_type for event in events] == ["state_changed", "test_event"]
+    for key, state in (("old_state", old_state), ("new_state", new_state)):
+        spilled_state = events[0].data[key]
+        assert spilled_state.entity_id == state.entity_id
+        assert spilled_state.state == state.state
+        assert spilled_state.attributes == state.attributes
+        assert spilled_state.last_changed == state.last_changed
+        assert spilled_state.last_updated == state.last_updated
+        assert spilled_state.context == state.context
+    assert events[0].time_fired_timestamp == state_changed.time_fired_timestamp
+    assert events[0].context == context
+    assert events[1].data == {"any": "data"}
+    assert events[1].origin is EventOrigin.remote
+
+    assert queue.pop() is task
+    segment = queue.pop()
+    assert type(segment) is SpillSegment
+    assert [event.event_type for event in queue.load(segment)] == ["after_task"]
+    assert queue.size == 0
+
+    # Spilling stops once the queue is empty
+    assert queue.pop() is None
+    assert queue.active is False
+    assert queue.put(Event("test_event")) is False
+
+    queue.clear()
+    assert not os.path.exists(queue.path)
+
+
+def test_spill_queue_clear(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Test clearing the queue drops the spilled events."""
+    queue = SpillQueue(str(tmp_path / "spill"))
+    queue.start(WaitTask(), Mock())
+    with patch.object(spill_queue, "SPILL_SEGMENT_SIZE", 1):
+        queue.put(Event("test_event"))
+    _wait_written(queue)
+    assert os.listdir(queue.path)
+
+    queue.clear()
+    assert "Dropping 1 events and tasks of the spilled recorder queue" in caplog.text
+    assert queue.active is False
+    assert queue.size == 0
+    assert queue.pop() is None
+    assert not os.path.exists(queue.path)
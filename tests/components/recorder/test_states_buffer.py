@@ -0,0 +1,150 @@
+"""Test the recorder states buffer."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.components.recorder.states_buffer import StatesBuffer
+from homeassistant.core import Event, EventStateChangedData, State
+import homeassistant.util.dt as dt_util
+
+ATTRIBUTES = {"state_class": "measurement"}
+
+
+def _state_changed_event(
+    entity_id: str, new_state: State | None
+) -> Event[EventStateChangedData]:
+    """Return a state_changed event."""
+    time_fired = new_state.last_updated if new_state else dt_util.utcnow()
+    return Event(
+        "state_changed",
+        {"entity_id": entity_id, "old_state": None, "new_state": new_state},
+        time_fired_timestamp=time_fired.timestamp(),
+    )
+
+
+def test_states_buffer_get_period() -> None:
+    """Test fetching the states of a period from the buffer."""
+    start = dt_util.utcnow()
+    buffer = StatesBuffer()
+    assert buffer.get_period(start, start, ["sensor.test"], False) is None
+
+    states = [
+        State("sensor.test", "1", ATTRIBUTES, last_updated=start),
+        State(
+            "sensor.test",
+            "1",
+            {**ATTRIBUTES, "any": "changed"},
+            last_changed=start,
+            last_updated=start + timedelta(seconds=10),
+        ),
+        State(
+            "sensor.test", "2", ATTRIBUTES, last_updated=start + timedelta(seconds=20)
+        ),
+        State(
+            "sensor.test", "3", ATTRIBUTES, last_updated=start + timedelta(seconds=30)
+        ),
+    ]
+    for state in states:
+        buffer.add(_state_changed_event("sensor.test", state))
+    # States of entities without state class are not buffered
+    buffer.add(
+        _state_changed_event(
+            "sensor.other",
+            State("sensor.other", "on", last_updated=start + timedelta(seconds=5)),
+        )
+    )
+
+    # Periods before the first buffered event can not be served
+    assert (
+        buffer.get_period(start - timedelta(seconds=1), start, ["sensor.test"], False)
+        is None
+    )
+    period_start = start + timedelta(seconds=5)
+    period_end = start + timedelta(seconds=30)
+    assert buffer.get_period(period_start, period_end, ["sensor.test"], False) == {
+        "sensor.test": states[:3]
+    }
+    assert buffer.get_period(period_start, period_end, ["sensor.test"], True) == {
+        "sensor.test": [states[0], states[2]]
+    }
+    # Entities without a buffered state at the start are read from the
+    # database when the buffer was not seeded
+    assert (
+        buffer.get_period(
+            period_start, period_end, ["sensor.test", "sensor.other"], False
+        )
+        is None
+    )
+
+    buffer.prune(start + timedelta(seconds=25))
+    assert buffer.get_period(
+        start + timedelta(seconds=25), period_end, ["sensor.test"], False
+    ) == {"sensor.test": [states[2]]}
+    assert buffer._size == 2
+
+    # Removing the entity drops its states
+    buffer.add(_state_changed_event("sensor.test", None))
+    assert buffer.get_period(period_start, period_end, ["sensor.test"], False) is None
+    assert buffer._size == 0
+
+    # Clearing restarts tracking with the next event
+    buffer.clear()
+    assert buffer.get_period(period_start, period_end, ["sensor.test"], False) is None
+    buffer.add(_state_changed_event("sensor.test", states[3]))
+    assert buffer.start_ts == states[3].last_updated_timestamp
+
+
+def test_states_buffer_seeded() -> None:
+    """Test the buffer is seeded with the states at the start."""
+    start = dt_util.utcnow()
+    seed_states = [
+        State("sensor.test", "1", ATTRIBUTES, last_updated=start - timedelta(hours=1)),
+        State("sensor.other", "on", last_updated=start - timedelta(hours=1)),
+    ]
+    buffer = StatesBuffer()
+    buffer.start(start.timestamp(), seed_states)
+    assert buffer._size == 1
+
+    # Entities without state changes since the start use the seeded state
+    period_start = start + timedelta(minutes=5)
+    period_end = start + timedelta(minutes=10)
+    assert buffer.get_period(
+        period_start, period_end, ["sensor.test", "sensor.other"], False
+    ) == {"sensor.test": [seed_states[0]]}
+
+    # A state without state class drops the buffered states of the entity
+    buffer.add(
+        _state_changed_event(
+            "sensor.test",
+            State("sensor.test", "2", last_updated=start + timedelta(minutes=1)),
+        )
+    )
+    assert buffer._size == 0
+    assert buffer.get_period(period_start, period_end, ["sensor.test"], False) == {}
+
+
+def test_states_buffer_restart_keeps_last_states() -> None:
+    """Test the buffer keeps the last state of each entity when restarted."""
+    start = dt_util.utcnow()
+    states = [
+        State(
+            "sensor.test",
+            str(idx),
+            ATTRIBUTES,
+            last_updated=start + timedelta(minutes=idx),
+        )
+        for idx in range(3)
+    ]
+    buffer = StatesBuffer()
+    buffer.start(start.timestamp(), [])
+    for state in states[:2]:
+        buffer.add(_state_changed_event("sensor.test", state))
+
+    with patch(
+        "homeassistant.components.recorder.states_buffer.MAX_BUFFERED_STATES", 2
+    ):
+        buffer.add(_state_changed_event("sensor.test", states[2]))
+    assert buffer.start_ts == states[2].last_updated_timestamp
+    assert buffer._states == {"sensor.test": states[1:]}
+    assert buffer._size == 2
+    assert buffer._seeded
@@ -1,6 +1,6 @@
 """The tests for sensor recorder platform."""
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 from unittest.mock import ANY, Mock, patch
 
@@ -1293,6 +1293,89 @@ async def test_daily_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.parametrize("max_bind_vars", [4000, 6])
+@pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
+async def test_daily_statistics_mean_with_gap(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    max_bind_vars: int,
+) -> None:
+    """Test daily statistics skip days without statistics and follow DST.
+
+    With a low bind variable limit the days are reduced one per query.
+    """
+    await hass.config.async_set_time_zone("Europe/Vienna")
+    await async_wait_recording_done(hass)
+    zero = dt_util.utcnow()
+
+    def _local(date: str) -> datetime:
+        return dt_util.as_utc(dt_util.parse_datetime(date))
+
+    temperature_metadata = {
+        "has_mean": True,
+        "has_sum": False,
+        "name": "Temperature",
+        "source": "test",
+        "statistic_id": "test:temperature",
+        "unit_of_measurement": "°C",
+    }
+    async_add_external_statistics(
+        hass,
+        temperature_metadata,
+        (
+            {"start": _local("2022-10-29 10:00:00"), "mean": 1, "min": 0, "max": 2},
+            {"start": _local("2022-10-29 23:00:00"), "mean": 3, "min": 2, "max": 5},
+            {"start": _local("2022-10-31 00:00:00"), "mean": 10, "min": 9, "max": 11},
+            {"start": _local("2022-10-31 05:00:00"), "mean": 20, "min": 8, "max": 21},
+        ),
+    )
+    humidity_metadata = {
+        **temperature_metadata,
+        "name": "Humidity",
+        "statistic_id": "test:humidity",
+        "unit_of_measurement": "%",
+    }
+    async_add_external_statistics(
+        hass,
+        humidity_metadata,
+        ({"start": _local("2022-10-30 12:00:00"), "mean": 50, "min": 40, "max": 60},),
+    )
+    await async_wait_recording_done(hass)
+
+    with patch.object(recorder.get_instance(hass), "max_bind_vars", max_bind_vars):
+        stats = statistics_during_period(
+            hass, zero, period="day", types={"max", "mean", "min"}
+        )
+    assert stats == {
+        "test:temperature": [
+            {
+                "start": _local("2022-10-29 00:00:00").timestamp(),
+                "end": _local("2022-10-30 00:00:00").timestamp(),
+                "mean": 2.0,
+                "min": 0.0,
+                "max": 5.0,
+            },
+            {
+                "start": _local("2022-10-31 00:00:00").timestamp(),
+                "end": _local("2022-11-01 00:00:00").timestamp(),
+                "mean": 15.0,
+                "min": 8.0,
+                "max": 21.0,
+            },
+        ],
+        "test:humidity": [
+            {
+                # The day the clocks are set back is 25 hours long
+                "start": _local("2022-10-30 00:00:00").timestamp(),
+                "end": _local("2022-10-30 00:00:00").timestamp() + 25 * 3600,
+                "mean": 50.0,
+                "min": 40.0,
+                "max": 60.0,
+            },
+        ],
+    }
+
+
 @pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
 @pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
 async def test_weekly_statistics_mean(
@@ -0,0 +1,31 @@
+"""Test the recorder statistics result cache."""
+
+from homeassistant.components.recorder.statistics_cache import StatisticsResultCache
+
+
+def test_invalidate_from_start() -> None:
+    """Test only the results covering the compiled period are dropped."""
+    cache = StatisticsResultCache()
+    cache.set("closed", cache.generation, 1000.0, b"closed")
+    cache.set("overlapping", cache.generation, 2000.0, b"overlapping")
+    cache.set("open", cache.generation, None, b"open")
+
+    cache.invalidate(1500.0)
+    assert cache.get("closed") == b"closed"
+    assert cache.get("overlapping") is None
+    assert cache.get("open") is None
+
+    cache.invalidate()
+    assert cache.get("closed") is None
+
+
+def test_result_fetched_during_invalidation_is_not_cached() -> None:
+    """Test a result fetched before an invalidation is not cached."""
+    cache = StatisticsResultCache()
+    generation = cache.generation
+    cache.invalidate(1500.0)
+    cache.set("closed", generation, 1000.0, b"closed")
+    assert cache.get("closed") is None
+
+    cache.set("closed", cache.generation, 1000.0, b"closed")
+    assert cache.get("closed") == b"closed"
@@ -1239,3 +1239,39 @@ def test_retryable_database_job_method(
         assert test.job(instance) == retval
 
     assert len(mock_job.mock_calls) == 1
+
+
+@pytest.mark.parametrize(
+    ("dialect_name", "expected_statements"),
+    [
+        ("sqlite", ["PRAGMA cache_size = -16384", "PRAGMA query_only = ON"]),
+        (
+            "mysql",
+            [
+                "SET session wait_timeout=28800",
+                "SET time_zone = '+00:00'",
+                "SET SESSION TRANSACTION READ ONLY",
+            ],
+        ),
+        (
+            "postgresql",
+            ["SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY"],
+        ),
+    ],
+)
+def test_setup_read_only_connection_for_dialect(
+    dialect_name: str, expected_statements: list[str]
+) -> None:
+    """Test setting up a read only connection."""
+    execute_args = []
+
+    def execute_mock(statement):
+        execute_args.append(statement)
+
+    dbapi_connection = MagicMock(
+        cursor=lambda: MagicMock(execute=execute_mock, close=MagicMock())
+    )
+
+    util.setup_read_only_connection_for_dialect(dialect_name, dbapi_connection)
+
+    assert execute_args == expected_statements
@@ -231,6 +231,65 @@ async def test_statistics_during_period(
     }
 
 
+async def test_statistics_during_period_cache(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test statistics_during_period results are cached until new statistics."""
+    now = get_start_time(dt_util.utcnow())
+
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set(
+        "sensor.test",
+        10,
+        attributes=POWER_SENSOR_KW_ATTRIBUTES,
+        timestamp=now.timestamp(),
+    )
+    await async_wait_recording_done(hass)
+
+    do_adhoc_statistics(hass, start=now)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+
+    async def get_statistics(start_time: datetime.datetime) -> list[dict]:
+        await client.send_json_auto_id(
+            {
+                "type": "recorder/statistics_during_period",
+                "start_time": start_time.isoformat(),
+                "statistic_ids": ["sensor.test"],
+                "period": "5minute",
+                "types": ["mean"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        return response["result"]["sensor.test"]
+
+    with patch(
+        "homeassistant.components.recorder.websocket_api.statistics_during_period",
+        wraps=statistics_during_period,
+    ) as statistics_during_period_mock:
+        assert len(await get_statistics(now)) == 1
+        # Requests made a bit earlier return the same statistics
+        assert len(await get_statistics(now - timedelta(seconds=10))) == 1
+        assert statistics_during_period_mock.call_count == 1
+
+        hass.states.async_set(
+            "sensor.test",
+            20,
+            attributes=POWER_SENSOR_KW_ATTRIBUTES,
+            timestamp=(now + timedelta(minutes=5)).timestamp(),
+        )
+        await async_wait_recording_done(hass)
+        do_adhoc_statistics(hass, start=now + timedelta(minutes=5))
+        await async_wait_recording_done(hass)
+
+        assert len(await get_statistics(now)) == 2
+        assert statistics_during_period_mock.call_count == 2
+
+
 @pytest.mark.freeze_time(datetime.datetime(2022, 10, 21, 7, 25, tzinfo=datetime.UTC))
 @pytest.mark.parametrize("offset", [0, 1, 2])
 async def test_statistic_during_period(
@@ -2537,8 +2596,15 @@ async def test_recorder_info(
         "max_backlog": 65000,
         "migration_in_progress": False,
         "migration_is_live": False,
+        "migration_progress": None,
+        "purge_progress": None,
         "recording": True,
         "thread_running": True,
+        "commit_interval": 0,
+        "commit_latency": ANY,
+        "commit_latency_max": ANY,
+        "commits": ANY,
+        "rows_per_commit": ANY,
     }
 
 
@@ -2615,6 +2681,7 @@ async def test_recorder_info_migration_queue_exhausted(
         patch.object(
             recorder.core, "MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG", sys.maxsize
         ),
+        patch.object(recorder.core, "MAX_SPILLED_BACKLOG", 0),
     ):
         async with async_test_recorder(
             hass, wait_recorder=False, wait_recorder_setup=False
@@ -41,6 +41,7 @@ from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
+from homeassistant.util.executor import ProcessJobPool
 from homeassistant.util.unit_system import METRIC_SYSTEM, US_CUSTOMARY_SYSTEM
 
 from .common import MockSensor
@@ -313,6 +314,58 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_hourly_statistics_process_pool(hass: HomeAssistant) -> None:
+    """Test time weighted averages of many states are calculated in the process pool."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    with freeze_time(zero) as freezer:
+        four, _ = await async_record_states(
+            hass, freezer, zero, "sensor.test1", POWER_SENSOR_ATTRIBUTES
+        )
+    await async_wait_recording_done(hass)
+
+    with (
+        patch("homeassistant.components.sensor.recorder.PROCESS_POOL_MIN_STATES", 0),
+        patch.object(
+            ProcessJobPool, "run", autospec=True, side_effect=ProcessJobPool.run
+        ) as mock_run,
+    ):
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+    assert mock_run.call_count == 1
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats["sensor.test1"][0]["mean"] == pytest.approx(13.050847)
+
+
+async def test_compile_hourly_statistics_from_states_buffer(
+    hass: HomeAssistant,
+) -> None:
+    """Test the statistics are compiled from the states buffer of the recorder."""
+    # The states buffer holds the states changed since the recorder started
+    zero = get_start_time(dt_util.utcnow() + timedelta(minutes=5))
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    with freeze_time(zero) as freezer:
+        four, _ = await async_record_states(
+            hass, freezer, zero, "sensor.test1", POWER_SENSOR_ATTRIBUTES
+        )
+    await async_wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.components.sensor.recorder.history.get_full_significant_states_with_session"
+    ) as mock_history:
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+    assert mock_history.call_count == 0
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats["sensor.test1"][0]["mean"] == pytest.approx(13.050847)
+    assert stats["sensor.test1"][0]["min"] == -10
+    assert stats["sensor.test1"][0]["max"] == 30
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
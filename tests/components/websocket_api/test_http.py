@@ -10,6 +10,7 @@ import pytest
 
 from homeassistant.components.websocket_api import (
     async_register_command,
+    async_response,
     const,
     http,
     websocket_command,
@@ -185,6 +186,40 @@ async def test_delayed_response_handler(
     assert "on closed connection" in caplog.text
 
 
+async def test_wait_drained(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test waiting until the queued messages are written."""
+    drained_futures: list[asyncio.Future[None]] = []
+
+    @websocket_command({"type": "drained_responder"})
+    @async_response
+    async def async_drained_responder(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        msg_id: int = msg["id"]
+        for number in range(3):
+            connection.send_event(msg_id, {"number": number})
+        drained = connection.async_wait_drained()
+        drained_futures.append(drained)
+        assert not drained.done()
+        await drained
+        connection.send_result(msg_id)
+
+    async_register_command(hass, async_drained_responder)
+
+    await websocket_client.send_json({"id": 5, "type": "drained_responder"})
+    for number in range(3):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 5
+        assert msg["event"] == {"number": number}
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == "result"
+    assert len(drained_futures) == 1
+    assert drained_futures[0].done()
+
+
 async def test_ensure_disconnect_invalid_json(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -7,6 +7,7 @@ from datetime import timedelta
 from enum import IntFlag
 import logging
 import threading
+import time
 from typing import Any
 from unittest.mock import MagicMock, PropertyMock, patch
 
@@ -37,6 +38,7 @@ from homeassistant.helpers import device_registry as dr, entity, entity_registry
 from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
+from homeassistant.util import dt as dt_util
 
 from tests.common import (
     MockConfigEntry,
@@ -44,6 +46,7 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_fire_time_changed,
     mock_integration,
     mock_registry,
 )
@@ -2210,6 +2213,190 @@ async def test_update_capabilities(
     assert entry.supported_features == 0
 
 
+async def test_coalesced_state_writes(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test state writes are coalesced within the minimum write interval."""
+    platform = MockEntityPlatform(hass)
+
+    ent = MockEntity(unique_id="qwer", extra_state_attributes={"a": 1})
+    await platform.async_add_entities([ent])
+    entity_registry.async_update_entity_options(
+        ent.entity_id, "homeassistant", {entity.MIN_WRITE_INTERVAL: 60}
+    )
+    await hass.async_block_till_done()
+
+    # Attribute changes within the window are coalesced
+    ent._values["extra_state_attributes"] = {"a": 2}
+    ent.async_write_ha_state()
+    ent._values["extra_state_attributes"] = {"a": 3}
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes["a"] == 1
+
+    # The latest state is written at the end of the window
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=60))
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id).attributes["a"] == 3
+
+    # A significant change is written immediately
+    ent._values["extra_state_attributes"] = {"a": 4}
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes["a"] == 3
+    ent._attr_state = "off"
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.state == "off"
+    assert state.attributes["a"] == 4
+
+    # The pending write was cancelled by the significant write
+    last_updated = state.last_updated
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=120))
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id).last_updated == last_updated
+
+    # Removing the option writes every state again
+    entity_registry.async_update_entity_options(ent.entity_id, "homeassistant", None)
+    await hass.async_block_till_done()
+    ent._values["extra_state_attributes"] = {"a": 5}
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes["a"] == 5
+
+
+async def test_coalesced_state_write_after_remove(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test a pending coalesced state write is cancelled on remove."""
+    platform = MockEntityPlatform(hass)
+
+    ent = MockEntity(unique_id="qwer", extra_state_attributes={"a": 1})
+    await platform.async_add_entities([ent])
+    entity_registry.async_update_entity_options(
+        ent.entity_id, "homeassistant", {entity.MIN_WRITE_INTERVAL: 60}
+    )
+    await hass.async_block_till_done()
+
+    ent.async_write_ha_state()
+    ent._values["extra_state_attributes"] = {"a": 2}
+    ent.async_write_ha_state()
+    assert ent._coalesced_write is not None
+
+    await ent.async_remove(force_remove=True)
+    assert ent._coalesced_write is None
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=60))
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id) is None
+
+
+async def test_coalesced_state_write_context(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test a coalesced state write keeps the context of the deferred write."""
+    platform = MockEntityPlatform(hass)
+
+    ent = MockEntity(unique_id="qwer", extra_state_attributes={"a": 1})
+    await platform.async_add_entities([ent])
+    entity_registry.async_update_entity_options(
+        ent.entity_id, "homeassistant", {entity.MIN_WRITE_INTERVAL: 60}
+    )
+    await hass.async_block_till_done()
+    ent.async_write_ha_state()
+
+    context = Context()
+    ent.async_set_context(context)
+    ent._values["extra_state_attributes"] = {"a": 2}
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes["a"] == 1
+
+    # The context has expired when the coalesced write is done
+    with patch(
+        "homeassistant.helpers.entity.timer",
+        return_value=time.time() + entity.CONTEXT_RECENT_TIME_SECONDS + 1,
+    ):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=60))
+        await hass.async_block_till_done()
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes["a"] == 2
+    assert state.context is context
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(30, 30.0), ("2.5", 2.5), (0, None), (-1, None), ("abc", None), ([1], None)],
+)
+async def test_min_write_interval_option(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    value: Any,
+    expected: float | None,
+) -> None:
+    """Test the minimum write interval option is coerced to a positive float."""
+    platform = MockEntityPlatform(hass)
+
+    ent = MockEntity(unique_id="qwer")
+    await platform.async_add_entities([ent])
+    entity_registry.async_update_entity_options(
+        ent.entity_id, "homeassistant", {entity.MIN_WRITE_INTERVAL: value}
+    )
+    await hass.async_block_till_done()
+    assert ent._min_write_interval == expected
+
+
+async def test_static_attributes_cache(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test static state attributes are cached until invalidated."""
+
+    class CachedEntity(entity.Entity):
+        _attr_icon = "mdi:one"
+        _attr_name = "Cached"
+        _attr_unique_id = "cached"
+
+    platform = MockEntityPlatform(hass)
+    ent = CachedEntity()
+    await platform.async_add_entities([ent])
+
+    assert ent._static_attributes is not None
+    static_attributes = ent._static_attributes
+    ent._attr_state = "on"
+    ent.async_write_ha_state()
+    assert ent._static_attributes is static_attributes
+    state = hass.states.get(ent.entity_id)
+    assert state.state == "on"
+    assert state.attributes == {"friendly_name": "Cached", "icon": "mdi:one"}
+
+    # Setting an _attr_ the static attributes are calculated from invalidates them
+    ent._attr_icon = "mdi:two"
+    assert ent._static_attributes is None
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes["icon"] == "mdi:two"
+
+    # Updating the registry entry invalidates them
+    entity_registry.async_update_entity(ent.entity_id, name="Renamed")
+    await hass.async_block_till_done()
+    assert hass.states.get(ent.entity_id).attributes["friendly_name"] == "Renamed"
+
+    ent._async_invalidate_static_attributes()
+    assert ent._static_attributes is None
+
+
+async def test_static_attributes_not_cached_for_properties(
+    hass: HomeAssistant,
+) -> None:
+    """Test static state attributes are not cached when using plain properties."""
+    platform = MockEntityPlatform(hass)
+    ent = MockEntity(unique_id="qwer", icon="mdi:one")
+    await platform.async_add_entities([ent])
+
+    assert ent._static_attributes is None
+    ent._values["icon"] = "mdi:two"
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes["icon"] == "mdi:two"
+
+
 async def test_update_capabilities_no_unique_id(
     hass: HomeAssistant,
     entity_registry: er.EntityRegistry,
@@ -90,6 +90,35 @@ async def test_significant_change_extra(
     assert checker.async_is_significant_change(State(ent_id, "200", attrs), extra_arg=2)
 
 
+async def test_async_is_significant_change(
+    hass: HomeAssistant,
+    checker: significant_change.SignificantlyChangedChecker,
+) -> None:
+    """Test checking a single state change."""
+    old_state = State("test_domain.test_entity", "100", {})
+
+    assert not significant_change.async_is_significant_change(
+        hass, old_state, "100", {}
+    )
+    assert not significant_change.async_is_significant_change(hass, old_state, "96", {})
+    assert significant_change.async_is_significant_change(hass, old_state, "95", {})
+    assert significant_change.async_is_significant_change(
+        hass, old_state, STATE_UNKNOWN, {}
+    )
+    assert significant_change.async_is_significant_change(
+        hass, State("test_domain.test_entity", STATE_UNAVAILABLE, {}), "100", {}
+    )
+
+    # Without a platform only a change of the state is significant
+    other_state = State("other_domain.test_entity", "on", {"attr": 1})
+    assert not significant_change.async_is_significant_change(
+        hass, other_state, "on", {"attr": 2}
+    )
+    assert significant_change.async_is_significant_change(
+        hass, other_state, "off", {"attr": 1}
+    )
+
+
 async def test_check_valid_float() -> None:
     """Test extra significant checker works."""
     assert significant_change.check_valid_float("1")
@@ -64,6 +64,7 @@ from homeassistant.helpers.json import json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.executor import ProcessJobPool
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -984,6 +985,10 @@ def test_state_as_dict() -> None:
     # 2nd time to verify cache
     assert state.as_dict() == expected
     assert state.as_dict() is as_dict_1
+    # Only a single copy is kept in the cache
+    assert state._as_dict is as_dict_1
+    assert as_dict_1["context"] is state.context.as_dict()
+    assert state.context._as_dict is as_dict_1["context"]
 
 
 def test_state_as_dict_json() -> None:
@@ -1335,6 +1340,65 @@ async def test_eventbus_coroutine_event_listener(hass: HomeAssistant) -> None:
     assert len(coroutine_calls) == 1
 
 
+async def test_loop_monitor_records_callbacks(hass: HomeAssistant) -> None:
+    """Test the loop monitor records callbacks run by async_run_hass_job."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    hass.bus.async_listen("test_monitor", listener)
+    hass.bus.async_fire("test_monitor")
+    assert hass.loop_monitor is None
+
+    loop_monitor = hass.async_start_loop_monitor()
+    assert hass.async_start_loop_monitor() is loop_monitor
+    assert loop_monitor.running
+    hass.bus.async_fire("test_monitor")
+    assert "homeassistant" not in loop_monitor.integrations
+
+    assert hass.async_start_job_timing() is loop_monitor
+    assert loop_monitor.timing_jobs
+    hass.bus.async_fire("test_monitor")
+    assert loop_monitor.integrations["homeassistant"].callbacks.count == 1
+
+    hass.async_stop_job_timing()
+    assert not loop_monitor.timing_jobs
+    hass.bus.async_fire("test_monitor")
+    assert loop_monitor.integrations["homeassistant"].callbacks.count == 1
+
+    hass.async_start_job_timing()
+    hass.async_stop_loop_monitor()
+    assert hass.loop_monitor is None
+    assert not loop_monitor.running
+    assert not loop_monitor.timing_jobs
+    hass.bus.async_fire("test_monitor")
+    assert loop_monitor.integrations["homeassistant"].callbacks.count == 1
+    assert len(calls) == 5
+
+
+async def test_add_process_job(hass: HomeAssistant) -> None:
+    """Test adding jobs to the process pool."""
+    assert await hass.async_add_process_job(divmod, 7, 2) == (3, 1)
+    assert not hass.process_pool.started
+
+
+async def test_add_process_job_worker_process(hass: HomeAssistant) -> None:
+    """Test adding jobs to the process pool with a worker process."""
+    hass.process_pool = ProcessJobPool(1)
+
+    assert await hass.async_add_process_job(os.getpid) != os.getpid()
+    assert hass.process_pool.started
+    assert await hass.async_add_process_job(divmod, 7, 2) == (3, 1)
+    with pytest.raises(ZeroDivisionError):
+        await hass.async_add_process_job(divmod, 1, 0)
+
+    await hass.async_stop()
+    assert not hass.process_pool.started
+
+
 async def test_eventbus_max_length_exceeded(hass: HomeAssistant) -> None:
     """Test that an exception is raised when the max character length is exceeded."""
 
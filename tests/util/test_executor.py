@@ -1,13 +1,14 @@
 """Test Home Assistant executor util."""
 
 import concurrent.futures
+import os
 import time
 from unittest.mock import patch
 
 import pytest
 
 from homeassistant.util import executor
-from homeassistant.util.executor import InterruptibleThreadPoolExecutor
+from homeassistant.util.executor import InterruptibleThreadPoolExecutor, ProcessJobPool
 
 
 async def test_executor_shutdown_can_interrupt_threads(
@@ -92,3 +93,41 @@ async def test_overall_timeout_reached(caplog: pytest.LogCaptureFixture) -> None
     assert finish - start < 3.0
 
     iexecutor.shutdown()
+
+
+def test_process_job_pool() -> None:
+    """Test jobs are run in warmed up worker processes."""
+    pool = ProcessJobPool(1)
+    assert not pool.started
+
+    assert pool.run(os.getpid) != os.getpid()
+    assert pool.started
+    assert pool.run(divmod, 7, 2) == (3, 1)
+    with pytest.raises(ZeroDivisionError):
+        pool.run(divmod, 1, 0)
+
+    pool.shutdown()
+    assert not pool.started
+
+
+def test_process_job_pool_without_workers() -> None:
+    """Test jobs are run in the calling thread without workers."""
+    pool = ProcessJobPool(0)
+
+    assert pool.run(os.getpid) == os.getpid()
+    assert not pool.started
+    pool.shutdown()
+
+
+async def test_process_job_pool_async_run() -> None:
+    """Test running jobs in the worker processes from the event loop."""
+    pool = ProcessJobPool(1)
+
+    assert await pool.async_run(os.getpid) != os.getpid()
+    assert pool.started
+    with pytest.raises(ZeroDivisionError):
+        await pool.async_run(divmod, 1, 0)
+
+    pool.shutdown()
+    assert not pool.started
+    assert await ProcessJobPool(0).async_run(os.getpid) == os.getpid()
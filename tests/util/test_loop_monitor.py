@@ -0,0 +1,159 @@
+"""Test the event loop monitor."""
+
+import asyncio
+from functools import partial
+
+import pytest
+
+from homeassistant.util import loop_monitor
+from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.loop_monitor import LoopMonitor
+
+
+def test_integration_from_module() -> None:
+    """Test attributing modules to integrations."""
+    assert loop_monitor.integration_from_module(None) == "homeassistant"
+    assert loop_monitor.integration_from_module("homeassistant.core") == "homeassistant"
+    assert (
+        loop_monitor.integration_from_module("homeassistant.components.hue.light")
+        == "hue"
+    )
+    assert loop_monitor.integration_from_module("homeassistant.components") == (
+        "homeassistant"
+    )
+    assert loop_monitor.integration_from_module("custom_components.foo") == "foo"
+    assert loop_monitor.integration_from_module("some_library.sub") == "homeassistant"
+
+
+def test_integration_from_target() -> None:
+    """Test attributing callables to integrations."""
+
+    def target() -> None:
+        """Mock target."""
+
+    target.__module__ = "homeassistant.components.zha.sensor"
+    assert loop_monitor.integration_from_target(target) == "zha"
+    assert loop_monitor.integration_from_target(partial(partial(target))) == "zha"
+
+
+async def test_record_job() -> None:
+    """Test recording job execution times."""
+    monitor = LoopMonitor(asyncio.get_running_loop(), slow_callback_duration=0.1)
+
+    def target() -> None:
+        """Mock target."""
+
+    target.__module__ = "homeassistant.components.mqtt.sensor"
+    monitor.async_record_job(target, 0.01)
+    monitor.async_record_job(target, 0.2)
+    monitor.async_record_job(print, 0.05)
+
+    data = monitor.as_dict()
+    assert data["slow_callbacks"] == 1
+    assert data["integrations"]["mqtt"]["callbacks"] == {
+        "count": 2,
+        "total": pytest.approx(0.21),
+        "max": 0.2,
+        "slow": 1,
+    }
+    assert data["integrations"]["homeassistant"]["callbacks"]["count"] == 1
+    assert data["integrations"]["mqtt"]["loop_time"] == pytest.approx(0.21)
+
+
+async def test_lag_sampling() -> None:
+    """Test sampling the event loop lag."""
+    loop = asyncio.get_running_loop()
+    monitor = LoopMonitor(loop, interval=0.01)
+    assert not monitor.running
+    monitor.async_start()
+    assert monitor.running
+    while monitor.lag_samples < 3:
+        await asyncio.sleep(0.01)
+    monitor.async_stop()
+    assert not monitor.running
+
+    data = monitor.as_dict()
+    assert data["lag"]["samples"] == sum(data["lag"]["histogram"])
+    assert len(data["lag"]["histogram"]) == len(data["lag"]["buckets"])
+    assert data["lag"]["max"] >= data["lag"]["recent"] >= 0
+
+
+async def test_wrap_coroutine() -> None:
+    """Test recording the time spent in task steps."""
+    monitor = LoopMonitor(asyncio.get_running_loop())
+
+    async def job() -> int:
+        await asyncio.sleep(0)
+        return 1
+
+    coro = job()
+    assert await asyncio.ensure_future(monitor.async_wrap_coroutine(coro)) == 1
+    # The coroutine was run in two steps
+    assert monitor.integrations["homeassistant"].tasks.count == 2
+
+
+async def test_wrap_coroutine_exception() -> None:
+    """Test exceptions are propagated through wrapped coroutines."""
+    monitor = LoopMonitor(asyncio.get_running_loop())
+
+    async def job() -> None:
+        await asyncio.sleep(0)
+        raise ValueError
+
+    task = asyncio.ensure_future(monitor.async_wrap_coroutine(job()))
+    with pytest.raises(ValueError):
+        await task
+    assert monitor.integrations["homeassistant"].tasks.count == 2
+
+    task = asyncio.ensure_future(monitor.async_wrap_coroutine(job()))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert monitor.integrations["homeassistant"].tasks.count == 4
+
+
+async def test_wrap_executor_job() -> None:
+    """Test recording the time spent in executor jobs."""
+    loop = asyncio.get_running_loop()
+    monitor = LoopMonitor(loop)
+
+    def job(value: int) -> int:
+        return value * 2
+
+    job.__module__ = "homeassistant.components.camera.img_util"
+    assert (
+        await loop.run_in_executor(None, monitor.async_wrap_executor_job(job), 2) == 4
+    )
+    # Executor jobs are recorded in the executor thread
+    assert monitor.executor_jobs["camera"].count == 1
+    assert "camera" not in monitor.integrations
+    assert monitor.async_top_integrations(1) == []
+    assert monitor.as_dict()["integrations"]["camera"]["executor"]["count"] == 1
+    assert monitor.as_dict()["integrations"]["camera"]["loop_time"] == 0
+
+
+async def test_job_timing_task_factory() -> None:
+    """Test job timing times tasks created in the event loop."""
+    loop = asyncio.get_running_loop()
+    monitor = LoopMonitor(loop)
+
+    async def job() -> int:
+        await asyncio.sleep(0)
+        return 1
+
+    assert await loop.create_task(job()) == 1
+    assert "homeassistant" not in monitor.integrations
+
+    monitor.async_start_job_timing()
+    assert monitor.timing_jobs
+    assert loop.get_task_factory() is not None
+    assert await loop.create_task(job()) == 1
+    assert await create_eager_task(job()) == 1
+    assert monitor.integrations["homeassistant"].tasks.count == 4
+
+    monitor.async_stop_job_timing()
+    assert not monitor.timing_jobs
+    assert loop.get_task_factory() is None
+    assert await create_eager_task(job()) == 1
+    assert monitor.integrations["homeassistant"].tasks.count == 4